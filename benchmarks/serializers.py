@@ -0,0 +1,218 @@
+"""
+Benchmark the request and response payloads of a 10,000-part upload.
+
+This compares DRF's nested serializers, as previously used for part lists, against the direct
+conversion used by the upload views, and the standard library's JSON decoder against orjson (if
+it's installed). It also compares completing with "parts" against "part_etags", and building the
+completion body by concatenation against joining. No object store is contacted.
+
+Run with:
+    python benchmarks/serializers.py
+"""
+
+from __future__ import annotations
+
+import argparse
+from io import BytesIO
+import json
+import pathlib
+import sys
+import time
+from typing import Any, Callable
+
+import django
+from django.conf import settings
+
+# Allow running from a source checkout
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+settings.configure(
+    SECRET_KEY="benchmark-secret-key",
+    INSTALLED_APPS=["s3_file_field"],
+    STORAGES={
+        "default": {
+            "BACKEND": "storages.backends.s3.S3Storage",
+            "OPTIONS": {
+                "access_key": "benchmarkAccessKey",
+                "secret_key": "benchmarkSecretKey",
+                "region_name": "us-east-1",
+                "bucket_name": "benchmark-bucket",
+            },
+        },
+    },
+)
+django.setup()
+
+from django.core import signing  # noqa: E402
+from rest_framework.parsers import JSONParser as StdlibJSONParser  # noqa: E402
+
+from s3_file_field import _json, _registry  # noqa: E402
+from s3_file_field._multipart import (  # noqa: E402
+    MultipartManager,
+    PresignedPartTransfer,
+    TransferredPart,
+    TransferredParts,
+)
+from s3_file_field._sizes import mb  # noqa: E402
+from s3_file_field.fields import S3FileField  # noqa: E402
+from s3_file_field.views import (  # noqa: E402
+    PartInitializationResponseSerializer,
+    TransferredPartRequestSerializer,
+    UploadCompletionRequestSerializer,
+    UploadResumptionResponseSerializer,
+)
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def completion_request(part_count: int) -> dict:
+    return {
+        "upload_signature": signing.dumps(
+            {
+                "field_id": "benchmark.Resource.blob",
+                "object_key": "benchmark-key",
+                "file_size": part_count * mb(5),
+                "part_size": mb(5),
+            }
+        ),
+        "upload_id": "upload-id",
+        "parts": [
+            {"part_number": part_number, "size": mb(5), "etag": f'"{part_number:032x}"'}
+            for part_number in range(1, part_count + 1)
+        ],
+    }
+
+
+def compact_completion_request(data: dict) -> dict:
+    return {
+        "upload_signature": data["upload_signature"],
+        "upload_id": data["upload_id"],
+        "part_etags": [part["etag"] for part in data["parts"]],
+    }
+
+
+def concatenated_body(transferred_parts: TransferredParts) -> str:
+    body = '<?xml version="1.0" encoding="UTF-8"?>'
+    body += '<CompleteMultipartUpload xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+    for part in transferred_parts.parts:
+        body += "<Part>"
+        body += f"<PartNumber>{part.part_number}</PartNumber>"
+        body += f"<ETag>{part.etag}</ETag>"
+        body += "</Part>"
+    body += "</CompleteMultipartUpload>"
+    return body
+
+
+def nested_completion(data: dict) -> list[TransferredPart]:
+    serializer = TransferredPartRequestSerializer(data=data["parts"], many=True, allow_empty=False)
+    serializer.is_valid(raise_exception=True)
+    return [
+        TransferredPart(**part)
+        for part in sorted(serializer.validated_data, key=lambda part: part["part_number"])
+    ]
+
+
+def direct_completion(data: dict) -> list[TransferredPart]:
+    serializer = UploadCompletionRequestSerializer(data=data)
+    serializer.is_valid(raise_exception=True)
+    return serializer.save().parts
+
+
+def presigned_parts(part_count: int) -> list[PresignedPartTransfer]:
+    return [
+        PresignedPartTransfer(
+            part_number=part_number,
+            size=5 * 1024 * 1024,
+            upload_url=(
+                "https://benchmark-bucket.s3.amazonaws.com/benchmark-key?uploadId=upload-id"
+                f"&partNumber={part_number}&X-Amz-Algorithm=AWS4-HMAC-SHA256"
+                "&X-Amz-Credential=benchmarkAccessKey%2F20240101%2Fus-east-1%2Fs3%2Faws4_request"
+                "&X-Amz-Date=20240101T000000Z&X-Amz-Expires=86400"
+                f"&X-Amz-SignedHeaders=content-length%3Bhost&X-Amz-Signature={part_number:064x}"
+            ),
+        )
+        for part_number in range(1, part_count + 1)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--parts", type=int, default=10_000, help="(default: 10,000)")
+    parser.add_argument("--repeat", type=int, default=5, help="(default: 5)")
+    args = parser.parse_args()
+
+    # Completing by "part_etags" needs the field, to plan the upload's parts
+    field = S3FileField()
+    field.set_attributes_from_name("blob")
+    _registry._fields["benchmark.Resource.blob"] = field
+
+    data = completion_request(args.parts)
+    body = json.dumps(data).encode()
+    compact_data = compact_completion_request(data)
+    compact_body = json.dumps(compact_data).encode()
+    parts = presigned_parts(args.parts)
+    transferred_parts = TransferredParts(
+        object_key="benchmark-key",
+        upload_id="upload-id",
+        parts=direct_completion(data),
+    )
+    multipart_manager = MultipartManager.from_storage(field.storage)
+
+    cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "parse completion",
+            lambda: StdlibJSONParser().parse(BytesIO(body)),
+            lambda: _json.JSONParser().parse(BytesIO(body)),
+        ),
+        (
+            "validate completion",
+            lambda: nested_completion(data),
+            lambda: direct_completion(data),
+        ),
+        (
+            "parse part_etags",
+            lambda: _json.JSONParser().parse(BytesIO(body)),
+            lambda: _json.JSONParser().parse(BytesIO(compact_body)),
+        ),
+        (
+            "validate part_etags",
+            lambda: direct_completion(data),
+            lambda: direct_completion(compact_data),
+        ),
+        (
+            "completion body",
+            lambda: concatenated_body(transferred_parts),
+            lambda: multipart_manager._generate_presigned_complete_body(transferred_parts),
+        ),
+        (
+            "emit parts",
+            lambda: PartInitializationResponseSerializer(parts, many=True).data,
+            lambda: UploadResumptionResponseSerializer(
+                {"transferred_parts": [], "parts": parts}
+            ).data,
+        ),
+    ]
+    print(f"{args.parts} parts, orjson {'installed' if _json.orjson else 'not installed'}")
+    print(
+        f"completion request: {len(body):,} bytes with parts, {len(compact_body):,} with part_etags"
+    )
+    for name, baseline, fast in cases:
+        baseline_seconds = best_of(args.repeat, baseline)
+        fast_seconds = best_of(args.repeat, fast)
+        print(
+            f"{name:>20}: "
+            f"before {baseline_seconds * 1000:>7.1f} ms, "
+            f"after {fast_seconds * 1000:>7.1f} ms "
+            f"({baseline_seconds / fast_seconds:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
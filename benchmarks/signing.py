@@ -0,0 +1,105 @@
+"""
+Benchmark signing and verifying upload_signature and field_value tokens.
+
+This compares "django.core.signing", as previously used for tokens, against the cached signer and
+compact encoding used by S3FF.
+
+Run with:
+    python benchmarks/signing.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from typing import Any, Callable
+
+import django
+from django.conf import settings
+
+# Allow running from a source checkout
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+settings.configure(
+    SECRET_KEY="benchmark-secret-key",
+    SECRET_KEY_FALLBACKS=["benchmark-old-secret-key"],
+)
+django.setup()
+
+from django.core import signing  # noqa: E402
+
+from s3_file_field import _signing  # noqa: E402
+
+UPLOAD_SIGNATURE = {
+    "field_id": "benchmark_app.Resource.blob",
+    "object_key": "2c2d7a8e-54fa-4a62-a4a3-9f1e0d54b1c3/benchmark-file.txt",
+    "file_size": 1_000_000_000,
+    "part_size": 67_108_864,
+    "content_type": "text/plain",
+}
+FIELD_VALUE = {
+    "object_key": UPLOAD_SIGNATURE["object_key"],
+    "file_size": UPLOAD_SIGNATURE["file_size"],
+    "etag": "d41d8cd98f00b204e9800998ecf8427e-15",
+    "content_type": UPLOAD_SIGNATURE["content_type"],
+}
+
+
+def tokens_per_second(count: int, func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=50_000, help="(default: 50,000)")
+    args = parser.parse_args()
+
+    django_upload_signature = signing.dumps(UPLOAD_SIGNATURE)
+    s3ff_upload_signature = _signing.dumps_upload_signature(**UPLOAD_SIGNATURE)
+    django_field_value = signing.dumps(FIELD_VALUE)
+    s3ff_field_value = _signing.dumps_field_value(**FIELD_VALUE)
+    print(
+        f"upload_signature: {len(django_upload_signature)} bytes before, "
+        f"{len(s3ff_upload_signature)} after"
+    )
+
+    cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "dump upload_signature",
+            lambda: signing.dumps(UPLOAD_SIGNATURE),
+            lambda: _signing.dumps_upload_signature(**UPLOAD_SIGNATURE),
+        ),
+        (
+            "load upload_signature",
+            lambda: signing.loads(django_upload_signature),
+            lambda: _signing.loads_upload_signature(s3ff_upload_signature),
+        ),
+        (
+            "dump field_value",
+            lambda: signing.dumps(FIELD_VALUE),
+            lambda: _signing.dumps_field_value(**FIELD_VALUE),
+        ),
+        (
+            "load field_value",
+            lambda: signing.loads(django_field_value),
+            lambda: _signing.loads_field_value(s3ff_field_value),
+        ),
+    ]
+    for name, baseline, fast in cases:
+        baseline_rate = tokens_per_second(args.count, baseline)
+        fast_rate = tokens_per_second(args.count, fast)
+        print(
+            f"{name:>22}: "
+            f"before {baseline_rate:>9,.0f} tokens/s, "
+            f"after {fast_rate:>9,.0f} tokens/s "
+            f"({fast_rate / baseline_rate:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
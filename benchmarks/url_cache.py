@@ -0,0 +1,80 @@
+"""
+Benchmark rendering the download URLs of a page of objects.
+
+This compares presigning every URL with S3Storage.url, as FieldFile.url does by default, against
+serving them from a LocalPresignedUrlCache and a DjangoPresignedUrlCache (backed by Django's
+in-memory cache), after the first page. No object store is contacted.
+
+Run with:
+    python benchmarks/url_cache.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+from typing import Any, Callable
+
+import django
+from django.conf import settings
+
+# Allow running from a source checkout
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+settings.configure(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            # The default of 300 entries can't hold a page of URLs
+            "OPTIONS": {"MAX_ENTRIES": 10_000},
+        }
+    },
+)
+django.setup()
+
+from storages.backends.s3 import S3Storage  # noqa: E402
+
+from s3_file_field import DjangoPresignedUrlCache, LocalPresignedUrlCache  # noqa: E402
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--objects", type=int, default=500, help="(default: 500)")
+    parser.add_argument("--repeat", type=int, default=5, help="(default: 5)")
+    args = parser.parse_args()
+
+    storage = S3Storage(
+        access_key="benchmarkAccessKey",
+        secret_key="benchmarkSecretKey",
+        region_name="us-east-1",
+        bucket_name="benchmark-bucket",
+        signature_version="s3v4",
+    )
+    names = [f"{i:08x}/benchmark-file.txt" for i in range(args.objects)]
+    baseline_seconds = best_of(args.repeat, lambda: [storage.url(name) for name in names])
+    print(f"{args.objects} objects, presigned: {baseline_seconds * 1000:>7.1f} ms")
+
+    for url_cache in [LocalPresignedUrlCache(), DjangoPresignedUrlCache()]:
+        cached_seconds = best_of(
+            args.repeat,
+            lambda url_cache=url_cache: [url_cache.url(storage, name) for name in names],
+        )
+        print(
+            f"{type(url_cache).__name__:>24}: {cached_seconds * 1000:>7.1f} ms "
+            f"({baseline_seconds / cached_seconds:.1f}x), {url_cache.stats()}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,8 @@
-import axios, { type AxiosInstance, type AxiosRequestConfig } from 'axios';
+import axios, {
+  type AxiosInstance,
+  type AxiosRequestConfig,
+  type AxiosResponse,
+} from 'axios';
 
 // Description of a part from initializeUpload()
 interface PartInfo {
@@ -6,22 +10,39 @@ interface PartInfo {
   size: number;
   upload_url: string;
 }
+// Compact description of consecutive parts, sent instead of PartInfo[] when requested
+interface PartTemplate {
+  // Contains "{part_number}" and "{signature}" placeholders
+  upload_url: string;
+  first_part_number: number;
+  signatures: string[];
+}
 // Description of the upload from initializeUpload()
-interface MultipartInfo {
+export interface MultipartInfo {
   upload_signature: string;
   object_key: string;
-  upload_id: string;
+  // This is null for a single-part upload, which needs no completion
+  upload_id: string | null;
   parts: PartInfo[];
+  part_size: number;
+  part_size_policy: string;
+}
+// Servers send exactly one of "parts" or "part_template"
+interface PartsResponse {
+  parts?: PartInfo[];
+  part_template?: PartTemplate;
 }
+type InitializationResponse = Omit<MultipartInfo, 'parts'> & PartsResponse;
 // Description of a part which has been uploaded by uploadPart()
 interface UploadedPart {
   part_number: number;
   size: number;
   etag: string;
 }
-interface CompletionResponse {
-  complete_url: string;
-  body: string;
+// Description of an interrupted upload from resumeParts()
+interface ResumptionResponse {
+  transferred_parts: UploadedPart[];
+  parts: PartInfo[];
 }
 interface FinalizationResponse {
   field_value: string;
@@ -42,14 +63,22 @@ export interface S3FileFieldProgress {
 
 export type S3FileFieldProgressCallback = (progress: S3FileFieldProgress) => void;
 
+export type S3FileFieldInitializeCallback = (multipartInfo: MultipartInfo) => void;
+
 export interface S3FileFieldClientOptions {
   readonly baseUrl: string;
   readonly apiConfig?: AxiosRequestConfig;
+  readonly proxyUploads?: boolean;
 }
 
 export default class S3FileFieldClient {
   protected readonly api: AxiosInstance;
 
+  protected readonly proxyUploads: boolean;
+
+  // The number of times a part is retried when the server is too busy to proxy it
+  protected readonly proxyRetries: number = 5;
+
   /**
    * Create an S3FileFieldClient instance.
    *
@@ -57,14 +86,24 @@ export default class S3FileFieldClient {
    * @param options.baseUrl - The absolute URL to the Django server.
    * @param [options.apiConfig] - An axios configuration to use for Django API requests.
    *                              Can be extracted from an existing axios instance via `.defaults`.
+   * @param [options.proxyUploads] - Whether to upload parts through the Django server, for
+   *                                 clients which can't reach the object store.
    */
-  constructor({ baseUrl, apiConfig = {} }: S3FileFieldClientOptions) {
+  constructor({ baseUrl, apiConfig = {}, proxyUploads = false }: S3FileFieldClientOptions) {
     this.api = axios.create({
       ...apiConfig,
       // Add a trailing slash
       // biome-ignore lint/performance/useTopLevelRegex: constructor is called infrequently
       baseURL: baseUrl.replace(/\/?$/, '/'),
     });
+    this.proxyUploads = proxyUploads;
+  }
+
+  /**
+   * The format of the part URLs to request from the server.
+   */
+  protected get partUrlFormat(): 'template' | 'proxy' {
+    return this.proxyUploads ? 'proxy' : 'template';
   }
 
   /**
@@ -74,90 +113,265 @@ export default class S3FileFieldClient {
    * @param fieldId - The Django field identifier.
    */
   protected async initializeUpload(file: File, fieldId: string): Promise<MultipartInfo> {
-    const response = await this.api.post<MultipartInfo>('upload-initialize/', {
+    const response = await this.api.post<InitializationResponse>('upload-initialize/', {
       field_id: fieldId,
       file_name: file.name,
       file_size: file.size,
       // An unknown type is ''
       content_type: file.type || 'application/octet-stream',
+      // A single part is uploaded directly to the object store, so is never proxied
+      single_part_upload: !this.proxyUploads,
+      part_url_format: this.partUrlFormat,
     });
-    return response.data;
+    const { part_template: _partTemplate, ...multipartInfo } = response.data;
+    return {
+      ...multipartInfo,
+      parts: this.expandParts(response.data, response.data.part_size, file.size),
+    };
+  }
+
+  /**
+   * Expands a compact part template into the description of each part.
+   *
+   * @param partsResponse - The parts, from /upload-initialize/ or /upload-parts/.
+   * @param partSize - The size of every part, except the last.
+   * @param fileSize - The size of the whole file.
+   */
+  protected expandParts(
+    partsResponse: PartsResponse,
+    partSize: number,
+    fileSize: number,
+  ): PartInfo[] {
+    // Servers which don't support the "template" format send the full part URLs instead
+    if (partsResponse.part_template === undefined) {
+      return partsResponse.parts ?? [];
+    }
+    const { upload_url: uploadUrl, first_part_number: firstPartNumber, signatures } =
+      partsResponse.part_template;
+    return signatures.map((signature, index) => {
+      const partNumber = firstPartNumber + index;
+      return {
+        part_number: partNumber,
+        // Only the last part may be smaller
+        size: Math.min(partSize, fileSize - (partNumber - 1) * partSize),
+        upload_url: uploadUrl
+          .replace('{part_number}', String(partNumber))
+          .replace('{signature}', signature),
+      };
+    });
+  }
+
+  /**
+   * Presigns additional parts of an upload.
+   *
+   * Only the first parts of an upload are presigned at initialization.
+   *
+   * @param file - The file being uploaded.
+   * @param multipartInfo - The information describing the multipart upload.
+   * @param firstPartNumber - The number of the first part to presign.
+   */
+  protected async presignParts(
+    file: File,
+    multipartInfo: MultipartInfo,
+    firstPartNumber: number,
+  ): Promise<PartInfo[]> {
+    const response = await this.api.post<PartsResponse>('upload-parts/', {
+      upload_signature: multipartInfo.upload_signature,
+      upload_id: multipartInfo.upload_id,
+      first_part_number: firstPartNumber,
+      part_url_format: this.partUrlFormat,
+    });
+    return this.expandParts(response.data, multipartInfo.part_size, file.size);
+  }
+
+  /**
+   * Sends a part to its upload URL, waiting and retrying while a proxying server is too busy.
+   *
+   * @param uploadUrl - The URL to upload the part to.
+   * @param chunk - The content of the part.
+   * @param config - An axios configuration for the request.
+   */
+  protected async putPart(
+    uploadUrl: string,
+    chunk: Blob,
+    config: AxiosRequestConfig,
+  ): Promise<AxiosResponse> {
+    for (let attempt = 1; ; attempt += 1) {
+      try {
+        return await axios.put(uploadUrl, chunk, config);
+      } catch (error) {
+        // A proxying server may be too busy to accept another part right now
+        const retryAfter =
+          axios.isAxiosError(error) && error.response?.status === 503
+            ? Number(error.response.headers['retry-after'])
+            : Number.NaN;
+        if (Number.isNaN(retryAfter) || attempt >= this.proxyRetries) {
+          throw error;
+        }
+        await new Promise((resolve) => setTimeout(resolve, retryAfter * 1000));
+      }
+    }
+  }
+
+  /**
+   * Uploads a single part of a file directly to an object store.
+   *
+   * @param file - The file to upload.
+   * @param part - The part to upload.
+   * @param fileOffset - The offset of the part within the file.
+   * @param uploadedSize - The size of the file which has already been uploaded.
+   * @param onProgress - A callback for upload progress.
+   */
+  protected async uploadPart(
+    file: File,
+    part: PartInfo,
+    fileOffset: number,
+    uploadedSize: number,
+    onProgress: S3FileFieldProgressCallback,
+  ): Promise<UploadedPart> {
+    const chunk = file.slice(fileOffset, fileOffset + part.size);
+    const response = await this.putPart(part.upload_url, chunk, {
+      onUploadProgress: (e) => {
+        onProgress({
+          uploaded: uploadedSize + e.loaded,
+          total: file.size,
+          state: S3FileFieldProgressState.Sending,
+        });
+      },
+    });
+    const { etag } = response.headers;
+    // ETag might be absent due to CORS misconfiguration, but dumb typings from Axios also make
+    // it structurally possible to be many other types
+    if (typeof etag !== 'string') {
+      throw new Error('ETag header missing from response.');
+    }
+    return {
+      part_number: part.part_number,
+      size: part.size,
+      etag,
+    };
   }
 
   /**
    * Uploads all the parts in a file directly to an object store in serial.
    *
    * @param file - The file to upload.
-   * @param parts - The list of parts describing how to break up the file.
+   * @param multipartInfo - The information describing the multipart upload.
    * @param onProgress - A callback for upload progress.
    */
   protected async uploadParts(
     file: File,
-    parts: PartInfo[],
+    multipartInfo: MultipartInfo,
     onProgress: S3FileFieldProgressCallback,
   ): Promise<UploadedPart[]> {
     const uploadedParts: UploadedPart[] = [];
     let fileOffset = 0;
-    for (const part of parts) {
-      const chunk = file.slice(fileOffset, fileOffset + part.size);
-      const response = await axios.put(part.upload_url, chunk, {
-        onUploadProgress: (e) => {
-          onProgress({
-            uploaded: fileOffset + e.loaded,
-            total: file.size,
-            state: S3FileFieldProgressState.Sending,
-          });
-        },
-      });
-      const { etag } = response.headers;
-      // ETag might be absent due to CORS misconfiguration, but dumb typings from Axios also make it
-      // structurally possible to be many other types
-      if (typeof etag !== 'string') {
-        throw new Error('ETag header missing from response.');
+    // Only the first parts are presigned at initialization, so request the rest as needed
+    let parts = multipartInfo.parts;
+    while (parts.length > 0) {
+      for (const part of parts) {
+        uploadedParts.push(await this.uploadPart(file, part, fileOffset, fileOffset, onProgress));
+        fileOffset += part.size;
       }
-      uploadedParts.push({
-        part_number: part.part_number,
-        size: part.size,
-        etag,
-      });
-      fileOffset += part.size;
+      parts =
+        fileOffset < file.size
+          ? await this.presignParts(file, multipartInfo, parts[parts.length - 1].part_number + 1)
+          : [];
     }
     return uploadedParts;
   }
 
   /**
-   * Completes an upload.
+   * Finds the parts of an interrupted upload which are already transferred.
    *
-   * The object will exist in the object store after completion.
+   * Only some of the missing parts may be presigned at once.
    *
    * @param multipartInfo - The information describing the multipart upload.
-   * @param parts - The parts that were uploaded.
    */
-  protected async completeUpload(
-    multipartInfo: MultipartInfo,
-    parts: UploadedPart[],
-  ): Promise<void> {
-    const response = await this.api.post<CompletionResponse>('upload-complete/', {
+  protected async resumeParts(multipartInfo: MultipartInfo): Promise<ResumptionResponse> {
+    const response = await this.api.post<ResumptionResponse>('upload-resume/', {
       upload_signature: multipartInfo.upload_signature,
       upload_id: multipartInfo.upload_id,
-      parts,
+      ...(this.proxyUploads ? { part_url_format: 'proxy' } : {}),
     });
-    const { complete_url: completeUrl, body } = response.data;
+    return response.data;
+  }
 
-    // Send the CompleteMultipartUpload operation to S3
-    await axios.post(completeUrl, body, {
+  /**
+   * Uploads the parts of an interrupted upload which are missing from the object store.
+   *
+   * @param file - The file to upload.
+   * @param multipartInfo - The information describing the multipart upload.
+   * @param onProgress - A callback for upload progress.
+   */
+  protected async uploadMissingParts(
+    file: File,
+    multipartInfo: MultipartInfo,
+    onProgress: S3FileFieldProgressCallback,
+  ): Promise<UploadedPart[]> {
+    for (;;) {
+      const { transferred_parts: transferredParts, parts } = await this.resumeParts(multipartInfo);
+      if (parts.length === 0) {
+        return transferredParts;
+      }
+      let uploadedSize = transferredParts.reduce((total, part) => total + part.size, 0);
+      for (const part of parts) {
+        const fileOffset = (part.part_number - 1) * multipartInfo.part_size;
+        await this.uploadPart(file, part, fileOffset, uploadedSize, onProgress);
+        uploadedSize += part.size;
+      }
+    }
+  }
+
+  /**
+   * Uploads a file which fits in a single part directly to an object store.
+   *
+   * @param file - The file to upload.
+   * @param multipartInfo - The information describing the single-part upload.
+   * @param onProgress - A callback for upload progress.
+   */
+  protected async uploadSinglePart(
+    file: File,
+    multipartInfo: MultipartInfo,
+    onProgress: S3FileFieldProgressCallback,
+  ): Promise<void> {
+    await axios.put(multipartInfo.parts[0].upload_url, file, {
       headers: {
-        // By default, Axios sets "Content-Type: application/x-www-form-urlencoded" on POST
-        // requests. This causes AWS's API to interpret the request body as additional parameters
-        // to include in the signature validation, causing it to fail.
-        // So, do not send this request with any Content-Type, as that is what's specified by the
-        // CompleteMultipartUpload docs.
-        // Unsetting default headers via "transformRequest" is awkward (since the headers aren't
-        // flattened), so this is actually; the most straightforward way; the null value is passed
-        // through to XMLHttpRequest, then ignored.
-        'Content-Type': null as unknown as string,
+        // Unlike a multipart upload, the object's type is set by this request
+        'Content-Type': file.type || 'application/octet-stream',
       },
+      onUploadProgress: (e) => {
+        onProgress({
+          uploaded: e.loaded,
+          total: file.size,
+          state: S3FileFieldProgressState.Sending,
+        });
+      },
+    });
+  }
+
+  /**
+   * Completes and finalizes an upload.
+   *
+   * The server completes the upload in the object store, so the object will exist afterwards.
+   *
+   * @param multipartInfo - The information describing the multipart upload.
+   * @param parts - The parts that were uploaded.
+   */
+  protected async completeUpload(
+    multipartInfo: MultipartInfo,
+    parts: UploadedPart[],
+  ): Promise<string> {
+    const response = await this.api.post<FinalizationResponse>('upload-complete/', {
+      upload_signature: multipartInfo.upload_signature,
+      upload_id: multipartInfo.upload_id,
+      // The server planned the parts, so only their ETags, in order, need to be sent
+      part_etags: [...parts]
+        .sort((a, b) => a.part_number - b.part_number)
+        .map((part) => part.etag),
+      finalize: true,
     });
+    return response.data.field_value;
   }
 
   /**
@@ -165,7 +379,7 @@ export default class S3FileFieldClient {
    *
    * This will only succeed if the object is already present in the object store.
    *
-   * @param multipartInfo - Signed information returned from /upload-complete/.
+   * @param multipartInfo - Signed information returned from /upload-initialize/.
    */
   protected async finalize(multipartInfo: MultipartInfo): Promise<string> {
     const response = await this.api.post<FinalizationResponse>('finalize/', {
@@ -180,6 +394,7 @@ export default class S3FileFieldClient {
    * @param file - The file to upload.
    * @param fieldId - The Django field identifier.
    * @param [onProgress] - A callback for upload progress.
+   * @param [onInitialize] - A callback with the information needed to resume the upload later.
    */
   public async uploadFile(
     file: File,
@@ -187,15 +402,67 @@ export default class S3FileFieldClient {
     onProgress: S3FileFieldProgressCallback = () => {
       /* no-op */
     },
+    onInitialize: S3FileFieldInitializeCallback = () => {
+      /* no-op */
+    },
   ): Promise<string> {
     onProgress({ state: S3FileFieldProgressState.Initializing });
     const multipartInfo = await this.initializeUpload(file, fieldId);
+    onInitialize(multipartInfo);
+    onProgress({ state: S3FileFieldProgressState.Sending, uploaded: 0, total: file.size });
+    let fieldValue: string;
+    if (multipartInfo.upload_id === null) {
+      // Small files may be uploaded without a multipart upload, so only need finalization
+      await this.uploadSinglePart(file, multipartInfo, onProgress);
+      onProgress({ state: S3FileFieldProgressState.Finalizing });
+      fieldValue = await this.finalize(multipartInfo);
+    } else {
+      const parts = await this.uploadParts(file, multipartInfo, onProgress);
+      onProgress({ state: S3FileFieldProgressState.Finalizing });
+      fieldValue = await this.completeUpload(multipartInfo, parts);
+    }
+    onProgress({ state: S3FileFieldProgressState.Done });
+    return fieldValue;
+  }
+
+  /**
+   * Resumes an interrupted multipart upload, without re-sending any transferred parts.
+   *
+   * @param file - The file to upload, which must be the same as originally.
+   * @param multipartInfo - The information passed to the "onInitialize" callback of uploadFile().
+   * @param [onProgress] - A callback for upload progress.
+   */
+  public async resumeUpload(
+    file: File,
+    multipartInfo: MultipartInfo,
+    onProgress: S3FileFieldProgressCallback = () => {
+      /* no-op */
+    },
+  ): Promise<string> {
+    if (multipartInfo.upload_id === null) {
+      throw new Error('Single-part uploads cannot be resumed.');
+    }
     onProgress({ state: S3FileFieldProgressState.Sending, uploaded: 0, total: file.size });
-    const parts = await this.uploadParts(file, multipartInfo.parts, onProgress);
+    const parts = await this.uploadMissingParts(file, multipartInfo, onProgress);
     onProgress({ state: S3FileFieldProgressState.Finalizing });
-    await this.completeUpload(multipartInfo, parts);
-    const fieldValue = await this.finalize(multipartInfo);
+    const fieldValue = await this.completeUpload(multipartInfo, parts);
     onProgress({ state: S3FileFieldProgressState.Done });
     return fieldValue;
   }
+
+  /**
+   * Uploads a file from a remote URL, which the Django server fetches itself.
+   *
+   * The server must allow the URL's host in its S3FF_INGEST_ALLOWED_HOSTS setting.
+   *
+   * @param sourceUrl - The HTTP(S) URL of the file, which must support range requests.
+   * @param fieldId - The Django field identifier.
+   */
+  public async ingestUrl(sourceUrl: string, fieldId: string): Promise<string> {
+    const response = await this.api.post<FinalizationResponse>('ingest/', {
+      field_id: fieldId,
+      source_url: sourceUrl,
+    });
+    return response.data.field_value;
+  }
 }
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import io
-from typing import BinaryIO, ClassVar
+import time
+from typing import BinaryIO, Callable, ClassVar
 
 import requests
 
@@ -28,12 +29,23 @@ class _File:
 
 class S3FileFieldClient:
     request_timeout: ClassVar[int] = 5
+    # The number of times a part is retried when the server is too busy to proxy it
+    proxy_retries: ClassVar[int] = 5
     base_url: str
     api_session: requests.Session
+    proxy_uploads: bool
 
-    def __init__(self, base_url: str, api_session: requests.Session | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_session: requests.Session | None = None,
+        *,
+        proxy_uploads: bool = False,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_session = requests.Session() if api_session is None else api_session
+        # Parts are uploaded through the server, for clients which can't reach the storage
+        self.proxy_uploads = proxy_uploads
 
     def _initialize_upload(self, file: _File, field_id: str) -> dict:
         resp = self.api_session.post(
@@ -43,16 +55,51 @@ class S3FileFieldClient:
                 "file_name": file.name,
                 "file_size": file.size,
                 "content_type": file.content_type,
+                # A single part is uploaded directly to the storage, so is never proxied
+                "single_part_upload": not self.proxy_uploads,
+                "part_url_format": self._part_url_format,
             },
             timeout=self.request_timeout,
         )
         resp.raise_for_status()
-        return resp.json()
+        multipart_info = resp.json()
+        multipart_info["parts"] = self._expand_parts(multipart_info, multipart_info, file.size)
+        return multipart_info
+
+    @staticmethod
+    def _expand_parts(parts_info: dict, multipart_info: dict, file_size: int) -> list[dict]:
+        # Servers which don't support the "template" format send the full part URLs instead
+        if "part_template" not in parts_info:
+            return parts_info["parts"]
+        part_template = parts_info["part_template"]
+        part_size = multipart_info["part_size"]
+        return [
+            {
+                "part_number": part_number,
+                # Only the last part may be smaller
+                "size": min(part_size, file_size - (part_number - 1) * part_size),
+                "upload_url": part_template["upload_url"]
+                .replace("{part_number}", str(part_number))
+                .replace("{signature}", signature),
+            }
+            for part_number, signature in enumerate(
+                part_template["signatures"], start=part_template["first_part_number"]
+            )
+        ]
+
+    @property
+    def _part_url_format(self) -> str:
+        return "proxy" if self.proxy_uploads else "template"
 
     def _upload_part(self, part_bytes: bytes, part_initialization: dict) -> dict:
-        resp = requests.put(
-            part_initialization["upload_url"], data=part_bytes, timeout=self.request_timeout
-        )
+        for _ in range(self.proxy_retries):
+            resp = requests.put(
+                part_initialization["upload_url"], data=part_bytes, timeout=self.request_timeout
+            )
+            # A proxying server may be too busy to accept another part right now
+            if resp.status_code != 503 or "Retry-After" not in resp.headers:
+                break
+            time.sleep(int(resp.headers["Retry-After"]))
         resp.raise_for_status()
 
         etag = resp.headers["ETag"]
@@ -63,31 +110,111 @@ class S3FileFieldClient:
             "etag": etag,
         }
 
-    def _upload_parts(self, file: _File, part_initializations: list[dict]) -> list[dict]:
-        return [
-            self._upload_part(file.stream.read(part_initialization["size"]), part_initialization)
-            for part_initialization in part_initializations
-        ]
+    def _presign_parts(
+        self, file: _File, multipart_info: dict, first_part_number: int
+    ) -> list[dict]:
+        resp = self.api_session.post(
+            f"{self.base_url}/upload-parts/",
+            json={
+                "upload_signature": multipart_info["upload_signature"],
+                "upload_id": multipart_info["upload_id"],
+                "first_part_number": first_part_number,
+                "part_url_format": self._part_url_format,
+            },
+            timeout=self.request_timeout,
+        )
+        resp.raise_for_status()
+        return self._expand_parts(resp.json(), multipart_info, file.size)
+
+    def _upload_parts(self, file: _File, multipart_info: dict) -> list[dict]:
+        upload_infos: list[dict] = []
+        uploaded_size = 0
+        # Only the first parts are presigned at initialization, so request the rest as needed
+        part_initializations: list[dict] = multipart_info["parts"]
+        while part_initializations:
+            for part_initialization in part_initializations:
+                upload_infos.append(
+                    self._upload_part(
+                        file.stream.read(part_initialization["size"]), part_initialization
+                    )
+                )
+                uploaded_size += part_initialization["size"]
+            part_initializations = (
+                self._presign_parts(file, multipart_info, upload_infos[-1]["part_number"] + 1)
+                if uploaded_size < file.size
+                else []
+            )
+        return upload_infos
 
-    def _complete_upload(self, multipart_info: dict, upload_infos: list[dict]) -> None:
+    def _resume_upload(self, multipart_info: dict) -> dict:
+        resp = self.api_session.post(
+            f"{self.base_url}/upload-resume/",
+            json={
+                "upload_signature": multipart_info["upload_signature"],
+                "upload_id": multipart_info["upload_id"],
+                **({"part_url_format": "proxy"} if self.proxy_uploads else {}),
+            },
+            timeout=self.request_timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def _upload_missing_parts(self, file_stream: BinaryIO, multipart_info: dict) -> list[dict]:
+        # Only some missing parts may be presigned at once, so resume until none remain
+        while True:
+            resumption = self._resume_upload(multipart_info)
+            if not resumption["parts"]:
+                return resumption["transferred_parts"]
+            for part_initialization in resumption["parts"]:
+                file_stream.seek(
+                    (part_initialization["part_number"] - 1) * multipart_info["part_size"]
+                )
+                self._upload_part(
+                    file_stream.read(part_initialization["size"]), part_initialization
+                )
+
+    def _complete_upload(self, multipart_info: dict, upload_infos: list[dict]) -> str:
+        upload_infos = sorted(upload_infos, key=lambda upload_info: upload_info["part_number"])
         resp = self.api_session.post(
             f"{self.base_url}/upload-complete/",
             json={
                 "upload_id": multipart_info["upload_id"],
-                "parts": upload_infos,
+                # Servers which send a "part_template" planned the parts, so only their ETags, in
+                # order, need to be sent; others need every part
+                **(
+                    {"part_etags": [upload_info["etag"] for upload_info in upload_infos]}
+                    if "part_template" in multipart_info
+                    else {"parts": upload_infos}
+                ),
                 "upload_signature": multipart_info["upload_signature"],
+                "finalize": True,
             },
             timeout=self.request_timeout,
         )
         resp.raise_for_status()
-        completion_data = resp.json()
+        completion = resp.json()
+        # The server completes the upload itself and returns the finalized field value
+        if "field_value" in completion:
+            return completion["field_value"]
 
+        # Servers from before server-side completion ignore "finalize", and instead return the
+        # presigned completion request, for the client to send itself
         complete_resp = requests.post(
-            completion_data["complete_url"],
-            data=completion_data["body"],
-            timeout=self.request_timeout,
+            completion["complete_url"], data=completion["body"], timeout=self.request_timeout
         )
         complete_resp.raise_for_status()
+        return self._finalize(multipart_info)
+
+    def _upload_single_part(self, file: _File, multipart_info: dict) -> None:
+        (part_initialization,) = multipart_info["parts"]
+        resp = requests.put(
+            part_initialization["upload_url"],
+            data=file.stream.read(part_initialization["size"]),
+            # This is not set by the server, as with a multipart upload
+            headers={"Content-Type": file.content_type},
+            timeout=self.request_timeout,
+        )
+        resp.raise_for_status()
 
     def _finalize(self, multipart_info: dict) -> str:
         resp = self.api_session.post(
@@ -101,10 +228,51 @@ class S3FileFieldClient:
         return resp.json()["field_value"]
 
     def upload_file(
-        self, *, file_stream: BinaryIO, file_name: str, file_content_type: str, field_id: str
+        self,
+        *,
+        file_stream: BinaryIO,
+        file_name: str,
+        file_content_type: str,
+        field_id: str,
+        on_initialize: Callable[[dict], None] | None = None,
     ) -> str:
         file = _File.from_stream(file_stream, file_name, file_content_type)
         multipart_info = self._initialize_upload(file, field_id)
-        upload_infos = self._upload_parts(file, multipart_info["parts"])
-        self._complete_upload(multipart_info, upload_infos)
-        return self._finalize(multipart_info)
+        if on_initialize is not None:
+            # This allows the upload to be resumed later, if it's interrupted
+            on_initialize(multipart_info)
+        if multipart_info["upload_id"] is None:
+            # Small files may be uploaded without a multipart upload, so only need finalization
+            self._upload_single_part(file, multipart_info)
+            return self._finalize(multipart_info)
+        upload_infos = self._upload_parts(file, multipart_info)
+        return self._complete_upload(multipart_info, upload_infos)
+
+    def ingest_url(
+        self,
+        *,
+        source_url: str,
+        field_id: str,
+        file_name: str | None = None,
+        file_content_type: str | None = None,
+    ) -> str:
+        resp = self.api_session.post(
+            f"{self.base_url}/ingest/",
+            json={
+                "field_id": field_id,
+                "source_url": source_url,
+                # If omitted, the server takes these from the source
+                **({"file_name": file_name} if file_name is not None else {}),
+                **({"content_type": file_content_type} if file_content_type is not None else {}),
+            },
+            # The server transfers the whole source before responding
+            timeout=(self.request_timeout, None),
+        )
+        resp.raise_for_status()
+        return resp.json()["field_value"]
+
+    def resume_upload(self, *, file_stream: BinaryIO, multipart_info: dict) -> str:
+        if multipart_info["upload_id"] is None:
+            raise ValueError("Single-part uploads cannot be resumed.")
+        upload_infos = self._upload_missing_parts(file_stream, multipart_info)
+        return self._complete_upload(multipart_info, upload_infos)
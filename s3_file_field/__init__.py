@@ -1,3 +1,22 @@
+from ._bulk_upload import upload_files  # noqa: F401
+from ._concurrency import storage_executor_stats, transfer_executor_stats  # noqa: F401
+from ._copy import copy_objects  # noqa: F401
+from ._download_urls import field_file_urls, queryset_file_urls  # noqa: F401
+from ._multipart import MultipartManager  # noqa: F401
+from ._part_size_policy import (  # noqa: F401
+    AdaptivePartSizePolicy,
+    FixedPartSizePolicy,
+    PartSizeHints,
+    PartSizePolicy,
+)
+from ._prefetch import prefetch_s3_metadata  # noqa: F401
+from ._stale_uploads import abort_stale_uploads  # noqa: F401
+from ._url_cache import (  # noqa: F401
+    DjangoPresignedUrlCache,
+    LocalPresignedUrlCache,
+    PresignedUrlCache,
+)
+
 # The documentation should always reference s3_file_field.S3FileField
 # and this cannot change without breaking the migrations of downstream
 # projects.
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import functools
+import mimetypes
+import os
+from typing import TYPE_CHECKING, BinaryIO, Sequence, Union, cast
+
+from s3_file_field._concurrency import get_transfer_executor
+from s3_file_field._multipart import (
+    CreatedUploads,
+    FinalizedUpload,
+    MultipartManager,
+    TransferredPart,
+    TransferredParts,
+)
+from s3_file_field.widgets import S3ObjectKey
+
+if TYPE_CHECKING:
+    from s3_file_field.fields import S3FileField
+
+    StrPath = Union[str, os.PathLike[str]]
+
+
+class _FileRange:
+    """Read only "size" bytes of "file", from its current position."""
+
+    def __init__(self, file: BinaryIO, size: int) -> None:
+        self._file = file
+        self._remaining = size
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+@dataclass
+class _PlannedUpload:
+    path: StrPath
+    object_key: str
+    size: int
+    content_type: str
+    # Each part's number and size, which is a single part if the file is uploaded with one PUT
+    part_sizes: list[tuple[int, int]]
+    upload_id: str | None = None
+
+    @property
+    def single_part(self) -> bool:
+        return len(self.part_sizes) == 1
+
+
+def _plan_upload(field: S3FileField, manager: MultipartManager, path: StrPath) -> _PlannedUpload:
+    size = os.path.getsize(path)
+    return _PlannedUpload(
+        path=path,
+        # There's never an instance of the model during an upload, like in the upload views
+        object_key=field.generate_filename(None, os.path.basename(path)),
+        size=size,
+        content_type=mimetypes.guess_type(path)[0] or "application/octet-stream",
+        # An empty file is also uploaded as a single, empty part
+        part_sizes=list(manager._iter_part_sizes(size)) or [(1, 0)],
+    )
+
+
+def upload_files(field: S3FileField, paths: Sequence[StrPath]) -> list[S3ObjectKey]:
+    """
+    Upload each of the local files at "paths" to a new object for "field".
+
+    Files which fit in a single part are uploaded with a single PUT, and others with a multipart
+    upload. Every file and part is uploaded concurrently, in the thread pool for transfers, and
+    streamed from its file rather than buffered. Each returned object key may be
+    assigned to a model instance, which also stores its metadata in any of the field's metadata
+    fields.
+    """
+    manager = MultipartManager.from_storage(field.storage)
+    # Each step is a flat batch of requests, since nested batches could exhaust the thread pool
+    executor = get_transfer_executor()
+
+    planned_uploads = [_plan_upload(field, manager, path) for path in paths]
+    multipart_uploads = [
+        planned_upload for planned_upload in planned_uploads if not planned_upload.single_part
+    ]
+
+    def transfer(
+        part_transfer: tuple[_PlannedUpload, int, int, int],
+    ) -> FinalizedUpload | TransferredPart:
+        planned_upload, part_number, offset, part_size = part_transfer
+        with open(planned_upload.path, "rb") as file:
+            file.seek(offset)
+            body = cast(BinaryIO, _FileRange(file, part_size))
+            if planned_upload.upload_id is None:
+                finalized_upload = manager.put_object(
+                    planned_upload.object_key, part_size, planned_upload.content_type, body
+                )
+                created_uploads.on_abort(
+                    functools.partial(field.storage.delete, planned_upload.object_key)
+                )
+                return finalized_upload
+            return manager.proxy_part(
+                planned_upload.object_key, planned_upload.upload_id, part_number, part_size, body
+            )
+
+    part_transfers: list[tuple[_PlannedUpload, int, int, int]] = []
+    for planned_upload in planned_uploads:
+        offset = 0
+        for part_number, part_size in planned_upload.part_sizes:
+            part_transfers.append((planned_upload, part_number, offset, part_size))
+            offset += part_size
+    with CreatedUploads(executor) as created_uploads:
+        upload_ids = executor.map(
+            lambda planned_upload: created_uploads.create_upload_id(
+                manager, planned_upload.object_key, planned_upload.content_type
+            ),
+            multipart_uploads,
+        )
+        for planned_upload, upload_id in zip(multipart_uploads, upload_ids):
+            planned_upload.upload_id = upload_id
+
+        transfers = executor.map(transfer, part_transfers)
+        all_transferred_parts: dict[int, TransferredParts] = {}
+        etags: dict[int, str] = {}
+        for (planned_upload, _, _, _), result in zip(part_transfers, transfers):
+            if isinstance(result, FinalizedUpload):
+                etags[id(planned_upload)] = result.etag
+            else:
+                assert planned_upload.upload_id is not None
+                all_transferred_parts.setdefault(
+                    id(planned_upload),
+                    TransferredParts(
+                        object_key=planned_upload.object_key,
+                        upload_id=planned_upload.upload_id,
+                        parts=[],
+                    ),
+                ).parts.append(result)
+        etags.update(
+            zip(
+                all_transferred_parts,
+                executor.map(manager._complete_upload_id, all_transferred_parts.values()),
+            )
+        )
+
+    return [
+        S3ObjectKey(
+            planned_upload.object_key,
+            planned_upload.size,
+            etags[id(planned_upload)],
+            planned_upload.content_type,
+        )
+        for planned_upload in planned_uploads
+    ]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import threading
+from typing import Any, Callable, Iterable, TypeVar
+
+from django.conf import settings
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class StorageExecutorStats:
+    max_workers: int
+    # Calls which are waiting for, or running in, a worker thread
+    in_flight: int
+    # Calls which are running in a worker thread
+    active: int
+    peak_in_flight: int
+    peak_active: int
+    completed: int
+
+
+class StorageExecutor:
+    """
+    A bounded thread pool, for making blocking object store requests concurrently.
+
+    Neither boto3 nor MinIO provide async clients, so async views run their requests here, instead
+    of through asgiref's default thread-sensitive executor, which would serialize every request
+    onto a single thread. Waiting calls hold no thread, so many more than "max_workers" calls may
+    be in flight at once. Batch views also use this to make their requests concurrently.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "s3ff") -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._active = 0
+        self._peak_in_flight = 0
+        self._peak_active = 0
+        self._completed = 0
+
+    def submit(self, func: Callable[..., T], *args: Any) -> Future[T]:
+        """Call "func" with "args" in a worker thread."""
+        with self._lock:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        future = self._executor.submit(self._call, func, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Call "func" with "args" in a worker thread, and await its result."""
+        return await asyncio.wrap_future(self.submit(func, *args))
+
+    def map(self, func: Callable[[A], T], items: Iterable[A]) -> list[T]:
+        """Call "func" with each of "items" concurrently, and wait for every result."""
+        futures = [self.submit(func, item) for item in items]
+        # Even if a call fails, none may still be running afterwards
+        concurrent.futures.wait(futures)
+        return [future.result() for future in futures]
+
+    def _call(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            self._active += 1
+            self._peak_active = max(self._peak_active, self._active)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def _done(self, future: Future[Any]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    def stats(self) -> StorageExecutorStats:
+        with self._lock:
+            return StorageExecutorStats(
+                max_workers=self.max_workers,
+                in_flight=self._in_flight,
+                active=self._active,
+                peak_in_flight=self._peak_in_flight,
+                peak_active=self._peak_active,
+                completed=self._completed,
+            )
+
+
+@functools.lru_cache(maxsize=1)
+def get_storage_executor() -> StorageExecutor:
+    return StorageExecutor(max_workers=getattr(settings, "S3FF_STORAGE_MAX_WORKERS", 100))
+
+
+@functools.lru_cache(maxsize=1)
+def get_transfer_executor() -> StorageExecutor:
+    # Transfers of whole parts or objects can each hold a thread for minutes, so they have their
+    # own pool, which can't starve the short requests of the views
+    return StorageExecutor(
+        max_workers=getattr(settings, "S3FF_TRANSFER_MAX_WORKERS", 16),
+        thread_name_prefix="s3ff-transfer",
+    )
+
+
+def storage_executor_stats() -> StorageExecutorStats:
+    """Report the concurrency of object store requests made by async and batch views."""
+    return get_storage_executor().stats()
+
+
+def transfer_executor_stats() -> StorageExecutorStats:
+    """Report the concurrency of transfers made by ingests, copies and imports."""
+    return get_transfer_executor().stats()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+from s3_file_field._concurrency import get_transfer_executor
+from s3_file_field._multipart import (
+    CopyNotSupportedError,
+    CreatedUploads,
+    FinalizedUpload,
+    MultipartManager,
+    TransferredPart,
+    TransferredParts,
+)
+from s3_file_field._prefetch import _get_object_metadata
+
+if TYPE_CHECKING:
+    from django.core.files.storage import Storage
+
+    # The upload to copy to, the source object key, the part number, and its inclusive byte range
+    PartCopy = tuple[TransferredParts, str, int, "tuple[int, int] | None"]
+
+
+def _plan_part_copies(
+    destination: MultipartManager, transferred_parts: TransferredParts, source_key: str, size: int
+) -> list[PartCopy]:
+    if size == 0:
+        # A multipart upload needs at least one part, but an empty range can't be copied
+        return [(transferred_parts, source_key, 1, None)]
+    part_copies: list[PartCopy] = []
+    offset = 0
+    for part_number, part_size in destination._iter_part_sizes(size):
+        part_copies.append(
+            (transferred_parts, source_key, part_number, (offset, offset + part_size - 1))
+        )
+        offset += part_size
+    return part_copies
+
+
+def copy_objects(
+    source_storage: Storage, destination_storage: Storage, names: Sequence[str]
+) -> list[FinalizedUpload | None]:
+    """
+    Copy each of "names" from "source_storage" to the same name in "destination_storage".
+
+    The object store copies each object itself, in parts planned like those of an upload, so none
+    of the data passes through the server. The metadata of every object, and then every part, are
+    copied concurrently. Like a single copy, each copy has the same system and user-defined
+    metadata as its source. The result is None for each of "names" missing from "source_storage".
+    """
+    source = MultipartManager.from_storage(source_storage)
+    destination = MultipartManager.from_storage(destination_storage)
+    if not destination._can_copy_from(source):
+        raise CopyNotSupportedError
+    # Each step is a flat batch of requests, since nested batches could exhaust the thread pool
+    executor = get_transfer_executor()
+
+    all_metadata = executor.map(lambda name: _get_object_metadata(source, name), names)
+    copied_names = [name for name, metadata in zip(names, all_metadata) if metadata is not None]
+    copied_metadata = [metadata for metadata in all_metadata if metadata is not None]
+
+    def copy_part(part_copy: PartCopy) -> TransferredPart:
+        transferred_parts, source_key, part_number, byte_range = part_copy
+        if byte_range is None:
+            etag = destination._upload_part(
+                transferred_parts.object_key, transferred_parts.upload_id, part_number, b""
+            )
+            return TransferredPart(part_number=part_number, size=0, etag=etag)
+        etag = destination._copy_part(
+            transferred_parts.object_key,
+            transferred_parts.upload_id,
+            part_number,
+            source,
+            source_key,
+            byte_range,
+        )
+        return TransferredPart(
+            part_number=part_number, size=byte_range[1] - byte_range[0] + 1, etag=etag
+        )
+
+    with CreatedUploads(executor) as created_uploads:
+        upload_ids = executor.map(
+            lambda copy: created_uploads.create_upload_id(
+                destination,
+                copy[0],
+                copy[1].content_type or "application/octet-stream",
+                copy[1].headers,
+            ),
+            zip(copied_names, copied_metadata),
+        )
+        all_transferred_parts = [
+            TransferredParts(object_key=name, upload_id=upload_id, parts=[])
+            for name, upload_id in zip(copied_names, upload_ids)
+        ]
+        part_copies = [
+            part_copy
+            for transferred_parts, name, metadata in zip(
+                all_transferred_parts, copied_names, copied_metadata
+            )
+            for part_copy in _plan_part_copies(destination, transferred_parts, name, metadata.size)
+        ]
+        for part_copy, transferred_part in zip(part_copies, executor.map(copy_part, part_copies)):
+            part_copy[0].parts.append(transferred_part)
+        etags = executor.map(destination._complete_upload_id, all_transferred_parts)
+
+    finalized_uploads = iter(
+        FinalizedUpload(object_key=name, size=metadata.size, etag=etag)
+        for name, metadata, etag in zip(copied_names, copied_metadata, etags)
+    )
+    return [next(finalized_uploads) if metadata is not None else None for metadata in all_metadata]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import posixpath
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+from urllib.parse import urlsplit
+
+from s3_file_field._multipart import MultipartManager
+from s3_file_field._presign import PresignError, SigV4QueryPresigner
+
+if TYPE_CHECKING:
+    from django.core.files.storage import Storage
+    from django.db.models import QuerySet
+    from django.db.models.fields.files import FieldFile
+
+
+def _is_clean(name: str) -> bool:
+    # Storages may clean names before presigning them, so only clean names can be derived
+    return "\\" not in name and posixpath.normpath(name) == name
+
+
+def _download_presigner(
+    storage: Storage, name: str, reference_url: str
+) -> tuple[SigV4QueryPresigner, str] | None:
+    """
+    Make a presigner from the download URL of "name", and the path prefix of every object.
+
+    This is None if the storage isn't supported by MultipartManager, or if its URLs can't be
+    reproduced exactly.
+    """
+    if not MultipartManager.supported_storage(storage) or not _is_clean(name):
+        return None
+    secret_key = MultipartManager.from_storage(storage)._get_signing_secret_key()
+    if secret_key is None:
+        return None
+    # The path may also include the bucket name and the storage's location
+    path = urlsplit(reference_url).path
+    encoded_name = SigV4QueryPresigner.encode_path(name)
+    if not path.endswith(f"/{encoded_name}"):
+        return None
+    try:
+        presigner = SigV4QueryPresigner(reference_url, method="GET", secret_key=secret_key)
+    except PresignError:
+        return None
+    return presigner, path[: -len(encoded_name)]
+
+
+def presign_download_urls(storage: Storage, names: Sequence[str]) -> list[str]:
+    """
+    Return the URL of each of "names" in "storage", as "storage.url" would.
+
+    Only the first URL is presigned by the storage itself. For storages supported by
+    MultipartManager, the other URLs are derived from it by SigV4QueryPresigner, which shares the
+    resolved credentials and signing key, unless it's unable to reproduce the first URL exactly.
+    """
+    if not names:
+        return []
+    first_name, *other_names = names
+    reference_url = storage.url(first_name)
+    download_presigner = _download_presigner(storage, first_name, reference_url)
+    if download_presigner is None:
+        return [reference_url, *(storage.url(name) for name in other_names)]
+    presigner, path_prefix = download_presigner
+    return [
+        reference_url,
+        *(
+            (
+                presigner.presign(path=f"{path_prefix}{presigner.encode_path(name)}")
+                if _is_clean(name)
+                else storage.url(name)
+            )
+            for name in other_names
+        ),
+    ]
+
+
+def field_file_urls(field_files: Iterable[FieldFile]) -> list[str | None]:
+    """
+    Return the URL of each of "field_files", or None for those without a file.
+
+    This is equivalent to reading "url" from each, but is much faster for many files.
+    """
+    urls: list[str | None] = []
+    # Files are presigned together with others from the same storage
+    names_by_storage: dict[int, tuple[Storage, list[int], list[str]]] = {}
+    for index, field_file in enumerate(field_files):
+        urls.append(None)
+        if field_file.name:
+            storage_entry = names_by_storage.setdefault(
+                id(field_file.storage), (field_file.storage, [], [])
+            )
+            storage_entry[1].append(index)
+            storage_entry[2].append(field_file.name)
+    for storage, indexes, names in names_by_storage.values():
+        for index, url in zip(indexes, presign_download_urls(storage, names)):
+            urls[index] = url
+    return urls
+
+
+def queryset_file_urls(queryset: QuerySet, field_name: str) -> dict[Any, str]:
+    """
+    Return the URL of the "field_name" file of each object in "queryset", by primary key.
+
+    Objects without a file are omitted. Only the primary keys and file names are queried.
+    """
+    storage = queryset.model._meta.get_field(field_name).storage
+    pks, names = [], []
+    for pk, name in queryset.values_list("pk", field_name):
+        if name:
+            pks.append(pk)
+            names.append(name)
+    return dict(zip(pks, presign_download_urls(storage, names)))
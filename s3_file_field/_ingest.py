@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import posixpath
+import re
+from typing import TYPE_CHECKING, BinaryIO, cast
+from urllib.parse import unquote, urljoin, urlsplit
+
+from django.conf import settings
+from django.http.request import validate_host
+
+from s3_file_field import _proxy
+
+if TYPE_CHECKING:
+    import urllib3
+
+    from s3_file_field._multipart import MultipartManager, TransferredPart
+
+# Redirects are followed manually, so each one's host can be checked
+_MAX_REDIRECTS = 5
+_CONTENT_RANGE_RE = re.compile(r"^bytes 0-0/(\d+)$")
+
+
+class IngestError(Exception):
+    """Raised when a remote source cannot be ingested."""
+
+
+class SourceRequestError(Exception):
+    """Raised when a request to a remote source fails, such as when it can't be connected to."""
+
+
+@dataclass
+class IngestSource:
+    # After any redirects
+    url: str
+    size: int
+    content_type: str | None
+    # Used to ensure that every range is of the same version of the source
+    etag: str | None
+    last_modified: str | None
+    file_name: str
+
+    @property
+    def range_validator(self) -> str | None:
+        # A weak ETag can't be used to request a range, since it may differ in any byte
+        if self.etag is not None and not self.etag.startswith("W/"):
+            return self.etag
+        return self.last_modified
+
+
+def ingest_allowed_hosts() -> list[str]:
+    # Like ALLOWED_HOSTS, these may be patterns such as ".example.com" or "*"
+    return getattr(settings, "S3FF_INGEST_ALLOWED_HOSTS", [])
+
+
+def _check_url(url: str) -> None:
+    split_url = urlsplit(url)
+    if split_url.scheme not in {"http", "https"} or not split_url.hostname:
+        raise IngestError("Source URL must be HTTP or HTTPS.")
+    if not validate_host(split_url.hostname, ingest_allowed_hosts()):
+        raise IngestError("Source host is not allowed.")
+
+
+def _request_source(url: str, headers: dict[str, str]) -> urllib3.BaseHTTPResponse:
+    pool = _proxy.get_proxy_pool()
+    # Like the pool, urllib3 is only imported when it's needed
+    import urllib3
+
+    try:
+        return pool.request("GET", url, headers=headers, preload_content=False, redirect=False)
+    except urllib3.exceptions.HTTPError as e:
+        raise SourceRequestError from e
+
+
+def _request_first_byte(url: str) -> tuple[str, urllib3.BaseHTTPResponse]:
+    for _ in range(_MAX_REDIRECTS + 1):
+        _check_url(url)
+        # Unlike HEAD, this is also allowed by presigned GET URLs
+        resp = _request_source(url, {"Range": "bytes=0-0"})
+        # The body is at most a byte, or a small error or redirect page
+        resp.close()
+        redirect_location = resp.get_redirect_location()
+        if not redirect_location:
+            return url, resp
+        url = urljoin(url, redirect_location)
+    raise IngestError("Source URL redirects too many times.")
+
+
+def resolve_source(source_url: str) -> IngestSource:
+    """Find the size and content type of the source at "source_url", which must allow ranges."""
+    url, resp = _request_first_byte(source_url)
+    if resp.status == 200:
+        raise IngestError("Source doesn't support range requests.")
+    if resp.status != 206:
+        raise IngestError(f"Source responded with status {resp.status}.")
+    content_range_match = _CONTENT_RANGE_RE.match(resp.headers.get("Content-Range", ""))
+    if content_range_match is None:
+        raise IngestError("Source size is unknown.")
+    return IngestSource(
+        url=url,
+        size=int(content_range_match[1]),
+        content_type=resp.headers.get("Content-Type"),
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+        # Redirects may be to an arbitrary name, so use the requested URL's
+        file_name=unquote(posixpath.basename(urlsplit(source_url).path)) or "download",
+    )
+
+
+def plan_part_ranges(
+    manager: MultipartManager, size: int, part_size: int
+) -> list[tuple[int, tuple[int, int]]]:
+    """Return the number and inclusive byte range of each part of a source of "size" bytes."""
+    part_ranges = []
+    offset = 0
+    for part_number, current_part_size in manager._iter_part_sizes(size, part_size):
+        part_ranges.append((part_number, (offset, offset + current_part_size - 1)))
+        offset += current_part_size
+    return part_ranges
+
+
+def ingest_part(
+    manager: MultipartManager,
+    source: IngestSource,
+    object_key: str,
+    upload_id: str,
+    part_range: tuple[int, tuple[int, int]],
+) -> TransferredPart:
+    """Stream a range of the source to a part of an upload, without buffering it."""
+    part_number, (first_byte, last_byte) = part_range
+    part_size = last_byte - first_byte + 1
+    headers = {"Range": f"bytes={first_byte}-{last_byte}"}
+    if source.range_validator is not None:
+        # Unlike If-Match, this is also allowed with a date, so works without a strong ETag
+        headers["If-Range"] = source.range_validator
+    resp = _request_source(source.url, headers)
+    try:
+        # The whole source is sent instead of the range if it has changed, and the size is
+        # compared too, for sources with neither a strong ETag nor a modification date
+        if (resp.status == 200 and "If-Range" in headers) or (
+            resp.status == 206
+            and resp.headers.get("Content-Range") != f"bytes {first_byte}-{last_byte}/{source.size}"
+        ):
+            raise IngestError("Source changed during ingest.")
+        # A source which ignores the range would send the whole file
+        if resp.status != 206 or resp.headers.get("Content-Length") != str(part_size):
+            raise IngestError(f"Source responded to a range with status {resp.status}.")
+        transferred_part = manager.proxy_part(
+            object_key, upload_id, part_number, part_size, cast(BinaryIO, resp)
+        )
+    except BaseException:
+        # The connection may have unread data, so can't be reused
+        resp.close()
+        raise
+    resp.release_conn()
+    return transferred_part
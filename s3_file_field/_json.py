@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import codecs
+from typing import IO, Any, Mapping
+
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+
+class JSONParser(parsers.JSONParser):
+    """
+    Parse JSON with orjson, if it's installed.
+
+    Completion requests may describe 10,000 parts, so this is several times faster than the
+    standard library for them. Otherwise, this is identical to DRF's JSONParser.
+    """
+
+    def parse(
+        self,
+        stream: IO[Any],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        # orjson only decodes UTF-8, and always rejects non-standard constants like "NaN"
+        if orjson is None or codecs.lookup(encoding).name != "utf-8" or not self.strict:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
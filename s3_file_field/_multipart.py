@@ -1,15 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import timedelta
-import math
-from typing import TYPE_CHECKING, Any, ClassVar, Iterator
-
-from s3_file_field._sizes import gb, mb
+import contextlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import functools
+import itertools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    ClassVar,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
+from urllib.parse import parse_qs, urlsplit
+
+from s3_file_field import _proxy, _registry
+from s3_file_field._concurrency import get_storage_executor
+from s3_file_field._part_size_policy import PartSizePolicy, clamp_part_size
+from s3_file_field._presign import PresignError, SigV4QueryPresigner
+from s3_file_field._sizes import mb
 
 if TYPE_CHECKING:
     from django.core.files.storage import Storage
 
+    from s3_file_field._concurrency import StorageExecutor
+
+    MultipartManagerType = TypeVar("MultipartManagerType", bound=type["MultipartManager"])
+
 
 @dataclass
 class PresignedPartTransfer:
@@ -18,11 +38,22 @@ class PresignedPartTransfer:
     upload_url: str
 
 
+@dataclass
+class PresignedPartTemplate:
+    # Contains "{part_number}" and "{signature}" placeholders
+    upload_url: str
+    first_part_number: int
+    # The signature of each consecutive part, starting from "first_part_number"
+    signatures: list[str]
+
+
 @dataclass
 class PresignedTransfer:
     object_key: str
     upload_id: str
+    # Empty if "part_template" is set instead
     parts: list[PresignedPartTransfer]
+    part_template: PresignedPartTemplate | None = None
 
 
 @dataclass
@@ -39,12 +70,63 @@ class TransferredParts:
     parts: list[TransferredPart]
 
 
+@dataclass
+class ResumedTransfer:
+    object_key: str
+    upload_id: str
+    # Parts which are already stored in the object store
+    transferred_parts: list[TransferredPart]
+    # Parts which are still missing
+    parts: list[PresignedPartTransfer]
+
+
 @dataclass
 class PresignedUploadCompletion:
     complete_url: str
     body: str
 
 
+@dataclass
+class FinalizedUpload:
+    object_key: str
+    size: int
+    etag: str
+
+
+@dataclass
+class ObjectMetadata:
+    size: int
+    # Without quotes
+    etag: str
+    content_type: str
+    # The other headers which a copy of the object must have, with lowercase names
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+# Like S3's "MetadataDirective=COPY", a copied object has the same system metadata, besides
+# "Content-Type", and user-defined metadata
+_COPIED_HEADERS = frozenset(
+    ["cache-control", "content-disposition", "content-encoding", "content-language", "expires"]
+)
+
+
+def _copied_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    """Return the headers of an object's response which a copy of it must have."""
+    return {
+        name.lower(): value
+        for name, value in headers.items()
+        if name.lower() in _COPIED_HEADERS or name.lower().startswith("x-amz-meta-")
+    }
+
+
+@dataclass
+class PendingUpload:
+    object_key: str
+    upload_id: str
+    # Timezone-aware
+    initiated: datetime
+
+
 class UnsupportedStorageError(Exception):
     """Raised when MultipartManager does not support the given Storage."""
 
@@ -56,6 +138,26 @@ class ObjectNotFoundError(Exception):
     """Raised when an object cannot be found in the object store."""
 
 
+class UploadNotFoundError(Exception):
+    """Raised when a multipart upload cannot be found in the object store."""
+
+
+class UploadCompletionError(Exception):
+    """Raised when the object store refuses to complete a multipart upload."""
+
+
+class PartUploadError(Exception):
+    """Raised when the object store refuses a proxied part upload."""
+
+
+class ObjectUploadError(Exception):
+    """Raised when the object store refuses an object uploaded from the server."""
+
+
+class CopyNotSupportedError(Exception):
+    """Raised when the object store cannot copy objects between two Storages by itself."""
+
+
 class UploadTooLargeError(Exception):
     """Raised when an upload exceeds the maximum object size for a Storage."""
 
@@ -67,14 +169,37 @@ class MultipartManager:
     """A facade providing management of S3 multipart uploads to multiple Storages."""
 
     part_size: ClassVar[int] = mb(64)
+    # If set, this chooses the part size of each upload instead of "part_size". It may be set per
+    # Storage, on the instance returned by "from_storage", or be overridden per S3FileField.
+    part_size_policy: PartSizePolicy | None = None
+    # Only this many part URLs are presigned when an upload is initialized; clients request
+    # the URLs for any later parts on demand, so the cost of initialization is bounded
+    part_url_window: ClassVar[int] = 100
     max_object_size: ClassVar[int]
+    # Whether presigned PUTs sign "Content-Length", so a client can't upload another size of object
+    # than was signed; otherwise, only multipart uploads are presigned for clients
+    signs_content_length: ClassVar[bool] = True
+    # The exceptions which a request to the object store may raise, such as for network errors
+    request_errors: ClassVar[tuple[type[Exception], ...]] = ()
+
+    def __init__(self, storage: Storage) -> None:
+        raise NotImplementedError
 
     def initialize_upload(
         self,
         object_key: str,
         file_size: int,
         content_type: str,
+        *,
+        part_size: int | None = None,
+        part_url_template: bool = False,
     ) -> PresignedTransfer:
+        """
+        Create a multipart upload, and presign its first parts.
+
+        If "part_url_template" is set, the parts are presigned with "presign_part_template"
+        instead of "presign_parts", where the storage supports it.
+        """
         if file_size > self.max_object_size:
             raise UploadTooLargeError("File is larger than the S3 maximum object size.")
 
@@ -82,38 +207,285 @@ class MultipartManager:
             object_key,
             content_type,
         )
-        parts = [
-            PresignedPartTransfer(
-                part_number=part_number,
-                size=part_size,
-                upload_url=self._generate_presigned_part_url(
-                    object_key, upload_id, part_number, part_size
-                ),
-            )
-            for part_number, part_size in self._iter_part_sizes(file_size)
+        part_template = (
+            self.presign_part_template(object_key, upload_id, file_size, 1, part_size=part_size)
+            if part_url_template
+            else None
+        )
+        parts = (
+            self.presign_parts(object_key, upload_id, file_size, 1, part_size=part_size)
+            if part_template is None
+            else []
+        )
+        return PresignedTransfer(
+            object_key=object_key, upload_id=upload_id, parts=parts, part_template=part_template
+        )
+
+    def initialize_single_part_upload(
+        self,
+        object_key: str,
+        file_size: int,
+        content_type: str,
+        *,
+        part_size: int | None = None,
+    ) -> PresignedPartTransfer | None:
+        """
+        Presign a single object PUT, if the file fits within a single part.
+
+        This requires no multipart upload to be created or completed, but the client must send
+        the PUT with a "Content-Type" header of "content_type". If the file is too large, None is
+        returned and a multipart upload must be used instead. A multipart upload must also be used
+        if the storage can't bound the size of a presigned PUT.
+        """
+        if not self.signs_content_length:
+            return None
+        _, first_part_size = next(self._iter_part_sizes(file_size, part_size))
+        if first_part_size != file_size:
+            return None
+        upload_url = self._generate_presigned_put_url(object_key, file_size, content_type)
+        return PresignedPartTransfer(part_number=1, size=file_size, upload_url=upload_url)
+
+    def presign_parts(
+        self,
+        object_key: str,
+        upload_id: str,
+        file_size: int,
+        first_part_number: int,
+        part_count: int | None = None,
+        *,
+        part_size: int | None = None,
+    ) -> list[PresignedPartTransfer]:
+        """
+        Presign a contiguous range of the parts planned for an upload.
+
+        At most "part_url_window" parts are presigned, and the range is truncated at the last
+        part of the upload. "part_size" must be the same as when the upload was initialized.
+        """
+        part_sizes = self._window_part_sizes(file_size, first_part_number, part_count, part_size)
+        upload_urls = self._generate_presigned_part_urls(object_key, upload_id, part_sizes)
+        return [
+            PresignedPartTransfer(part_number=part_number, size=part_size, upload_url=upload_url)
+            for (part_number, part_size), upload_url in zip(part_sizes, upload_urls)
         ]
-        return PresignedTransfer(object_key=object_key, upload_id=upload_id, parts=parts)
+
+    def presign_part_template(
+        self,
+        object_key: str,
+        upload_id: str,
+        file_size: int,
+        first_part_number: int,
+        part_count: int | None = None,
+        *,
+        part_size: int | None = None,
+    ) -> PresignedPartTemplate | None:
+        """
+        Presign the same parts as "presign_parts", but as a single URL template.
+
+        Part URLs differ only by their part number and signature, so this is much smaller than
+        the full URLs. Every part has the size chosen for the upload, except the last, which has
+        the remainder of "file_size". None is returned if the range is empty, or if the storage's
+        URLs can't be reproduced by SigV4QueryPresigner; "presign_parts" must then be used.
+        """
+        part_sizes = self._window_part_sizes(file_size, first_part_number, part_count, part_size)
+        if not part_sizes:
+            return None
+        first_part_size = part_sizes[0][1]
+        _, presigner = self._part_presigner(
+            object_key, upload_id, first_part_number, first_part_size
+        )
+        if presigner is None:
+            return None
+        return PresignedPartTemplate(
+            upload_url=presigner.url_template(query={"partNumber": "{part_number}"}),
+            first_part_number=first_part_number,
+            signatures=[
+                presigner.signature(
+                    query={"partNumber": str(part_number)},
+                    headers={"Content-Length": str(part_size)},
+                )
+                for part_number, part_size in part_sizes
+            ],
+        )
+
+    def resume_upload(
+        self,
+        object_key: str,
+        upload_id: str,
+        file_size: int,
+        *,
+        part_size: int | None = None,
+    ) -> ResumedTransfer:
+        """
+        Find the parts of an interrupted upload which are already stored, and presign the rest.
+
+        At most "part_url_window" of the missing parts are presigned, so this may need to be
+        called again once those are transferred. "part_size" must be the same as when the upload
+        was initialized.
+        """
+        stored_parts = {part.part_number: part for part in self._list_parts(object_key, upload_id)}
+        transferred_parts: list[TransferredPart] = []
+        missing_part_sizes: list[tuple[int, int]] = []
+        for part_number, size in self._iter_part_sizes(file_size, part_size):
+            stored_part = stored_parts.get(part_number)
+            if stored_part is not None and stored_part.size == size:
+                transferred_parts.append(stored_part)
+            elif len(missing_part_sizes) < self.part_url_window:
+                missing_part_sizes.append((part_number, size))
+        upload_urls = self._generate_presigned_part_urls(object_key, upload_id, missing_part_sizes)
+        return ResumedTransfer(
+            object_key=object_key,
+            upload_id=upload_id,
+            transferred_parts=transferred_parts,
+            parts=[
+                PresignedPartTransfer(
+                    part_number=part_number, size=part_size, upload_url=upload_url
+                )
+                for (part_number, part_size), upload_url in zip(missing_part_sizes, upload_urls)
+            ],
+        )
+
+    def proxy_part(
+        self, object_key: str, upload_id: str, part_number: int, part_size: int, body: BinaryIO
+    ) -> TransferredPart:
+        """
+        Upload a part of "part_size" bytes from "body", for a client which can't reach the storage.
+
+        The part is streamed to its presigned URL, so it's never buffered entirely, and this works
+        for any storage whose part URLs can be presigned.
+        """
+        upload_url = self._generate_presigned_part_url(
+            object_key, upload_id, part_number, part_size
+        )
+        resp = _proxy.put_part(upload_url, part_size, body)
+        if resp.status == 404:
+            raise UploadNotFoundError
+        if resp.status != 200 or "ETag" not in resp.headers:
+            raise PartUploadError(resp.status, resp.data)
+        return TransferredPart(part_number=part_number, size=part_size, etag=resp.headers["ETag"])
+
+    def put_object(
+        self, object_key: str, size: int, content_type: str, body: BinaryIO
+    ) -> FinalizedUpload:
+        """
+        Upload a whole object of "size" bytes from "body", from the server.
+
+        Like "proxy_part", the body is streamed to its presigned URL, so it's never buffered.
+        """
+        upload_url = self._generate_presigned_put_url(object_key, size, content_type)
+        resp = _proxy.put_object(upload_url, size, content_type, body)
+        if resp.status != 200 or "ETag" not in resp.headers:
+            raise ObjectUploadError(resp.status, resp.data)
+        return FinalizedUpload(
+            object_key=object_key, size=size, etag=resp.headers["ETag"].strip('"')
+        )
 
     def complete_upload(self, transferred_parts: TransferredParts) -> PresignedUploadCompletion:
         complete_url = self._generate_presigned_complete_url(transferred_parts)
         body = self._generate_presigned_complete_body(transferred_parts)
         return PresignedUploadCompletion(complete_url=complete_url, body=body)
 
+    def finalize_upload(self, transferred_parts: TransferredParts) -> FinalizedUpload:
+        """
+        Complete an upload directly from the server.
+
+        This saves the client from sending the completion request to the object store itself,
+        and from requesting finalization afterwards.
+        """
+        if not self._signs_part_sizes:
+            self._verify_part_sizes(transferred_parts)
+        etag = self._complete_upload_id(transferred_parts)
+        # The size of each part was either signed or verified, so the object size is known without
+        # querying the object store again
+        size = sum(part.size for part in transferred_parts.parts)
+        return FinalizedUpload(object_key=transferred_parts.object_key, size=size, etag=etag)
+
+    @functools.cached_property
+    def _signs_part_sizes(self) -> bool:
+        # Whether part URLs are presigned with "Content-Length", so the object store refuses parts
+        # of any other size; botocore may fall back to SigV2, which never signs headers
+        if not self.signs_content_length:
+            return False
+        upload_url = self._generate_presigned_part_url("s3ff-part-size", "s3ff-part-size", 1, 1)
+        signed_headers = parse_qs(urlsplit(upload_url).query).get("X-Amz-SignedHeaders", [""])
+        return "content-length" in signed_headers[0].split(";")
+
+    def _verify_part_sizes(self, transferred_parts: TransferredParts) -> None:
+        # A client may have uploaded parts of other sizes than planned, so the stored ones are
+        # checked before they're completed
+        try:
+            stored_parts = self._list_parts(
+                transferred_parts.object_key, transferred_parts.upload_id
+            )
+        except UploadNotFoundError as e:
+            raise UploadCompletionError from e
+        stored_sizes = {part.part_number: part.size for part in stored_parts}
+        if any(stored_sizes.get(part.part_number) != part.size for part in transferred_parts.parts):
+            raise UploadCompletionError("Transferred parts do not match their planned sizes.")
+
+    # Each async method runs its sync counterpart in a shared, bounded thread pool, so the event
+    # loop is never blocked on the object store
+
+    async def ainitialize_upload(
+        self,
+        object_key: str,
+        file_size: int,
+        content_type: str,
+        *,
+        part_size: int | None = None,
+        part_url_template: bool = False,
+    ) -> PresignedTransfer:
+        return await get_storage_executor().run(
+            functools.partial(
+                self.initialize_upload, part_size=part_size, part_url_template=part_url_template
+            ),
+            object_key,
+            file_size,
+            content_type,
+        )
+
+    async def aresume_upload(
+        self,
+        object_key: str,
+        upload_id: str,
+        file_size: int,
+        *,
+        part_size: int | None = None,
+    ) -> ResumedTransfer:
+        return await get_storage_executor().run(
+            functools.partial(self.resume_upload, part_size=part_size),
+            object_key,
+            upload_id,
+            file_size,
+        )
+
+    async def afinalize_upload(self, transferred_parts: TransferredParts) -> FinalizedUpload:
+        return await get_storage_executor().run(self.finalize_upload, transferred_parts)
+
+    async def aget_object_size(self, object_key: str) -> int:
+        return await get_storage_executor().run(self.get_object_size, object_key)
+
+    async def aget_object_metadata(self, object_key: str) -> ObjectMetadata:
+        return await get_storage_executor().run(self.get_object_metadata, object_key)
+
     def _generate_presigned_complete_body(self, transferred_parts: TransferredParts) -> str:
         """
         Generate the body of a presigned completion request.
 
         See https://docs.aws.amazon.com/AmazonS3/latest/API/API_CompleteMultipartUpload.html
         """
-        body = '<?xml version="1.0" encoding="UTF-8"?>'
-        body += '<CompleteMultipartUpload xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
-        for part in transferred_parts.parts:
-            body += "<Part>"
-            body += f"<PartNumber>{part.part_number}</PartNumber>"
-            body += f"<ETag>{part.etag}</ETag>"
-            body += "</Part>"
-        body += "</CompleteMultipartUpload>"
-        return body
+        # Build the body in a single pass, since it may have 10,000 parts
+        return "".join(
+            [
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<CompleteMultipartUpload xmlns="http://s3.amazonaws.com/doc/2006-03-01/">',
+                *(
+                    f"<Part><PartNumber>{part.part_number}</PartNumber>"
+                    f"<ETag>{part.etag}</ETag></Part>"
+                    for part in transferred_parts.parts
+                ),
+                "</CompleteMultipartUpload>",
+            ]
+        )
 
     def test_upload(self) -> None:
         object_key = ".s3-file-field-test-file"
@@ -123,27 +495,56 @@ class MultipartManager:
 
     @classmethod
     def from_storage(cls, storage: Storage) -> MultipartManager:
+        # Resolving and constructing a manager is relatively expensive, and occurs on every
+        # request to the upload views, so managers are memoized for the lifetime of each Storage
         try:
-            from storages.backends.s3 import S3Storage
-        except ImportError:
-            pass
-        else:
-            if isinstance(storage, S3Storage):
-                from ._multipart_s3 import S3MultipartManager
+            multipart_manager = _registry._multipart_managers[storage]
+        except KeyError:
+            multipart_manager = _registry._multipart_managers[storage] = cls._resolve(storage)
+        if multipart_manager is None:
+            raise UnsupportedStorageError
+        return multipart_manager
+
+    @classmethod
+    def _resolve(cls, storage: Storage) -> MultipartManager | None:
+        for storage_class, manager_class in itertools.chain(
+            _registry.iter_multipart_manager_classes(), _builtin_manager_classes()
+        ):
+            if isinstance(storage, storage_class):
+                multipart_manager = manager_class(storage)
+                if storage in _registry._part_size_policies:
+                    multipart_manager.part_size_policy = _registry._part_size_policies[storage]
+                return multipart_manager
+        return None
 
-                return S3MultipartManager(storage)
+    @classmethod
+    def _request_errors(cls) -> tuple[type[Exception], ...]:
+        # The request errors of every supported object store, as the Storage may not be known
+        return tuple(
+            itertools.chain.from_iterable(
+                manager_class.request_errors
+                for _, manager_class in itertools.chain(
+                    _registry.iter_multipart_manager_classes(), _builtin_manager_classes()
+                )
+            )
+        )
 
-        try:
-            from minio_storage.storage import MinioStorage
-        except ImportError:
-            pass
-        else:
-            if isinstance(storage, MinioStorage):
-                from ._multipart_minio import MinioMultipartManager
+    @classmethod
+    def register(
+        cls, storage_class: type[Storage]
+    ) -> Callable[[MultipartManagerType], MultipartManagerType]:
+        """
+        Return a class decorator, registering a MultipartManager subclass for a Storage class.
+
+        Registrations take precedence over any made earlier, and over the built-in support for
+        S3Storage and MinioStorage.
+        """
 
-                return MinioMultipartManager(storage)
+        def decorator(manager_class: MultipartManagerType) -> MultipartManagerType:
+            _registry.register_multipart_manager(storage_class, manager_class)
+            return manager_class
 
-        raise UnsupportedStorageError
+        return decorator
 
     @classmethod
     def supported_storage(cls, storage: Storage) -> bool:
@@ -162,11 +563,48 @@ class MultipartManager:
         self,
         object_key: str,
         content_type: str,
+        headers: Mapping[str, str] | None = None,
     ) -> str:
-        # Require content headers here
+        # Require content headers here; any other "headers" are from an ObjectMetadata to copy
         raise NotImplementedError
 
     def _abort_upload_id(self, object_key: str, upload_id: str) -> None:
+        # Raise UploadNotFoundError if the upload was already completed or aborted
+        raise NotImplementedError
+
+    def _iter_uploads(self, prefix: str) -> Iterator[PendingUpload]:
+        # Iterate over every incomplete upload in the bucket with an object key starting with
+        # "prefix", fetching them a page at a time
+        raise NotImplementedError
+
+    def _complete_upload_id(self, transferred_parts: TransferredParts) -> str:
+        # Return the ETag of the new object, without quotes
+        raise NotImplementedError
+
+    def _list_parts(self, object_key: str, upload_id: str) -> list[TransferredPart]:
+        # Return every part which is stored for the upload; raise UploadNotFoundError if the
+        # upload was already completed or aborted
+        raise NotImplementedError
+
+    def _upload_part(self, object_key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        # Upload a part from the server, and return its ETag, with quotes
+        raise NotImplementedError
+
+    def _can_copy_from(self, source: MultipartManager) -> bool:
+        # Whether the object store of this can read objects from "source" itself
+        return False
+
+    def _copy_part(
+        self,
+        object_key: str,
+        upload_id: str,
+        part_number: int,
+        source: MultipartManager,
+        source_key: str,
+        byte_range: tuple[int, int],
+    ) -> str:
+        # Copy the inclusive "byte_range" of an object in "source" to a part, without transferring
+        # it through the server, and return its ETag, with quotes
         raise NotImplementedError
 
     def _generate_presigned_part_url(
@@ -174,30 +612,112 @@ class MultipartManager:
     ) -> str:
         raise NotImplementedError
 
-    def _generate_presigned_complete_url(self, transferred_parts: TransferredParts) -> str:
+    def _generate_presigned_put_url(
+        self, object_key: str, file_size: int, content_type: str
+    ) -> str:
         raise NotImplementedError
 
-    def get_object_size(self, object_key: str) -> int:
+    def _generate_presigned_part_urls(
+        self, object_key: str, upload_id: str, part_sizes: list[tuple[int, int]]
+    ) -> list[str]:
+        """
+        Presign the URLs for many parts of the same upload.
+
+        Only the first part is presigned by the storage's own client. The URLs for the other parts
+        are derived from it by SigV4QueryPresigner, which is much faster, unless it's unable to
+        reproduce the first URL exactly.
+        """
+        if not part_sizes:
+            return []
+        (first_part_number, first_part_size), *other_part_sizes = part_sizes
+        reference_url, presigner = self._part_presigner(
+            object_key, upload_id, first_part_number, first_part_size
+        )
+        if presigner is None:
+            return [
+                reference_url,
+                *(
+                    self._generate_presigned_part_url(object_key, upload_id, part_number, part_size)
+                    for part_number, part_size in other_part_sizes
+                ),
+            ]
+        return [
+            reference_url,
+            *(
+                presigner.presign(
+                    query={"partNumber": str(part_number)},
+                    headers={"Content-Length": str(part_size)},
+                )
+                for part_number, part_size in other_part_sizes
+            ),
+        ]
+
+    def _part_presigner(
+        self, object_key: str, upload_id: str, part_number: int, part_size: int
+    ) -> tuple[str, SigV4QueryPresigner | None]:
+        """
+        Presign a part URL with the storage's own client, and make a presigner from it.
+
+        The presigner is None if it's unable to reproduce the URL exactly.
+        """
+        reference_url = self._generate_presigned_part_url(
+            object_key, upload_id, part_number, part_size
+        )
+        secret_key = self._get_signing_secret_key()
+        if secret_key is None:
+            return reference_url, None
+        try:
+            presigner = SigV4QueryPresigner(
+                reference_url,
+                method="PUT",
+                secret_key=secret_key,
+                headers={"Content-Length": str(part_size)},
+            )
+        except PresignError:
+            return reference_url, None
+        return reference_url, presigner
+
+    def _get_signing_secret_key(self) -> str | None:
+        """Return the secret key used to presign URLs, if it's available."""
+        return None
+
+    def _get_credentials_expiry(self) -> float | None:
+        """Return when the credentials used to presign URLs expire, if it's known."""
+        return None
+
+    def _generate_presigned_complete_url(self, transferred_parts: TransferredParts) -> str:
         raise NotImplementedError
 
-    @classmethod
-    def _iter_part_sizes(cls, file_size: int) -> Iterator[tuple[int, int]]:
-        part_size = cls.part_size
+    def get_object_size(self, object_key: str) -> int:
+        return self.get_object_metadata(object_key).size
 
-        # 10k is the maximum number of allowed parts allowed by S3
-        max_parts = 10_000
-        if math.ceil(file_size / part_size) >= max_parts:
-            part_size = math.ceil(file_size / max_parts)
+    def get_object_metadata(self, object_key: str) -> ObjectMetadata:
+        raise NotImplementedError
 
-        # 5MB is the minimum part size allowed by S3
-        min_part_size = mb(5)
-        if part_size < min_part_size:
-            part_size = min_part_size
+    def _window_part_sizes(
+        self,
+        file_size: int,
+        first_part_number: int,
+        part_count: int | None,
+        part_size: int | None,
+    ) -> list[tuple[int, int]]:
+        # At most "part_url_window" parts, truncated at the last part of the upload
+        part_count = (
+            self.part_url_window if part_count is None else min(part_count, self.part_url_window)
+        )
+        return list(
+            itertools.islice(
+                self._iter_part_sizes(file_size, part_size),
+                first_part_number - 1,
+                first_part_number - 1 + part_count,
+            )
+        )
 
-        # 5GB is the maximum part size allowed by S3
-        max_part_size = gb(5)
-        if part_size > max_part_size:
-            part_size = max_part_size
+    @classmethod
+    def _iter_part_sizes(
+        cls, file_size: int, part_size: int | None = None
+    ) -> Iterator[tuple[int, int]]:
+        part_size = clamp_part_size(file_size, cls.part_size if part_size is None else part_size)
 
         remaining_file_size = file_size
         part_num = 1
@@ -212,3 +732,84 @@ class MultipartManager:
             remaining_file_size -= part_size
 
     # TODO: key name encoding...
+
+
+class CreatedUploads:
+    """
+    The multipart uploads created for a set of transfers, which are aborted if any transfer fails.
+
+    Used as a context manager, every upload created within the block is aborted if it raises, and
+    then the error is re-raised. Errors from aborting are ignored, since the original error is more
+    useful, and an upload which was already completed or aborted cannot be aborted again.
+    """
+
+    def __init__(self, executor: StorageExecutor | None = None) -> None:
+        # Uploads are aborted concurrently through "executor", or else one at a time
+        self._executor = executor
+        # Appending is atomic, so uploads may be created concurrently from worker threads
+        self._aborts: list[Callable[[], None]] = []
+
+    def __enter__(self) -> CreatedUploads:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *args: Any) -> None:
+        if exc_type is not None:
+            self.abort()
+
+    def create_upload_id(
+        self,
+        multipart_manager: MultipartManager,
+        object_key: str,
+        content_type: str,
+        headers: Mapping[str, str] | None = None,
+    ) -> str:
+        upload_id = multipart_manager._create_upload_id(object_key, content_type, headers)
+        self.add_upload(multipart_manager, object_key, upload_id)
+        return upload_id
+
+    def add_upload(
+        self, multipart_manager: MultipartManager, object_key: str, upload_id: str
+    ) -> None:
+        self.on_abort(functools.partial(multipart_manager._abort_upload_id, object_key, upload_id))
+
+    def on_abort(self, abort: Callable[[], None]) -> None:
+        """Call "abort" too, such as to delete an object uploaded without a multipart upload."""
+        self._aborts.append(abort)
+
+    def abort(self) -> None:
+        aborts, self._aborts = self._aborts, []
+        if self._executor is None:
+            for abort in aborts:
+                _call_ignoring_errors(abort)
+        else:
+            self._executor.map(_call_ignoring_errors, aborts)
+
+
+def _call_ignoring_errors(func: Callable[[], None]) -> None:
+    with contextlib.suppress(Exception):
+        func()
+
+
+@functools.lru_cache(maxsize=1)
+def _builtin_manager_classes() -> list[tuple[type[Storage], type[MultipartManager]]]:
+    # Each Storage is an optional dependency, so only those which can be imported are supported
+    manager_classes: list[tuple[type[Storage], type[MultipartManager]]] = []
+    try:
+        from storages.backends.s3 import S3Storage
+    except ImportError:
+        pass
+    else:
+        from ._multipart_s3 import S3MultipartManager
+
+        manager_classes.append((S3Storage, S3MultipartManager))
+
+    try:
+        from minio_storage.storage import MinioStorage
+    except ImportError:
+        pass
+    else:
+        from ._multipart_minio import MinioMultipartManager
+
+        manager_classes.append((MinioStorage, MinioMultipartManager))
+
+    return manager_classes
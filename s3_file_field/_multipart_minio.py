@@ -1,10 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import timezone
+from typing import TYPE_CHECKING, Iterator, Mapping, cast
+from urllib.parse import quote
 
 import minio
+from minio.datatypes import Part
+from minio.error import MinioException
+import urllib3
 
-from ._multipart import MultipartManager, ObjectNotFoundError, TransferredParts
+from ._multipart import (
+    MultipartManager,
+    ObjectMetadata,
+    ObjectNotFoundError,
+    PendingUpload,
+    TransferredPart,
+    TransferredParts,
+    UploadCompletionError,
+    UploadNotFoundError,
+    _copied_headers,
+)
 from ._sizes import tb
 
 if TYPE_CHECKING:
@@ -14,6 +29,10 @@ if TYPE_CHECKING:
 class MinioMultipartManager(MultipartManager):
     # MinIO limits: https://min.io/docs/minio/container/operations/checklists/thresholds.html
     max_object_size = tb(50)
+    # The MinIO client doesn't presign any headers
+    signs_content_length = False
+    # MinIO raises the errors of urllib3 for failed connections
+    request_errors = (MinioException, urllib3.exceptions.HTTPError)
 
     def __init__(self, storage: MinioStorage):
         self._client: minio.Minio = storage.client
@@ -26,22 +45,139 @@ class MinioMultipartManager(MultipartManager):
         self,
         object_key: str,
         content_type: str,
+        headers: Mapping[str, str] | None = None,
     ) -> str:
         return self._client._create_multipart_upload(
             bucket_name=self._bucket_name,
             object_name=object_key,
             headers={
+                **(headers or {}),
                 "Content-Type": content_type,
             },
             # TODO: filename in headers
         )
 
     def _abort_upload_id(self, object_key: str, upload_id: str) -> None:
-        self._client._abort_multipart_upload(
+        try:
+            self._client._abort_multipart_upload(
+                bucket_name=self._bucket_name,
+                object_name=object_key,
+                upload_id=upload_id,
+            )
+        except minio.S3Error as e:
+            if e.code == "NoSuchUpload":
+                raise UploadNotFoundError from e
+            raise
+
+    def _iter_uploads(self, prefix: str) -> Iterator[PendingUpload]:
+        key_marker: str | None = None
+        upload_id_marker: str | None = None
+        while True:
+            result = self._client._list_multipart_uploads(  # type: ignore[attr-defined]
+                bucket_name=self._bucket_name,
+                key_marker=key_marker,
+                prefix=prefix,
+                upload_id_marker=upload_id_marker,
+            )
+            for upload in result.uploads:
+                if upload.upload_id is None or upload.initiated_time is None:
+                    continue
+                yield PendingUpload(
+                    object_key=upload.object_name,
+                    upload_id=upload.upload_id,
+                    initiated=upload.initiated_time,
+                )
+            if not result.is_truncated or not result.uploads:
+                return
+            # MinIO doesn't parse "NextUploadIdMarker", so continue after the last upload instead
+            key_marker = result.uploads[-1].object_name
+            upload_id_marker = result.uploads[-1].upload_id
+
+    def _complete_upload_id(self, transferred_parts: TransferredParts) -> str:
+        try:
+            result = self._client._complete_multipart_upload(
+                bucket_name=self._bucket_name,
+                object_name=transferred_parts.object_key,
+                upload_id=transferred_parts.upload_id,
+                # MinIO adds its own quotes around ETags
+                parts=[
+                    Part(part_number=part.part_number, etag=part.etag.strip('"'))
+                    for part in transferred_parts.parts
+                ],
+            )
+        except minio.S3Error as e:
+            raise UploadCompletionError from e
+        if result.etag is None:
+            raise RuntimeError("MinIO did not return an ETag for object.", result.object_name)
+        return result.etag
+
+    def _list_parts(self, object_key: str, upload_id: str) -> list[TransferredPart]:
+        parts: list[TransferredPart] = []
+        part_number_marker: str | None = None
+        while True:
+            try:
+                result = self._client._list_parts(
+                    bucket_name=self._bucket_name,
+                    object_name=object_key,
+                    upload_id=upload_id,
+                    part_number_marker=part_number_marker,
+                )
+            except minio.S3Error as e:
+                if e.code == "NoSuchUpload":
+                    raise UploadNotFoundError from e
+                raise
+            parts.extend(
+                # MinIO removes the quotes around ETags, but clients receive them from part uploads
+                TransferredPart(part_number=part.part_number, size=part.size, etag=f'"{part.etag}"')
+                for part in result.parts
+                if part.size is not None
+            )
+            if not result.is_truncated:
+                return parts
+            part_number_marker = result.next_part_number_marker
+
+    def _upload_part(self, object_key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        etag = self._client._upload_part(  # type: ignore[attr-defined]
             bucket_name=self._bucket_name,
             object_name=object_key,
+            data=data,
+            headers=None,
             upload_id=upload_id,
+            part_number=part_number,
         )
+        # MinIO removes the quotes around ETags
+        return f'"{etag}"'
+
+    def _can_copy_from(self, source: MultipartManager) -> bool:
+        if not isinstance(source, MinioMultipartManager):
+            return False
+        # Only buckets of the same server can be copied between
+        base_url = self._client._base_url  # type: ignore[attr-defined]
+        return source._client._base_url.host == base_url.host  # type: ignore[attr-defined]
+
+    def _copy_part(
+        self,
+        object_key: str,
+        upload_id: str,
+        part_number: int,
+        source: MultipartManager,
+        source_key: str,
+        byte_range: tuple[int, int],
+    ) -> str:
+        source_bucket_name = cast(MinioMultipartManager, source)._bucket_name
+        etag, _ = self._client._upload_part_copy(  # type: ignore[attr-defined]
+            bucket_name=self._bucket_name,
+            object_name=object_key,
+            upload_id=upload_id,
+            part_number=part_number,
+            headers={
+                # As MinIO's own "CopySource" encodes it
+                "x-amz-copy-source": quote(f"/{source_bucket_name}/{source_key}"),
+                "x-amz-copy-source-range": f"bytes={byte_range[0]}-{byte_range[1]}",
+            },
+        )
+        # MinIO removes the quotes around ETags
+        return f'"{etag}"'
 
     def _generate_presigned_part_url(
         self, object_key: str, upload_id: str, part_number: int, part_size: int
@@ -60,6 +196,34 @@ class MinioMultipartManager(MultipartManager):
             },
         )
 
+    def _generate_presigned_put_url(
+        self, object_key: str, file_size: int, content_type: str
+    ) -> str:
+        # MinIO does not presign any headers, so "Content-Type" is taken from the PUT request, and
+        # this is only used to upload objects from the server
+        return self._signing_client.get_presigned_url(
+            method="PUT",
+            bucket_name=self._bucket_name,
+            object_name=object_key,
+            expires=self._url_expiration,
+        )
+
+    def _get_signing_secret_key(self) -> str | None:
+        provider = self._signing_client._provider
+        if provider is None:
+            return None
+        return provider.retrieve().secret_key
+
+    def _get_credentials_expiry(self) -> float | None:
+        provider = self._signing_client._provider
+        if provider is None:
+            return None
+        expiration = provider.retrieve().expiration
+        if expiration is None:
+            return None
+        # MinIO converts expirations to naive UTC
+        return expiration.replace(tzinfo=timezone.utc).timestamp()
+
     def _generate_presigned_complete_url(self, transferred_parts: TransferredParts) -> str:
         return self._signing_client.get_presigned_url(
             method="POST",
@@ -71,7 +235,7 @@ class MinioMultipartManager(MultipartManager):
             },
         )
 
-    def get_object_size(self, object_key: str) -> int:
+    def get_object_metadata(self, object_key: str) -> ObjectMetadata:
         try:
             stats = self._client.stat_object(bucket_name=self._bucket_name, object_name=object_key)
         except minio.S3Error as e:
@@ -80,4 +244,10 @@ class MinioMultipartManager(MultipartManager):
             raise
         if stats.size is None:
             raise RuntimeError("MinIO did not return a size for object.", object_key)
-        return stats.size
+        return ObjectMetadata(
+            size=stats.size,
+            # MinIO removes the quotes around ETags
+            etag=stats.etag or "",
+            content_type=stats.content_type or "",
+            headers=_copied_headers(stats.metadata or {}),
+        )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterator, Mapping, cast
+from urllib.parse import urlsplit
 
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
 
 from ._sizes import tb
 
@@ -11,12 +12,32 @@ if TYPE_CHECKING:
     import mypy_boto3_s3 as s3
     from storages.backends.s3 import S3Storage
 
-from ._multipart import MultipartManager, ObjectNotFoundError, TransferredParts
+from ._multipart import (
+    MultipartManager,
+    ObjectMetadata,
+    ObjectNotFoundError,
+    PendingUpload,
+    TransferredPart,
+    TransferredParts,
+    UploadCompletionError,
+    UploadNotFoundError,
+    _copied_headers,
+)
+
+# The parameters of CreateMultipartUpload for each copied header, besides user-defined metadata
+_HEADER_PARAMS = {
+    "cache-control": "CacheControl",
+    "content-disposition": "ContentDisposition",
+    "content-encoding": "ContentEncoding",
+    "content-language": "ContentLanguage",
+    "expires": "Expires",
+}
 
 
 class S3MultipartManager(MultipartManager):
     # S3 multipart limits: https://docs.aws.amazon.com/AmazonS3/latest/dev/qfacts.html
     max_object_size = tb(5)
+    request_errors = (BotoCoreError, ClientError)
 
     def __init__(self, storage: S3Storage) -> None:
         resource: s3.ServiceResource = storage.connection
@@ -27,11 +48,22 @@ class S3MultipartManager(MultipartManager):
         self,
         object_key: str,
         content_type: str,
+        headers: Mapping[str, str] | None = None,
     ) -> str:
+        header_params: dict[str, Any] = {}
+        metadata: dict[str, str] = {}
+        for name, value in (headers or {}).items():
+            if name.startswith("x-amz-meta-"):
+                metadata[name.removeprefix("x-amz-meta-")] = value
+            else:
+                header_params[_HEADER_PARAMS[name]] = value
+        if metadata:
+            header_params["Metadata"] = metadata
         resp = self._client.create_multipart_upload(
             Bucket=self._bucket_name,
             Key=object_key,
             ContentType=content_type,
+            **header_params,
             # TODO: filename in Metadata
             # TODO: ensure ServerSideEncryption is set, even if not specified
             # TODO: use client._get_write_parameters?
@@ -39,11 +71,104 @@ class S3MultipartManager(MultipartManager):
         return resp["UploadId"]
 
     def _abort_upload_id(self, object_key: str, upload_id: str) -> None:
-        self._client.abort_multipart_upload(
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=object_key,
+                UploadId=upload_id,
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                raise UploadNotFoundError from e
+            raise
+
+    def _iter_uploads(self, prefix: str) -> Iterator[PendingUpload]:
+        paginator = self._client.get_paginator("list_multipart_uploads")
+        for page in paginator.paginate(Bucket=self._bucket_name, Prefix=prefix):
+            for upload in page.get("Uploads", []):
+                yield PendingUpload(
+                    object_key=upload["Key"],
+                    upload_id=upload["UploadId"],
+                    initiated=upload["Initiated"],
+                )
+
+    def _complete_upload_id(self, transferred_parts: TransferredParts) -> str:
+        try:
+            resp = self._client.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=transferred_parts.object_key,
+                UploadId=transferred_parts.upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": part.part_number, "ETag": part.etag}
+                        for part in transferred_parts.parts
+                    ]
+                },
+            )
+        except ClientError as e:
+            raise UploadCompletionError from e
+        return resp["ETag"].strip('"')
+
+    def _list_parts(self, object_key: str, upload_id: str) -> list[TransferredPart]:
+        paginator = self._client.get_paginator("list_parts")
+        try:
+            return [
+                TransferredPart(
+                    part_number=part["PartNumber"], size=part["Size"], etag=part["ETag"]
+                )
+                for page in paginator.paginate(
+                    Bucket=self._bucket_name, Key=object_key, UploadId=upload_id
+                )
+                for part in page.get("Parts", [])
+            ]
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                raise UploadNotFoundError from e
+            raise
+
+    def _upload_part(self, object_key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        resp = self._client.upload_part(
             Bucket=self._bucket_name,
             Key=object_key,
             UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
         )
+        return resp["ETag"]
+
+    def _can_copy_from(self, source: MultipartManager) -> bool:
+        if not isinstance(source, S3MultipartManager):
+            return False
+        endpoint_url = self._client.meta.endpoint_url
+        source_endpoint_url = source._client.meta.endpoint_url
+        # AWS copies between the regions of a partition, which each have their own endpoint
+        return endpoint_url == source_endpoint_url or (
+            _is_aws_endpoint(endpoint_url)
+            and _is_aws_endpoint(source_endpoint_url)
+            and self._client.meta.partition == source._client.meta.partition
+        )
+
+    def _copy_part(
+        self,
+        object_key: str,
+        upload_id: str,
+        part_number: int,
+        source: MultipartManager,
+        source_key: str,
+        byte_range: tuple[int, int],
+    ) -> str:
+        resp = self._client.upload_part_copy(
+            Bucket=self._bucket_name,
+            Key=object_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            CopySource={
+                "Bucket": cast(S3MultipartManager, source)._bucket_name,
+                "Key": source_key,
+            },
+            CopySourceRange=f"bytes={byte_range[0]}-{byte_range[1]}",
+        )
+        return resp["CopyPartResult"]["ETag"]
 
     def _generate_presigned_part_url(
         self, object_key: str, upload_id: str, part_number: int, part_size: int
@@ -60,6 +185,35 @@ class S3MultipartManager(MultipartManager):
             ExpiresIn=int(self._url_expiration.total_seconds()),
         )
 
+    def _generate_presigned_put_url(
+        self, object_key: str, file_size: int, content_type: str
+    ) -> str:
+        return self._client.generate_presigned_url(
+            ClientMethod="put_object",
+            Params={
+                "Bucket": self._bucket_name,
+                "Key": object_key,
+                "ContentLength": file_size,
+                "ContentType": content_type,
+            },
+            ExpiresIn=int(self._url_expiration.total_seconds()),
+        )
+
+    def _get_signing_secret_key(self) -> str | None:
+        # This is a private API of botocore, but resolves credentials as signing itself does
+        credentials = self._client._get_credentials()  # type: ignore[attr-defined]
+        if credentials is None:
+            return None
+        return credentials.get_frozen_credentials().secret_key
+
+    def _get_credentials_expiry(self) -> float | None:
+        credentials = self._client._get_credentials()  # type: ignore[attr-defined]
+        # Only the temporary credentials which botocore refreshes have a known expiry
+        expiry_time = getattr(credentials, "_expiry_time", None)
+        if expiry_time is None:
+            return None
+        return expiry_time.timestamp()
+
     def _generate_presigned_complete_url(self, transferred_parts: TransferredParts) -> str:
         return self._client.generate_presigned_url(
             ClientMethod="complete_multipart_upload",
@@ -71,12 +225,22 @@ class S3MultipartManager(MultipartManager):
             ExpiresIn=int(self._url_expiration.total_seconds()),
         )
 
-    def get_object_size(self, object_key: str) -> int:
+    def get_object_metadata(self, object_key: str) -> ObjectMetadata:
         try:
             stats = self._client.head_object(
                 Bucket=self._bucket_name,
                 Key=object_key,
             )
-            return stats["ContentLength"]
         except ClientError as e:
             raise ObjectNotFoundError from e
+        return ObjectMetadata(
+            size=stats["ContentLength"],
+            etag=stats["ETag"].strip('"'),
+            content_type=stats["ContentType"],
+            headers=_copied_headers(stats["ResponseMetadata"]["HTTPHeaders"]),
+        )
+
+
+def _is_aws_endpoint(endpoint_url: str) -> bool:
+    hostname = urlsplit(endpoint_url).hostname or ""
+    return hostname.endswith((".amazonaws.com", ".amazonaws.com.cn"))
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import math
+from typing import ClassVar
+
+from s3_file_field._sizes import gb, mb
+
+
+def clamp_part_size(file_size: int, part_size: int) -> int:
+    """Adjust a part size to the S3 limits for an upload of "file_size"."""
+    # 10k is the maximum number of allowed parts allowed by S3
+    max_parts = 10_000
+    if math.ceil(file_size / part_size) >= max_parts:
+        part_size = math.ceil(file_size / max_parts)
+
+    # 5MB is the minimum part size allowed by S3
+    min_part_size = mb(5)
+    if part_size < min_part_size:
+        part_size = min_part_size
+
+    # 5GB is the maximum part size allowed by S3
+    max_part_size = gb(5)
+    if part_size > max_part_size:
+        part_size = max_part_size
+
+    return part_size
+
+
+@dataclass
+class PartSizeHints:
+    """Optional information from a client about how it will upload."""
+
+    # The client's measured upload throughput, in bytes per second
+    bandwidth: int | None = None
+    # The number of parts the client will upload concurrently
+    parallelism: int | None = None
+    # The number of bytes the client may buffer for the parts it's uploading
+    memory_budget: int | None = None
+
+
+class PartSizePolicy:
+    """Chooses the size of the parts of each multipart upload."""
+
+    # Reported to clients, to identify the policy
+    name: ClassVar[str]
+
+    def choose_part_size(self, file_size: int, hints: PartSizeHints | None = None) -> int:
+        """Return the size of the parts for an upload, within the S3 limits."""
+        return clamp_part_size(
+            file_size, self.preferred_part_size(file_size, hints or PartSizeHints())
+        )
+
+    def preferred_part_size(self, file_size: int, hints: PartSizeHints) -> int:
+        raise NotImplementedError
+
+
+@dataclass
+class FixedPartSizePolicy(PartSizePolicy):
+    """Use the same part size for every upload, regardless of hints."""
+
+    name = "fixed"
+
+    part_size: int
+
+    def preferred_part_size(self, file_size: int, hints: PartSizeHints) -> int:
+        return self.part_size
+
+
+@dataclass
+class AdaptivePartSizePolicy(PartSizePolicy):
+    """
+    Use the largest parts which are still cheap to retry, to minimize the number of requests.
+
+    A part should transfer within "max_part_duration" at the client's bandwidth (or else be no
+    larger than "default_part_size", if the bandwidth is unknown). Parts are also limited so that
+    the client's concurrent parts fit within its memory budget, and so that there are enough parts
+    to keep every concurrent connection busy.
+    """
+
+    name = "adaptive"
+
+    default_part_size: int = mb(64)
+    max_part_size: int = gb(1)
+    max_part_duration: timedelta = timedelta(minutes=1)
+
+    def preferred_part_size(self, file_size: int, hints: PartSizeHints) -> int:
+        parallelism = hints.parallelism or 1
+        if hints.bandwidth is None:
+            part_size = self.default_part_size
+        else:
+            # Concurrent parts share the client's bandwidth
+            part_size = math.floor(
+                hints.bandwidth / parallelism * self.max_part_duration.total_seconds()
+            )
+        part_size = min(part_size, self.max_part_size)
+        if hints.memory_budget is not None:
+            part_size = min(part_size, hints.memory_budget // parallelism)
+        if hints.parallelism is not None:
+            part_size = min(part_size, math.ceil(file_size / parallelism))
+        # Round down to whole megabytes; S3 limits are applied afterwards
+        return max(part_size // mb(1), 1) * mb(1)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+from s3_file_field._concurrency import get_storage_executor
+from s3_file_field._multipart import MultipartManager, ObjectMetadata, ObjectNotFoundError
+from s3_file_field.fields import S3FieldFile, S3FileField
+
+if TYPE_CHECKING:
+    from django.db import models
+
+
+def _get_object_metadata(manager: MultipartManager, object_key: str) -> ObjectMetadata | None:
+    try:
+        return manager.get_object_metadata(object_key)
+    except ObjectNotFoundError:
+        return None
+
+
+def prefetch_s3_metadata(model_instances: Iterable[models.Model], *field_names: str) -> None:
+    """
+    Fetch the object metadata of the S3FileFields of "model_instances", concurrently.
+
+    Like Django's "prefetch_related_objects", this is typically called with a page of objects,
+    before rendering it. The size of each S3FieldFile, and whether its object exists, are then
+    available without a request. Only "field_names" are prefetched, if given, and otherwise every
+    S3FileField of each model.
+    """
+    field_files_by_object: dict[tuple[int, str], list[S3FieldFile]] = {}
+    managers: dict[int, MultipartManager] = {}
+    for instance in model_instances:
+        for field in instance._meta.get_fields():
+            if not isinstance(field, S3FileField) or (
+                field_names and field.name not in field_names
+            ):
+                continue
+            # Avoid querying deferred fields
+            if field.attname not in instance.__dict__:
+                continue
+            field_file = getattr(instance, field.attname)
+            # Uncommitted files aren't in the storage yet
+            if not field_file.name or not field_file._committed:
+                continue
+            storage = field_file.storage
+            if id(storage) not in managers:
+                if not MultipartManager.supported_storage(storage):
+                    continue
+                managers[id(storage)] = MultipartManager.from_storage(storage)
+            # Objects referenced by several instances are only requested once
+            field_files_by_object.setdefault((id(storage), field_file.name), []).append(field_file)
+
+    all_metadata = get_storage_executor().map(
+        lambda storage_object: _get_object_metadata(managers[storage_object[0]], storage_object[1]),
+        field_files_by_object,
+    )
+    for field_files, metadata in zip(field_files_by_object.values(), all_metadata):
+        for field_file in field_files:
+            field_file._prefetched_metadata = metadata
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import functools
+import threading
+from typing import TYPE_CHECKING, BinaryIO
+
+from django.conf import settings
+
+if TYPE_CHECKING:
+    import urllib3
+
+
+def upload_proxy_enabled() -> bool:
+    return getattr(settings, "S3FF_UPLOAD_PROXY", False)
+
+
+@functools.lru_cache(maxsize=1)
+def get_proxy_pool() -> urllib3.PoolManager:
+    # urllib3 is installed with the client of every supported object store, but isn't a
+    # requirement of this package
+    import urllib3
+
+    # Parts are large, but a stalled client or object store shouldn't hold a worker forever
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=10, read=60),
+        retries=False,
+        # Every transfer thread and proxied part may upload at once
+        maxsize=(
+            getattr(settings, "S3FF_TRANSFER_MAX_WORKERS", 16)
+            + getattr(settings, "S3FF_UPLOAD_PROXY_MAX_CONCURRENCY", 8)
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_proxy_semaphore() -> threading.BoundedSemaphore:
+    # Each proxied part holds a worker thread for its whole transfer, so this is per process
+    return threading.BoundedSemaphore(getattr(settings, "S3FF_UPLOAD_PROXY_MAX_CONCURRENCY", 8))
+
+
+def _put(upload_url: str, body: BinaryIO, headers: dict[str, str]) -> urllib3.BaseHTTPResponse:
+    # With an explicit "Content-Length", the body is read and sent in blocks, not chunked
+    return get_proxy_pool().request("PUT", upload_url, body=body, headers=headers, redirect=False)
+
+
+def put_part(upload_url: str, part_size: int, body: BinaryIO) -> urllib3.BaseHTTPResponse:
+    """Send "body" to a presigned part URL, streaming it rather than buffering it."""
+    return _put(upload_url, body, {"Content-Length": str(part_size)})
+
+
+def put_object(
+    upload_url: str, size: int, content_type: str, body: BinaryIO
+) -> urllib3.BaseHTTPResponse:
+    """Send "body" to a presigned object URL, streaming it rather than buffering it."""
+    # Both headers may be presigned, so must match exactly
+    return _put(upload_url, body, {"Content-Length": str(size), "Content-Type": content_type})
@@ -2,20 +2,29 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Iterator
 import warnings
-from weakref import WeakValueDictionary
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from django.core.files.storage import Storage
 
 if TYPE_CHECKING:
     # Avoid circular imports
+    from ._multipart import MultipartManager
+    from ._part_size_policy import PartSizePolicy
     from .fields import S3FileField
 
     FieldsDictType = WeakValueDictionary[str, S3FileField]
     StoragesDictType = WeakValueDictionary[int, Storage]
+    # A value of None indicates that the Storage is not supported
+    MultipartManagersDictType = WeakKeyDictionary[Storage, MultipartManager | None]
+    PartSizePoliciesDictType = WeakKeyDictionary[Storage, PartSizePolicy | None]
 
 
 _fields: FieldsDictType = WeakValueDictionary()
 _storages: StoragesDictType = WeakValueDictionary()
+_multipart_managers: MultipartManagersDictType = WeakKeyDictionary()
+# The "part_size_policy" set on the MultipartManager of each Storage, kept for its new manager
+_part_size_policies: PartSizePoliciesDictType = WeakKeyDictionary()
+_multipart_manager_classes: list[tuple[type[Storage], type[MultipartManager]]] = []
 
 
 def register_field(field: S3FileField) -> None:
@@ -49,3 +58,20 @@ def iter_fields() -> Iterator[S3FileField]:
 def iter_storages() -> Iterator[Storage]:
     """Iterate over the unique Storage instances used by S3FileFields."""
     return _storages.values()
+
+
+def register_multipart_manager(
+    storage_class: type[Storage], manager_class: type[MultipartManager]
+) -> None:
+    """Use a MultipartManager subclass for all instances of a Storage class."""
+    _multipart_manager_classes.append((storage_class, manager_class))
+    for storage, multipart_manager in _multipart_managers.items():
+        if multipart_manager is not None and "part_size_policy" in vars(multipart_manager):
+            _part_size_policies[storage] = multipart_manager.part_size_policy
+    # Any Storage might now be managed differently
+    _multipart_managers.clear()
+
+
+def iter_multipart_manager_classes() -> Iterator[tuple[type[Storage], type[MultipartManager]]]:
+    """Iterate over the registered MultipartManager subclasses, most recently registered first."""
+    return reversed(_multipart_manager_classes)
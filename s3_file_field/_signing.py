@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import base64
+import functools
+import hashlib
+import hmac
+import json
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core import signing
+
+# Each kind of token has its own salt, so one can't be substituted for the other
+_UPLOAD_SIGNATURE_SALT = "s3_file_field.upload_signature"
+_FIELD_VALUE_SALT = "s3_file_field.field_value"
+_PART_PROXY_TOKEN_SALT = "s3_file_field.part_proxy_token"
+
+_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_json_decoder = json.JSONDecoder()
+
+
+def _b64_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class _TokenSigner:
+    """
+    Sign and verify the payloads of S3FF tokens.
+
+    Like Django's Signer, this uses an HMAC-SHA256 keyed by the salt and SECRET_KEY, and also
+    accepts signatures made with any of SECRET_KEY_FALLBACKS. Unlike Django's Signer, the keys are
+    derived only once, and tokens have no timestamp, which S3FF never checked.
+    """
+
+    def __init__(self, salt: str, secret_key: str, fallback_keys: tuple[str, ...]) -> None:
+        self._keys = [
+            hashlib.sha256(f"{salt}signer{key}".encode()).digest()
+            for key in (secret_key, *fallback_keys)
+        ]
+
+    @staticmethod
+    def _signature(key: bytes, payload: str) -> str:
+        return _b64_encode(hmac.digest(key, payload.encode(), "sha256"))
+
+    def sign(self, payload: str) -> str:
+        return f"{payload}:{self._signature(self._keys[0], payload)}"
+
+    def unsign(self, token: str) -> str:
+        payload, _, signature = token.rpartition(":")
+        for key in self._keys:
+            if hmac.compare_digest(self._signature(key, payload).encode(), signature.encode()):
+                return payload
+        raise signing.BadSignature(f'Signature "{signature}" does not match')
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_signer(salt: str, secret_key: str, fallback_keys: tuple[str, ...]) -> _TokenSigner:
+    return _TokenSigner(salt, secret_key, fallback_keys)
+
+
+def _signer(salt: str) -> _TokenSigner:
+    # Keying the cache by the settings allows them to be changed, e.g. by "override_settings"
+    return _cached_signer(salt, settings.SECRET_KEY, tuple(settings.SECRET_KEY_FALLBACKS))
+
+
+def _dumps(salt: str, values: list[Any]) -> str:
+    # Values are positional, so the payload has no keys
+    payload = _json_encoder.encode(values)
+    return _signer(salt).sign(_b64_encode(payload.encode()))
+
+
+def _decode(payload: str) -> list[Any]:
+    return _json_decoder.decode(_b64_decode(payload).decode())
+
+
+def _loads(salt: str, token: str) -> list[Any]:
+    return _decode(_signer(salt).unsign(token))
+
+
+def _is_legacy(token: str) -> bool:
+    # Tokens made by "django.core.signing.dumps" also have a timestamp, so another separator
+    return token.count(":") != 1
+
+
+def dumps_upload_signature(
+    field_id: str, object_key: str, file_size: int, part_size: int, content_type: str
+) -> str:
+    return _dumps(
+        _UPLOAD_SIGNATURE_SALT, [field_id, object_key, file_size, part_size, content_type]
+    )
+
+
+def loads_upload_signature(upload_signature: str) -> dict[str, Any]:
+    """
+    Verify and decode an upload_signature, or raise BadSignature.
+
+    Signatures made by "django.core.signing.dumps", as in earlier versions, are also accepted.
+    """
+    if _is_legacy(upload_signature):
+        return signing.loads(upload_signature)
+    field_id, object_key, file_size, part_size, content_type = _loads(
+        _UPLOAD_SIGNATURE_SALT, upload_signature
+    )
+    return {
+        "field_id": field_id,
+        "object_key": object_key,
+        "file_size": file_size,
+        "part_size": part_size,
+        "content_type": content_type,
+    }
+
+
+def dumps_part_proxy_token(
+    field_id: str, object_key: str, upload_id: str, file_size: int, part_size: int | None
+) -> str:
+    return _dumps(_PART_PROXY_TOKEN_SALT, [field_id, object_key, upload_id, file_size, part_size])
+
+
+def loads_part_proxy_token(part_proxy_token: str) -> dict[str, Any]:
+    """Verify and decode a part proxy token, or raise BadSignature."""
+    field_id, object_key, upload_id, file_size, part_size = _loads(
+        _PART_PROXY_TOKEN_SALT, part_proxy_token
+    )
+    return {
+        "field_id": field_id,
+        "object_key": object_key,
+        "upload_id": upload_id,
+        "file_size": file_size,
+        "part_size": part_size,
+    }
+
+
+def dumps_field_value(
+    object_key: str, file_size: int, etag: str | None = None, content_type: str | None = None
+) -> str:
+    return _dumps(_FIELD_VALUE_SALT, [object_key, file_size, etag, content_type])
+
+
+def _field_value(values: list[Any]) -> dict[str, Any]:
+    object_key, file_size, etag, content_type = values
+    return {
+        "object_key": object_key,
+        "file_size": file_size,
+        "etag": etag,
+        "content_type": content_type,
+    }
+
+
+def loads_field_value(field_value: str) -> dict[str, Any]:
+    """
+    Verify and decode a field_value, or raise BadSignature.
+
+    Field values made by "django.core.signing.dumps", as in earlier versions, are also accepted,
+    though they have no "etag" or "content_type".
+    """
+    if _is_legacy(field_value):
+        return signing.loads(field_value)
+    return _field_value(_loads(_FIELD_VALUE_SALT, field_value))
+
+
+def loads_field_values(field_values: Iterable[str]) -> dict[str, dict[str, Any] | None]:
+    """
+    Verify and decode many field_values, mapping each to its content, or None if it's invalid.
+
+    This is equivalent to calling "loads_field_value" for each, but the signer is only looked up
+    once, repeated values are only verified once, and all payloads are decoded together.
+    """
+    signer = _signer(_FIELD_VALUE_SALT)
+    loaded: dict[str, dict[str, Any] | None] = {}
+    verified: dict[str, str] = {}
+    for field_value in field_values:
+        if field_value in loaded or field_value in verified:
+            continue
+        try:
+            if _is_legacy(field_value):
+                loaded[field_value] = signing.loads(field_value)
+            else:
+                verified[field_value] = _b64_decode(signer.unsign(field_value)).decode()
+        except signing.BadSignature:
+            loaded[field_value] = None
+
+    # Signed payloads are known to be valid JSON, so they can be joined into a single document
+    decoded = _json_decoder.decode(f"[{','.join(verified.values())}]")
+    for field_value, values in zip(verified, decoded):
+        loaded[field_value] = _field_value(values)
+    return loaded
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import functools
+import itertools
+import time
+from typing import TYPE_CHECKING
+
+from s3_file_field._concurrency import get_storage_executor
+from s3_file_field._multipart import MultipartManager, PendingUpload, UploadNotFoundError
+
+if TYPE_CHECKING:
+    from django.core.files.storage import Storage
+
+
+@dataclass(frozen=True)
+class StaleUploadStats:
+    listed: int
+    stale: int
+    # Stale uploads which were completed or aborted elsewhere after being listed aren't counted
+    aborted: int
+    seconds: float
+
+    @property
+    def listed_per_second(self) -> float:
+        return self.listed / self.seconds if self.seconds else 0.0
+
+
+def _abort_upload(manager: MultipartManager, upload: PendingUpload) -> bool:
+    try:
+        manager._abort_upload_id(upload.object_key, upload.upload_id)
+    except UploadNotFoundError:
+        return False
+    return True
+
+
+def abort_stale_uploads(
+    storage: Storage,
+    max_age: timedelta,
+    *,
+    prefix: str,
+    dry_run: bool = False,
+    batch_size: int = 1000,
+) -> StaleUploadStats:
+    """
+    Abort every incomplete multipart upload in the bucket of "storage" older than "max_age".
+
+    Only uploads to object keys starting with "prefix" are aborted, as the bucket may be shared
+    with other applications, whose uploads must be left alone; an empty "prefix" includes the
+    whole bucket. Uploads which are abandoned by their clients are otherwise kept, and billed for,
+    indefinitely.
+    Uploads are listed a page at a time, and the stale uploads of each batch of "batch_size" are
+    aborted concurrently, so memory use doesn't grow with the size of the bucket. With "dry_run",
+    stale uploads are only counted.
+    """
+    manager = MultipartManager.from_storage(storage)
+    executor = get_storage_executor()
+    cutoff = datetime.now(timezone.utc) - max_age
+
+    start = time.perf_counter()
+    listed = stale = aborted = 0
+    uploads = manager._iter_uploads(prefix)
+    while batch := list(itertools.islice(uploads, batch_size)):
+        listed += len(batch)
+        stale_uploads = [upload for upload in batch if upload.initiated < cutoff]
+        stale += len(stale_uploads)
+        if not dry_run:
+            aborted += sum(executor.map(functools.partial(_abort_upload, manager), stale_uploads))
+    return StaleUploadStats(
+        listed=listed, stale=stale, aborted=aborted, seconds=time.perf_counter() - start
+    )
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hashlib
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.cache import caches
+
+from s3_file_field._multipart import MultipartManager
+
+if TYPE_CHECKING:
+    from django.core.files.storage import Storage
+
+# Entries are evicted this long before their URL expires, so clients have time to use it
+DEFAULT_EXPIRY_MARGIN = timedelta(minutes=5)
+
+
+@dataclass(frozen=True)
+class UrlCacheStats:
+    hits: int
+    misses: int
+
+
+def presigned_url_expiry(url: str) -> float | None:
+    """Return when a presigned URL expires, as a POSIX timestamp, or None if it's not presigned."""
+    query = parse_qs(urlsplit(url).query)
+    # SigV4, as used by S3 and MinIO
+    if "X-Amz-Date" in query and "X-Amz-Expires" in query:
+        signed_at = datetime.strptime(query["X-Amz-Date"][0], "%Y%m%dT%H%M%SZ").replace(
+            tzinfo=timezone.utc
+        )
+        return signed_at.timestamp() + int(query["X-Amz-Expires"][0])
+    # SigV2 and CloudFront
+    if "Expires" in query:
+        return float(query["Expires"][0])
+    return None
+
+
+def _credentials_expiry(storage: Storage) -> float | None:
+    if not MultipartManager.supported_storage(storage):
+        return None
+    return MultipartManager.from_storage(storage)._get_credentials_expiry()
+
+
+def _cache_key(storage: Storage, name: str, parameters: dict[str, Any] | None) -> str:
+    # Storages are deconstructible, so this identifies a storage in any process
+    storage_path, storage_args, storage_kwargs = storage.deconstruct()  # type: ignore[attr-defined]
+    key = "\0".join(
+        [
+            storage_path,
+            repr(storage_args),
+            repr(sorted(storage_kwargs.items())),
+            name,
+            repr(sorted((parameters or {}).items())),
+        ]
+    )
+    # Hashing also keeps keys short and free of characters which some cache backends reject
+    return f"s3ff-url:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+class PresignedUrlCache:
+    """
+    Caches the presigned download URLs of objects, until shortly before they expire.
+
+    URLs which aren't presigned, so have no expiry, are never cached. URLs presigned with
+    temporary credentials stop working when those expire, so are cached until then at most, or
+    never if that isn't known.
+    """
+
+    def __init__(self, expiry_margin: timedelta = DEFAULT_EXPIRY_MARGIN) -> None:
+        self.expiry_margin = expiry_margin
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def url(self, storage: Storage, name: str, parameters: dict[str, Any] | None = None) -> str:
+        """Return a URL for "name" in "storage", with any response "parameters"."""
+        key = _cache_key(storage, name, parameters)
+        cached_url = self._get(key)
+        with self._lock:
+            if cached_url is not None:
+                self._hits += 1
+                return cached_url
+            self._misses += 1
+
+        # The credentials may be refreshed while the URL is presigned, so this must be read first
+        credentials_expiry = _credentials_expiry(storage)
+        # Only some storages support parameters
+        url = (
+            storage.url(name, parameters=parameters)  # type: ignore[call-arg]
+            if parameters
+            else storage.url(name)
+        )
+        expires_at = presigned_url_expiry(url)
+        if expires_at is not None and "X-Amz-Security-Token" in parse_qs(urlsplit(url).query):
+            expires_at = None if credentials_expiry is None else min(expires_at, credentials_expiry)
+        if expires_at is not None:
+            expires_at -= self.expiry_margin.total_seconds()
+            if expires_at > time.time():
+                self._set(key, url, expires_at)
+        return url
+
+    def stats(self) -> UrlCacheStats:
+        with self._lock:
+            return UrlCacheStats(hits=self._hits, misses=self._misses)
+
+    def _get(self, key: str) -> str | None:
+        raise NotImplementedError
+
+    def _set(self, key: str, url: str, expires_at: float) -> None:
+        raise NotImplementedError
+
+
+class LocalPresignedUrlCache(PresignedUrlCache):
+    """Cache URLs in this process, evicting the least recently used beyond "max_size"."""
+
+    def __init__(
+        self, max_size: int = 10_000, expiry_margin: timedelta = DEFAULT_EXPIRY_MARGIN
+    ) -> None:
+        super().__init__(expiry_margin)
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return url
+
+    def _set(self, key: str, url: str, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (url, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class DjangoPresignedUrlCache(PresignedUrlCache):
+    """Cache URLs in one of Django's caches, so they may be shared between processes."""
+
+    def __init__(
+        self, alias: str = "default", expiry_margin: timedelta = DEFAULT_EXPIRY_MARGIN
+    ) -> None:
+        super().__init__(expiry_margin)
+        self.alias = alias
+
+    def _get(self, key: str) -> str | None:
+        return caches[self.alias].get(key)
+
+    def _set(self, key: str, url: str, expires_at: float) -> None:
+        # Django's cache timeouts are relative, and rounding down keeps them within the expiry
+        timeout = int(expires_at - time.time())
+        if timeout > 0:
+            caches[self.alias].set(key, url, timeout)
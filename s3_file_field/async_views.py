@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, cast
+
+from asgiref.sync import sync_to_async
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ._concurrency import get_storage_executor
+from ._json import JSONParser
+from .views import (
+    BatchRequestSerializer,
+    BatchResponseSerializer,
+    _abort_batch_uploads,
+    _batch_item_response,
+    _complete_upload,
+    _finalize,
+    _ingest_source,
+    _initialize_upload,
+    _resume_upload,
+    _upload_parts,
+)
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+    from django.http.response import HttpResponseBase
+    from rest_framework.request import Request
+    from rest_framework.views import AsView, GenericView
+
+    AsyncViewHandler = Callable[[Request], Awaitable[HttpResponseBase]]
+
+
+def _async_api_view(handler: AsyncViewHandler) -> AsView[GenericView]:
+    """
+    Make a DRF view from a coroutine function, like "@api_view(["POST"])".
+
+    DRF can't dispatch to coroutine functions, so this runs the checks which may access the
+    database (authentication, permissions and throttling) in a thread, then awaits the handler.
+    """
+
+    class AsyncAPIView(APIView):
+        http_method_names = ["post", "options"]
+        parser_classes = [JSONParser]
+
+        async def post(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+            return await handler(request)
+
+        async def dispatch(  # type: ignore[override]
+            self, request: HttpRequest, *args: Any, **kwargs: Any
+        ) -> HttpResponseBase:
+            # Mirror APIView.dispatch
+            self.args = args
+            self.kwargs = kwargs
+            drf_request = self.initialize_request(request, *args, **kwargs)
+            self.request = drf_request
+            self.headers = self.default_response_headers
+
+            try:
+                await sync_to_async(self.initial)(drf_request, *args, **kwargs)
+                method = cast(str, drf_request.method).lower()
+                method_handler = (
+                    getattr(self, method, self.http_method_not_allowed)
+                    if method in self.http_method_names
+                    else self.http_method_not_allowed
+                )
+                response = method_handler(drf_request, *args, **kwargs)
+                # Unlike "post", the inherited "options" handler is synchronous
+                if inspect.isawaitable(response):
+                    response = await response
+            except Exception as exc:
+                response = self.handle_exception(exc)
+
+            self.response = self.finalize_response(drf_request, response, *args, **kwargs)
+            return self.response
+
+    AsyncAPIView.__name__ = handler.__name__
+    AsyncAPIView.__qualname__ = handler.__qualname__
+    AsyncAPIView.__doc__ = handler.__doc__
+    return AsyncAPIView.as_view()
+
+
+@_async_api_view
+async def upload_initialize(request: Request) -> HttpResponseBase:
+    # Each view shares its handler with the sync view, run in a thread so its requests to the
+    # object store don't block the event loop
+    return await get_storage_executor().run(_initialize_upload, request, request.data)
+
+
+@_async_api_view
+async def upload_initialize_batch(request: Request) -> HttpResponseBase:
+    request_serializer = BatchRequestSerializer(data=request.data)
+    request_serializer.is_valid(raise_exception=True)
+
+    storage_executor = get_storage_executor()
+    # Every item is awaited, even if one fails, so the uploads of the others can be aborted
+    results = await asyncio.gather(
+        *(
+            storage_executor.run(
+                _batch_item_response, functools.partial(_initialize_upload, request), data
+            )
+            for data in request_serializer.validated_data["items"]
+        ),
+        return_exceptions=True,
+    )
+    items = await storage_executor.run(_abort_batch_uploads, results)
+
+    response_serializer = BatchResponseSerializer(
+        {
+            "items": items,
+        }
+    )
+    return Response(response_serializer.data)
+
+
+@_async_api_view
+async def upload_parts(request: Request) -> HttpResponseBase:
+    # Presigning itself doesn't make a request to the object store, but looking up credentials or
+    # constructing the first manager for a Storage may
+    return await get_storage_executor().run(_upload_parts, request, request.data)
+
+
+@_async_api_view
+async def upload_resume(request: Request) -> HttpResponseBase:
+    return await get_storage_executor().run(_resume_upload, request, request.data)
+
+
+@_async_api_view
+async def upload_complete(request: Request) -> HttpResponseBase:
+    return await get_storage_executor().run(_complete_upload, request.data)
+
+
+@_async_api_view
+async def finalize(request: Request) -> HttpResponseBase:
+    return await get_storage_executor().run(_finalize, request.data)
+
+
+@_async_api_view
+async def finalize_batch(request: Request) -> HttpResponseBase:
+    request_serializer = BatchRequestSerializer(data=request.data)
+    request_serializer.is_valid(raise_exception=True)
+
+    storage_executor = get_storage_executor()
+    items = await asyncio.gather(
+        *(
+            storage_executor.run(_batch_item_response, _finalize, data)
+            for data in request_serializer.validated_data["items"]
+        )
+    )
+
+    response_serializer = BatchResponseSerializer(
+        {
+            "items": items,
+        }
+    )
+    return Response(response_serializer.data)
+
+
+@_async_api_view
+async def ingest(request: Request) -> HttpResponseBase:
+    # The ingest waits for its parts in the transfer executor for the whole transfer, so it must
+    # not hold a thread of the storage executor, which the other views share
+    return await sync_to_async(_ingest_source, thread_sensitive=False)(request.data)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 from uuid import uuid4
 
 from django.core import checks
-from django.db.models.fields.files import FileField
+from django.db.models import signals
+from django.db.models.fields.files import FieldFile, FileDescriptor, FileField
 
-from ._multipart import MultipartManager
+from ._multipart import MultipartManager, ObjectMetadata
 from ._registry import register_field
 from .forms import S3FormFileField
-from .widgets import S3PlaceholderFile
+from .widgets import S3ObjectKey, S3PlaceholderFile
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -19,9 +20,73 @@ if TYPE_CHECKING:
     from django.core.checks import CheckMessage
     from django.db import models
 
+    from ._part_size_policy import PartSizePolicy
+    from ._url_cache import PresignedUrlCache
+
 logger = logging.getLogger(__name__)
 
 
+class S3FieldFile(FieldFile):
+    field: S3FileField
+    # Set by prefetch_s3_metadata, to None if the object doesn't exist
+    _prefetched_metadata: ObjectMetadata | None
+
+    @property
+    def url(self) -> str:
+        if self.field.url_cache is None:
+            return super().url
+        self._require_file()  # type: ignore[attr-defined]
+        return self.field.url_cache.url(self.storage, cast(str, self.name))
+
+    @property
+    def size(self) -> int:
+        # Avoid querying the object store, if the size is stored. The size field is cleared, or
+        # copied from another instance's, whenever other content is assigned, so it can't be stale.
+        if self.field.size_field:
+            size = getattr(self.instance, self.field.size_field)
+            if size is not None:
+                return size
+        prefetched_metadata = self.__dict__.get("_prefetched_metadata")
+        if prefetched_metadata is not None:
+            return prefetched_metadata.size
+        return super().size
+
+    def exists(self) -> bool:
+        """Return whether the object exists, without a request if it's been prefetched."""
+        if "_prefetched_metadata" in self.__dict__:
+            return self._prefetched_metadata is not None
+        return bool(self.name) and self.storage.exists(cast(str, self.name))
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # The prefetched metadata is of the previous object
+        self.__dict__.pop("_prefetched_metadata", None)
+        super().save(*args, **kwargs)
+
+    def delete(self, *args: Any, **kwargs: Any) -> None:
+        self.__dict__.pop("_prefetched_metadata", None)
+        super().delete(*args, **kwargs)
+
+
+class S3FileDescriptor(FileDescriptor):
+    field: S3FileField
+
+    def __set__(self, instance: models.Model, value: Any) -> None:
+        previous_file = instance.__dict__.get(self.field.attname)
+        super().__set__(instance, value)
+
+        # Like ImageFileDescriptor, only update the metadata fields if the field had a value
+        # before, since previous_file is only None when called from Model.__init__, where the
+        # post_init signal updates them instead
+        if previous_file is not None:
+            self.field.update_metadata_fields(
+                instance,
+                force=True,
+                previous_name=(
+                    previous_file.name if isinstance(previous_file, FieldFile) else previous_file
+                ),
+            )
+
+
 class S3FileField(FileField):
     """
     A django model field that is similar to a file field.
@@ -29,14 +94,33 @@ class S3FileField(FileField):
     Except it supports directly uploading the file to S3 via the UI
     """
 
+    attr_class = S3FieldFile
+    descriptor_class = S3FileDescriptor
     description = (
         "A file field which is supports direct uploads to S3 via the "
         "UI and fallsback to uploaded to <randomuuid>/filename."
     )
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        part_size_policy: PartSizePolicy | None = None,
+        url_cache: PresignedUrlCache | None = None,
+        size_field: str | None = None,
+        etag_field: str | None = None,
+        content_type_field: str | None = None,
+        **kwargs,
+    ) -> None:
         kwargs.setdefault("max_length", 2000)
         kwargs.setdefault("upload_to", self.uuid_prefix_filename)
+        # These only affect uploads and URLs, not the database, so they're omitted from migrations
+        self.part_size_policy = part_size_policy
+        self.url_cache = url_cache
+        # Like ImageField's "width_field" and "height_field", these name other fields of the
+        # model, where the uploaded object's metadata is stored
+        self.size_field = size_field
+        self.etag_field = etag_field
+        self.content_type_field = content_type_field
         super().__init__(*args, **kwargs)
 
     def deconstruct(self) -> tuple[str, str, Sequence[Any], dict[str, Any]]:
@@ -45,6 +129,12 @@ class S3FileField(FileField):
             del kwargs["max_length"]
         if kwargs.get("upload_to") is self.uuid_prefix_filename:
             del kwargs["upload_to"]
+        if self.size_field:
+            kwargs["size_field"] = self.size_field
+        if self.etag_field:
+            kwargs["etag_field"] = self.etag_field
+        if self.content_type_field:
+            kwargs["content_type_field"] = self.content_type_field
         return name, path, args, kwargs
 
     @property
@@ -66,6 +156,66 @@ class S3FileField(FileField):
             # Django's makemigrations iteratively creates fake model instances.
             # To avoid registration collisions, don't register these.
             register_field(self)
+        # Metadata fields declared after this field would otherwise be reset by Model.__init__
+        if not cls._meta.abstract and self._has_metadata_fields:
+            signals.post_init.connect(self.update_metadata_fields, sender=cls)
+
+    @property
+    def _has_metadata_fields(self) -> bool:
+        return bool(self.size_field or self.etag_field or self.content_type_field)
+
+    def update_metadata_fields(
+        self,
+        instance: models.Model,
+        force: bool = False,
+        *args: Any,
+        previous_name: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Update the model's size, ETag and content type fields, if defined.
+
+        These are set from an assigned S3ObjectKey, as emitted by S3FileSerializerField and
+        "save_form_data", or copied from the metadata fields of another instance whose FieldFile
+        is assigned. Otherwise, if "force" is set, they're cleared when anything but the same
+        FieldFile, still named "previous_name", is assigned, since the metadata of the new value
+        is unknown.
+        """
+        # Nothing to update if the field is deferred
+        if not self._has_metadata_fields or self.attname not in instance.__dict__:
+            return
+
+        value = instance.__dict__[self.attname]
+        # After the first access, FileDescriptor wraps the assigned name in a FieldFile
+        object_key = value.name if isinstance(value, FieldFile) else value
+        if isinstance(object_key, S3ObjectKey):
+            metadata = {
+                self.size_field: object_key.size,
+                self.etag_field: object_key.etag,
+                self.content_type_field: object_key.content_type,
+            }
+        elif isinstance(value, FieldFile) and value.instance is not instance:
+            metadata = {
+                self.size_field: self._source_metadata(value, "size_field"),
+                self.etag_field: self._source_metadata(value, "etag_field"),
+                self.content_type_field: self._source_metadata(value, "content_type_field"),
+            }
+        elif force and not (isinstance(value, FieldFile) and value.name == previous_name):
+            metadata = dict.fromkeys([self.size_field, self.etag_field, self.content_type_field])
+        else:
+            return
+
+        for field_name, field_value in metadata.items():
+            if field_name:
+                setattr(instance, field_name, field_value)
+
+    @staticmethod
+    def _source_metadata(value: FieldFile, metadata_field: str) -> Any:
+        # The source's metadata fields are only read if they're loaded, to avoid a query each
+        field_name = getattr(value.field, metadata_field, None)
+        if not field_name:
+            return None
+        return value.instance.__dict__.get(field_name)
 
     @staticmethod
     def uuid_prefix_filename(instance: models.Model, filename: str) -> str:
@@ -99,8 +249,9 @@ class S3FileField(FileField):
         # database, and no save occurs, which is desirable here.
         # However, we don't want the S3FileInput or S3FormFileField to emit a string value,
         # since that will break most of the default validation.
+        # The S3ObjectKey is a string, which also carries the metadata of the object.
         if isinstance(data, S3PlaceholderFile):
-            data = data.name
+            data = data.to_object_key()
         super().save_form_data(instance, data)
 
     def check(self, **kwargs: Any) -> list[CheckMessage]:
@@ -1,13 +1,14 @@
 # This module shouldn't be imported explicitly, as it will be loaded by pytest via entry point.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Generator
+from typing import TYPE_CHECKING, Callable, Generator, cast
 
-from django.core import signing
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 import pytest
 
+from s3_file_field import _signing
+
 if TYPE_CHECKING:
     from django.core.files import File
 
@@ -30,11 +31,8 @@ def s3ff_field_value_factory() -> Callable[[File[bytes]], str]:
     """Return a function to produce a valid field_value from a File object."""
 
     def s3ff_field_value_factory(file_object: File[bytes]) -> str:
-        return signing.dumps(
-            {
-                "object_key": file_object.name,
-                "file_size": file_object.size,
-            }
+        return _signing.dumps_field_value(
+            object_key=cast(str, file_object.name), file_size=file_object.size
         )
 
     return s3ff_field_value_factory
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from s3_file_field import _registry
+from s3_file_field._multipart import MultipartManager
+from s3_file_field._stale_uploads import abort_stale_uploads
+
+
+class Command(BaseCommand):
+    help = "Abort the incomplete multipart uploads left behind in the storages of S3FileFields."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--prefix",
+            required=True,
+            help=(
+                "Only abort uploads to object keys starting with this prefix. Buckets may be "
+                'shared with other applications, so "" must be passed explicitly to include the '
+                "whole bucket."
+            ),
+        )
+        parser.add_argument(
+            "--max-age-days",
+            type=float,
+            default=7,
+            help=(
+                "Abort uploads initiated more than this many days ago. Interrupted uploads can "
+                "only be resumed until they are aborted."
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the stale uploads, without aborting them.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of listed uploads to abort the stale ones of concurrently.",
+        )
+
+    def handle(
+        self, *, prefix: str, max_age_days: float, dry_run: bool, batch_size: int, **options: Any
+    ) -> None:
+        fields = list(_registry.iter_fields())
+        for storage in list(_registry.iter_storages()):
+            # Fields may use storages which only support uploads through the server
+            if not MultipartManager.supported_storage(storage):
+                continue
+            field_ids = ", ".join(sorted(field.id for field in fields if field.storage is storage))
+            stats = abort_stale_uploads(
+                storage,
+                timedelta(days=max_age_days),
+                prefix=prefix,
+                dry_run=dry_run,
+                batch_size=batch_size,
+            )
+            summary = (
+                f"Found {stats.stale} stale uploads"
+                if dry_run
+                else f"Aborted {stats.aborted} of {stats.stale} stale uploads"
+            )
+            self.stdout.write(
+                f"{summary}, from {stats.listed} listed in {stats.seconds:.1f}s "
+                f"({stats.listed_per_second:.0f} uploads/s), for the storage of {field_ids}."
+            )
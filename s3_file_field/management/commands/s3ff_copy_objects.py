@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any
+
+from django.core.files.storage import InvalidStorageError, Storage, storages
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from s3_file_field import _registry
+from s3_file_field._copy import copy_objects
+from s3_file_field._multipart import CopyNotSupportedError, UnsupportedStorageError
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy the objects referenced by S3FileFields from another storage, within the object store."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "field_ids",
+            nargs="+",
+            metavar="field_id",
+            help='An S3FileField to copy the objects of, as "<app>.<model>.<field>".',
+        )
+        parser.add_argument(
+            "--source",
+            required=True,
+            help='The alias in the "STORAGES" setting of the storage to copy from.',
+        )
+        parser.add_argument(
+            "--destination",
+            help=(
+                'The alias in the "STORAGES" setting of the storage to copy to. '
+                "Defaults to the storage of each field."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of objects to copy concurrently.",
+        )
+
+    def handle(
+        self,
+        *,
+        field_ids: list[str],
+        source: str,
+        destination: str | None,
+        batch_size: int,
+        **options: Any,
+    ) -> None:
+        source_storage = self._get_storage(source)
+        destination_storage = None if destination is None else self._get_storage(destination)
+        try:
+            fields = [_registry.get_field(field_id) for field_id in field_ids]
+        except KeyError as e:
+            raise CommandError(f"Invalid field ID: {e.args[0]}") from e
+
+        for field in fields:
+            names = (
+                field.model._default_manager.exclude(**{f"{field.attname}__isnull": True})
+                .exclude(**{field.attname: ""})
+                .order_by()
+                .values_list(field.attname, flat=True)
+                .distinct()
+                .iterator()
+            )
+            copied_count = missing_count = 0
+            while batch := list(itertools.islice(names, batch_size)):
+                try:
+                    finalized_uploads = copy_objects(
+                        source_storage,
+                        field.storage if destination_storage is None else destination_storage,
+                        batch,
+                    )
+                except (CopyNotSupportedError, UnsupportedStorageError) as e:
+                    raise CommandError(
+                        f"Objects of {field.id} can't be copied within the object store."
+                    ) from e
+                for name, finalized_upload in zip(batch, finalized_uploads):
+                    if finalized_upload is None:
+                        self.stderr.write(f"Object not found in source storage: {name}")
+                        missing_count += 1
+                    else:
+                        copied_count += 1
+            self.stdout.write(
+                f"Copied {copied_count} objects of {field.id}, {missing_count} not found."
+            )
+
+    @staticmethod
+    def _get_storage(alias: str) -> Storage:
+        try:
+            return storages[alias]
+        except InvalidStorageError as e:
+            raise CommandError(str(e)) from e
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import csv
+import itertools
+import os
+from typing import Any, Iterator
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from s3_file_field import _registry
+from s3_file_field._bulk_upload import upload_files
+from s3_file_field.fields import S3FileField
+
+
+def _iter_directory(path: str) -> Iterator[str]:
+    for dir_path, dir_names, file_names in os.walk(path):
+        # Walk in a stable order, so an interrupted import can be reasoned about
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            yield os.path.join(dir_path, file_name)
+
+
+def _iter_manifest(manifest_path: str) -> Iterator[tuple[str, str | None]]:
+    # Relative paths are relative to the manifest itself
+    manifest_dir = os.path.dirname(manifest_path)
+    with open(manifest_path, newline="") as manifest_file:
+        reader = csv.DictReader(manifest_file)
+        if "path" not in (reader.fieldnames or []):
+            raise CommandError('The manifest must have a "path" column.')
+        for row in reader:
+            # An empty "pk" also creates a new row
+            yield os.path.join(manifest_dir, row["path"]), row.get("pk") or None
+
+
+class Command(BaseCommand):
+    help = "Upload local files to the storage of an S3FileField, and save them to its model."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "field_id", help='The S3FileField to import to, as "<app>.<model>.<field>".'
+        )
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            metavar="path",
+            help="A file, or a directory of files, to import. Each creates a new row.",
+        )
+        parser.add_argument(
+            "--manifest",
+            help=(
+                'A CSV file with a "path" column of files to import. If it also has a "pk" '
+                "column, each file is saved to that existing row instead of a new one."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of files to upload concurrently, and then save together.",
+        )
+
+    def handle(
+        self,
+        *,
+        field_id: str,
+        paths: list[str],
+        manifest: str | None,
+        batch_size: int,
+        **options: Any,
+    ) -> None:
+        try:
+            field = _registry.get_field(field_id)
+        except KeyError as e:
+            raise CommandError(f"Invalid field ID: {field_id}") from e
+        if not paths and manifest is None:
+            raise CommandError("Either paths or a manifest must be given.")
+
+        imports = itertools.chain(
+            (
+                (file_path, None)
+                for path in paths
+                for file_path in (_iter_directory(path) if os.path.isdir(path) else [path])
+            ),
+            () if manifest is None else _iter_manifest(manifest),
+        )
+        created_count = updated_count = 0
+        while batch := list(itertools.islice(imports, batch_size)):
+            created_batch = [file_path for file_path, pk in batch if pk is None]
+            updated_batch = [(file_path, pk) for file_path, pk in batch if pk is not None]
+            created_count += self._create_rows(field, created_batch)
+            updated_count += self._update_rows(field, updated_batch)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Imported {created_count + updated_count} files...")
+        self.stdout.write(
+            f"Imported {created_count + updated_count} files to {field.id}: "
+            f"{created_count} created, {updated_count} updated."
+        )
+
+    @staticmethod
+    def _create_rows(field: S3FileField, file_paths: list[str]) -> int:
+        if not file_paths:
+            return 0
+        model = field.model
+        object_keys = upload_files(field, file_paths)
+        # Assigning each object key also sets any of the field's metadata fields
+        model._default_manager.bulk_create(
+            [model(**{field.name: object_key}) for object_key in object_keys]
+        )
+        return len(object_keys)
+
+    @staticmethod
+    def _update_rows(field: S3FileField, updates: list[tuple[str, str]]) -> int:
+        if not updates:
+            return 0
+        model = field.model
+        instances = model._default_manager.in_bulk([pk for _, pk in updates])
+        # Don't upload anything for a batch which can't be saved
+        missing_pks = [pk for _, pk in updates if model._meta.pk.to_python(pk) not in instances]
+        if missing_pks:
+            raise CommandError(f"Rows not found: {', '.join(missing_pks)}")
+
+        object_keys = upload_files(field, [file_path for file_path, _ in updates])
+        updated_instances = []
+        for (_, pk), object_key in zip(updates, object_keys):
+            instance = instances[model._meta.pk.to_python(pk)]
+            setattr(instance, field.name, object_key)
+            updated_instances.append(instance)
+        model._default_manager.bulk_update(
+            updated_instances,
+            [
+                field.name,
+                *filter(None, [field.size_field, field.etag_field, field.content_type_field]),
+            ],
+        )
+        return len(updated_instances)
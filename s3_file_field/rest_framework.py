@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from typing import Any
+
 from django.core.files import File
 from rest_framework.fields import FileField as FileSerializerField
+from rest_framework.serializers import ListSerializer
 
-from s3_file_field.widgets import S3PlaceholderFile
+from s3_file_field import _signing
+from s3_file_field.widgets import S3ObjectKey, S3PlaceholderFile
 
 
 class S3FileSerializerField(FileSerializerField):
@@ -18,6 +23,24 @@ class S3FileSerializerField(FileSerializerField):
             # API callers shouldn't be rewarded for submitting inline files.
             self.fail("invalid")
 
+        # An S3FileListSerializer may have already checked the signature
+        loaded_field_values = getattr(
+            getattr(self.parent, "parent", None), "_loaded_field_values", {}
+        )
+        if isinstance(data, str) and data in loaded_field_values:
+            parsed_field = loaded_field_values[data]
+            if parsed_field is None:
+                self.fail("invalid")
+            # This checks validity of the file name and size, like FileSerializerField does
+            # for an S3PlaceholderFile, but without constructing one
+            self._validate_name_and_size(parsed_field["object_key"], parsed_field["file_size"])
+            return S3ObjectKey(
+                parsed_field["object_key"],
+                parsed_field["file_size"],
+                parsed_field.get("etag"),
+                parsed_field.get("content_type"),
+            )
+
         # Check the signature and load an S3PlaceholderFile
         file_object = S3PlaceholderFile.from_field(data)
         if file_object is None:
@@ -29,4 +52,43 @@ class S3FileSerializerField(FileSerializerField):
 
         # fields.S3FileField.save_form_data is not called by DRF, so the same behavior must be
         # implemented here
-        return file_object.name
+        return file_object.to_object_key()
+
+    def _validate_name_and_size(self, file_name: str, file_size: int) -> None:
+        if not file_name:
+            self.fail("no_name")
+        if not self.allow_empty_file and not file_size:
+            self.fail("empty")
+        if self.max_length and len(file_name) > self.max_length:
+            self.fail("max_length", max_length=self.max_length, length=len(file_name))
+
+
+class S3FileListSerializer(ListSerializer):
+    """
+    Validate a list of items with S3FileSerializerFields, checking all signatures in one pass.
+
+    Set this as the "list_serializer_class" of a serializer which is used with "many=True". Each
+    distinct value is only verified once, then errors are still reported for each item.
+    """
+
+    def to_internal_value(self, data: Any) -> list[Any]:
+        s3_file_fields = [
+            field
+            # The child may be any field, not only a serializer
+            for field in getattr(self.child, "fields", {}).values()
+            if isinstance(field, S3FileSerializerField) and not field.read_only
+        ]
+        if not s3_file_fields or not isinstance(data, list):
+            return super().to_internal_value(data)
+
+        self._loaded_field_values = _signing.loads_field_values(
+            field_value
+            for item in data
+            if isinstance(item, Mapping)
+            for field in s3_file_fields
+            if isinstance(field_value := field.get_value(item), str)
+        )
+        try:
+            return super().to_internal_value(data)
+        finally:
+            del self._loaded_field_values
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Mapping
+
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile, StopFutureHandlers
+
+from ._multipart import CreatedUploads, MultipartManager, TransferredPart, TransferredParts
+from ._sizes import mb
+from .widgets import S3PlaceholderFile
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+    from .fields import S3FileField
+
+
+class S3FileUploadHandler(FileUploadHandler):
+    """
+    Stream files uploaded to S3FileFields directly into S3 multipart uploads.
+
+    When the S3FileInput's JavaScript doesn't run, files are uploaded with the form instead, and
+    Django's default handlers buffer each file in memory or a temporary file. This handler instead
+    uploads each part of a file as soon as it's received, so only one part is ever buffered, and
+    provides an S3PlaceholderFile for the uploaded object. Only files for the form fields in
+    "fields" are handled, and any others are left to the subsequent handlers.
+    """
+
+    # Parts are the minimum size allowed by S3, doubling every 1000 parts, so the 10,000 parts of
+    # a multipart upload can hold a 5TB file, while small and medium files use little memory
+    part_size = mb(5)
+    part_size_doubling_interval = 1000
+
+    def __init__(self, request: HttpRequest | None, fields: Mapping[str, S3FileField]) -> None:
+        super().__init__(request)
+        self.fields = fields
+        self._transferred_parts: TransferredParts | None = None
+
+    def new_file(self, field_name: str, file_name: str, *args: Any, **kwargs: Any) -> None:
+        super().new_file(field_name, file_name, *args, **kwargs)
+        field = self.fields.get(field_name)
+        if field is None:
+            self._transferred_parts = None
+            return
+
+        self._multipart_manager = MultipartManager.from_storage(field.storage)
+        # There's never an instance of the model during an upload, like in the upload views
+        object_key = field.generate_filename(None, file_name)
+        # The upload is aborted if transferring any part of it, or completing it, fails
+        self._created_uploads = CreatedUploads()
+        upload_id = self._created_uploads.create_upload_id(
+            self._multipart_manager, object_key, self.content_type or "application/octet-stream"
+        )
+        self._transferred_parts = TransferredParts(
+            object_key=object_key, upload_id=upload_id, parts=[]
+        )
+        self._buffer = bytearray()
+        raise StopFutureHandlers
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes | None:
+        if self._transferred_parts is None:
+            return raw_data
+        if start + len(raw_data) > self._multipart_manager.max_object_size:
+            self.upload_interrupted()
+            raise SkipFile
+
+        self._buffer += raw_data
+        with self._created_uploads:
+            while len(self._buffer) >= self._next_part_size:
+                self._upload_part(self._next_part_size)
+        return None
+
+    def file_complete(self, file_size: int) -> S3PlaceholderFile | None:  # type: ignore[override]
+        if self._transferred_parts is None:
+            return None
+        transferred_parts = self._transferred_parts
+        with self._created_uploads:
+            # A multipart upload needs at least one part, which may be empty if it's the only one
+            if self._buffer or not transferred_parts.parts:
+                self._upload_part(len(self._buffer))
+            finalized_upload = self._multipart_manager.finalize_upload(transferred_parts)
+        self._transferred_parts = None
+        return S3PlaceholderFile(
+            finalized_upload.object_key,
+            finalized_upload.size,
+            finalized_upload.etag,
+            self.content_type,
+        )
+
+    def upload_interrupted(self) -> None:
+        if self._transferred_parts is not None:
+            self._created_uploads.abort()
+            self._transferred_parts = None
+
+    @property
+    def _next_part_size(self) -> int:
+        assert self._transferred_parts is not None
+        part_count = len(self._transferred_parts.parts)
+        return self.part_size * 2 ** (part_count // self.part_size_doubling_interval)
+
+    def _upload_part(self, size: int) -> None:
+        assert self._transferred_parts is not None
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        part_number = len(self._transferred_parts.parts) + 1
+        etag = self._multipart_manager._upload_part(
+            self._transferred_parts.object_key,
+            self._transferred_parts.upload_id,
+            part_number,
+            data,
+        )
+        self._transferred_parts.parts.append(
+            TransferredPart(part_number=part_number, size=size, etag=etag)
+        )
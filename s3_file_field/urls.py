@@ -1,15 +1,34 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import finalize, upload_complete, upload_initialize
+from . import async_views, views
 
 app_name = "s3_file_field"
 
+# Under ASGI, async views avoid tying up a thread while waiting for the object store
+_views = async_views if getattr(settings, "S3FF_ASYNC_VIEWS", False) else views
+
 urlpatterns = [
-    path("upload-initialize/", upload_initialize, name="upload-initialize"),
+    path("upload-initialize/", _views.upload_initialize, name="upload-initialize"),
+    path(
+        "upload-initialize-batch/",
+        _views.upload_initialize_batch,
+        name="upload-initialize-batch",
+    ),
+    path("upload-parts/", _views.upload_parts, name="upload-parts"),
+    path("upload-resume/", _views.upload_resume, name="upload-resume"),
     path(
         "upload-complete/",
-        upload_complete,
+        _views.upload_complete,
         name="upload-complete",
     ),
-    path("finalize/", finalize, name="finalize"),
+    path("finalize/", _views.finalize, name="finalize"),
+    path("finalize-batch/", _views.finalize_batch, name="finalize-batch"),
+    path("ingest/", _views.ingest, name="ingest"),
+    # Streaming a part to the object store blocks, so this is always a sync view
+    path(
+        "upload-part-proxy/<str:part_proxy_token>/<int:part_number>/",
+        views.upload_part_proxy,
+        name="upload-part-proxy",
+    ),
 ]
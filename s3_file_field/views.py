@@ -1,27 +1,81 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import concurrent.futures
+import functools
+import operator
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from django.core import signing
+from django.urls import reverse
 from rest_framework import serializers
-from rest_framework.decorators import api_view, parser_classes
-from rest_framework.parsers import JSONParser
+from rest_framework.decorators import (
+    api_view,
+    authentication_classes,
+    parser_classes,
+    permission_classes,
+)
+from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from . import _multipart, _registry
-from ._multipart import ObjectNotFoundError, TransferredPart, TransferredParts, UploadTooLargeError
+from . import _ingest, _multipart, _proxy, _registry, _signing
+from ._concurrency import get_storage_executor, get_transfer_executor
+from ._json import JSONParser
+from ._multipart import (
+    ObjectNotFoundError,
+    PartUploadError,
+    PresignedPartTemplate,
+    PresignedPartTransfer,
+    ResumedTransfer,
+    TransferredPart,
+    TransferredParts,
+    UnsupportedStorageError,
+    UploadCompletionError,
+    UploadNotFoundError,
+    UploadTooLargeError,
+)
+from ._part_size_policy import FixedPartSizePolicy, PartSizeHints, PartSizePolicy
 
 if TYPE_CHECKING:
+    from django.http import HttpRequest
     from django.http.response import HttpResponseBase
     from rest_framework.request import Request
 
+    from .fields import S3FileField
+
+
+class PartUrlFormatField(serializers.ChoiceField):
+    """Choose how part URLs are sent, where "proxy" is only available if it's enabled."""
+
+    def __init__(self, *, choices: list[str], **kwargs: Any) -> None:
+        super().__init__(choices=choices, default="full", **kwargs)
+
+    def to_internal_value(self, data: Any) -> str:
+        part_url_format = super().to_internal_value(data)
+        if part_url_format == "proxy" and not _proxy.upload_proxy_enabled():
+            raise serializers.ValidationError("Upload proxying is not enabled.")
+        return part_url_format
+
+
+class PartSizeHintsSerializer(serializers.Serializer):
+    bandwidth = serializers.IntegerField(min_value=1, required=False)
+    parallelism = serializers.IntegerField(min_value=1, required=False)
+    memory_budget = serializers.IntegerField(min_value=1, required=False)
+
 
 class UploadInitializationRequestSerializer(serializers.Serializer):
     field_id = serializers.CharField()
     file_name = serializers.CharField(trim_whitespace=False)
     file_size = serializers.IntegerField(min_value=1)
-    # part_size = serializers.IntegerField(min_value=1)
+    # Clients may describe how they will upload, to help choose the part size
+    part_size_hints = PartSizeHintsSerializer(required=False)
     content_type = serializers.CharField()
+    # If set, a file which fits in a single part may be uploaded with a single presigned PUT
+    # (indicated by a null "upload_id"), and must then be finalized without completion
+    single_part_upload = serializers.BooleanField(default=False)
+    # With "template", the parts of a multipart upload are presigned as a single, much smaller
+    # "part_template" instead of "parts", if the storage supports it. With "proxy", the parts are
+    # uploaded through the server instead, and a single part upload is never used.
+    part_url_format = PartUrlFormatField(choices=["full", "template", "proxy"])
 
     def validate_field_id(self, field_id: str) -> str:
         try:
@@ -37,40 +91,234 @@ class PartInitializationResponseSerializer(serializers.Serializer):
     upload_url = serializers.URLField()
 
 
+class PresignedPartsField(serializers.Field):
+    """
+    Emit PresignedPartTransfers, as "PartInitializationResponseSerializer(many=True)" would.
+
+    An upload may have up to 10,000 parts, so building each one directly is much faster than
+    running DRF's field machinery for every part.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(read_only=True, **kwargs)
+
+    def to_representation(self, parts: list[PresignedPartTransfer]) -> list[dict]:
+        return [
+            {"part_number": part.part_number, "size": part.size, "upload_url": part.upload_url}
+            for part in parts
+        ]
+
+
+class PartTemplateResponseSerializer(serializers.Serializer):
+    # Not a valid URL until its "{part_number}" and "{signature}" placeholders are replaced
+    upload_url = serializers.CharField()
+    first_part_number = serializers.IntegerField(min_value=1)
+    # Every part has "part_size", except the last part of the upload, which has the remainder
+    signatures = serializers.ListField(child=serializers.CharField(), allow_empty=False)
+
+
 class UploadInitializationResponseSerializer(serializers.Serializer):
     object_key = serializers.CharField(trim_whitespace=False)
-    upload_id = serializers.CharField()
-    parts = PartInitializationResponseSerializer(many=True, allow_empty=False)
+    upload_id = serializers.CharField(allow_null=True)
+    # Exactly one of "parts" or "part_template" is sent
+    parts = PresignedPartsField()
+    part_template = PartTemplateResponseSerializer(required=False)
+    part_size = serializers.IntegerField(min_value=1)
+    part_size_policy = serializers.CharField()
     upload_signature = serializers.CharField(trim_whitespace=False)
 
 
+class PartsRequestSerializer(serializers.Serializer):
+    upload_signature = serializers.CharField(trim_whitespace=False)
+    upload_id = serializers.CharField()
+    first_part_number = serializers.IntegerField(min_value=1)
+    # If omitted, as many parts as the server allows are returned
+    part_count = serializers.IntegerField(min_value=1, required=False)
+    part_url_format = PartUrlFormatField(choices=["full", "template", "proxy"])
+
+
+class PartsResponseSerializer(serializers.Serializer):
+    # Exactly one of "parts" or "part_template" is sent
+    parts = PresignedPartsField()
+    part_template = PartTemplateResponseSerializer(required=False)
+
+
 class TransferredPartRequestSerializer(serializers.Serializer[TransferredPart]):
     part_number = serializers.IntegerField(min_value=1)
     size = serializers.IntegerField(min_value=1)
     etag = serializers.CharField()
 
 
+def _is_plain_etag(etag: Any) -> bool:
+    # Whether a CharField would accept the value unchanged
+    return (
+        type(etag) is str
+        and etag != ""
+        and etag.isascii()
+        and etag.isprintable()
+        and etag.strip() == etag
+    )
+
+
+def _parse_transferred_part(part: Any) -> TransferredPart:
+    part_number, size, etag = part["part_number"], part["size"], part["etag"]
+    # Only accept values which TransferredPartRequestSerializer would leave unchanged
+    if not (
+        type(part_number) is int
+        and part_number >= 1
+        and type(size) is int
+        and size >= 1
+        and _is_plain_etag(etag)
+    ):
+        raise ValueError
+    return TransferredPart(part_number=part_number, size=size, etag=etag)
+
+
+class TransferredPartsField(serializers.Field):
+    """
+    Read and emit TransferredParts, as "TransferredPartRequestSerializer(many=True)" would.
+
+    An upload may have up to 10,000 parts, so well-formed parts are converted directly, which is
+    much faster than running DRF's field machinery for every part. Any other input is validated by
+    TransferredPartRequestSerializer, so the accepted input and errors are unchanged.
+    """
+
+    def __init__(self, *, allow_empty: bool = True, **kwargs: Any) -> None:
+        self.allow_empty = allow_empty
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data: Any) -> list[TransferredPart]:
+        try:
+            parts = [_parse_transferred_part(part) for part in data]
+        except (TypeError, KeyError, ValueError):
+            pass
+        else:
+            if parts or self.allow_empty:
+                return parts
+
+        serializer = TransferredPartRequestSerializer(
+            data=data, many=True, allow_empty=self.allow_empty
+        )
+        if not serializer.is_valid():
+            raise serializers.ValidationError(serializer.errors)
+        return [TransferredPart(**part) for part in serializer.validated_data]
+
+    def to_representation(self, parts: list[TransferredPart]) -> list[dict]:
+        return [
+            {"part_number": part.part_number, "size": part.size, "etag": part.etag}
+            for part in parts
+        ]
+
+
+class PartETagsField(serializers.ListField):
+    """
+    Read a list of ETags, as "ListField(child=CharField())" would.
+
+    Like TransferredPartsField, well-formed input is accepted directly, and anything else is
+    validated by ListField.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(child=serializers.CharField(), **kwargs)
+
+    def to_internal_value(self, data: Any) -> list[str]:
+        if isinstance(data, list) and data and all(_is_plain_etag(etag) for etag in data):
+            return data
+        return super().to_internal_value(data)
+
+
 class UploadCompletionRequestSerializer(serializers.Serializer[TransferredParts]):
     upload_signature = serializers.CharField(trim_whitespace=False)
     upload_id = serializers.CharField()
-    parts = TransferredPartRequestSerializer(many=True, allow_empty=False)
+    # Exactly one of "parts" or "part_etags" is required
+    parts = TransferredPartsField(allow_empty=False, required=False)
+    # The ETag of every part of the upload, in order; since the server planned the parts, their
+    # numbers and sizes are implied, so this is much smaller than "parts"
+    part_etags = PartETagsField(allow_empty=False, required=False)
+    # If set, the server completes the upload itself and responds with a finalized field_value
+    finalize = serializers.BooleanField(default=False)
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if ("parts" in attrs) == ("part_etags" in attrs):
+            raise serializers.ValidationError('Exactly one of "parts" or "part_etags" is required.')
+        upload_signature = _signing.loads_upload_signature(attrs["upload_signature"])
+        if "file_size" not in upload_signature:
+            if "part_etags" in attrs:
+                raise serializers.ValidationError(_LEGACY_UPLOAD_ERROR)
+            # Clients of signatures from before the file size was signed always sent "parts"
+            return attrs
+
+        # The sizes reported by the client can't be trusted, since an object with fewer or
+        # smaller parts would be completed as if it had the signed size; so the parts are always
+        # built from the signed plan, and the client only provides their ETags
+        field = _registry.get_field(upload_signature["field_id"])
+        part_sizes = list(
+            _multipart.MultipartManager.from_storage(field.storage)._iter_part_sizes(
+                upload_signature["file_size"],
+                # Signatures from before part sizes were chosen per upload have no "part_size"
+                upload_signature.get("part_size"),
+            )
+        )
+        if "part_etags" in attrs:
+            part_etags = attrs.pop("part_etags")
+            if len(part_etags) != len(part_sizes):
+                raise serializers.ValidationError(
+                    {"part_etags": [f"Expected {len(part_sizes)} ETags, one for each part."]}
+                )
+        else:
+            parts = sorted(attrs["parts"], key=operator.attrgetter("part_number"))
+            if [(part.part_number, part.size) for part in parts] != part_sizes:
+                raise serializers.ValidationError(
+                    {"parts": [f"Expected the {len(part_sizes)} parts planned for the upload."]}
+                )
+            part_etags = [part.etag for part in parts]
+        attrs["parts"] = [
+            TransferredPart(part_number=part_number, size=size, etag=etag)
+            for (part_number, size), etag in zip(part_sizes, part_etags)
+        ]
+        return attrs
 
     def create(self, validated_data: dict[str, Any]) -> TransferredParts:
-        parts = [
-            TransferredPart(**part)
-            for part in sorted(validated_data.pop("parts"), key=lambda part: part["part_number"])
-        ]
-        upload_signature = signing.loads(validated_data["upload_signature"])
+        parts = sorted(validated_data.pop("parts"), key=operator.attrgetter("part_number"))
+        upload_signature = _signing.loads_upload_signature(validated_data["upload_signature"])
         object_key = upload_signature["object_key"]
         upload_id = validated_data["upload_id"]
         return TransferredParts(parts=parts, object_key=object_key, upload_id=upload_id)
 
 
+class UploadResumptionRequestSerializer(serializers.Serializer):
+    upload_signature = serializers.CharField(trim_whitespace=False)
+    upload_id = serializers.CharField()
+    part_url_format = PartUrlFormatField(choices=["full", "proxy"])
+
+
+class UploadResumptionResponseSerializer(serializers.Serializer):
+    transferred_parts = TransferredPartsField(read_only=True)
+    # If empty, every part is transferred and the upload may be completed
+    parts = PresignedPartsField()
+
+
 class UploadCompletionResponseSerializer(serializers.Serializer):
     complete_url = serializers.URLField()
     body = serializers.CharField(trim_whitespace=False)
 
 
+class BatchRequestSerializer(serializers.Serializer):
+    # Each item is validated separately, so errors can be reported per item
+    items = serializers.ListField(allow_empty=False, max_length=1000)
+
+
+class BatchItemResponseSerializer(serializers.Serializer):
+    # The status and body of the response to the item from the corresponding single-item view
+    status = serializers.IntegerField()
+    # Declared fields are removed from the class, so this doesn't shadow "Serializer.data"
+    data = serializers.JSONField()  # type: ignore[assignment]
+
+
+class BatchResponseSerializer(serializers.Serializer):
+    items = BatchItemResponseSerializer(many=True)
+
+
 class FinalizationRequestSerializer(serializers.Serializer):
     upload_signature = serializers.CharField(trim_whitespace=False)
 
@@ -79,60 +327,387 @@ class FinalizationResponseSerializer(serializers.Serializer):
     field_value = serializers.CharField(trim_whitespace=False)
 
 
-@api_view(["POST"])
-@parser_classes([JSONParser])
-def upload_initialize(request: Request) -> HttpResponseBase:
-    request_serializer = UploadInitializationRequestSerializer(data=request.data)
-    request_serializer.is_valid(raise_exception=True)
-    upload_request: dict = request_serializer.validated_data
-    field = _registry.get_field(upload_request["field_id"])
+class IngestRequestSerializer(serializers.Serializer):
+    field_id = serializers.CharField()
+    source_url = serializers.URLField()
+    # If omitted, these are taken from the source URL and its response
+    file_name = serializers.CharField(trim_whitespace=False, required=False)
+    content_type = serializers.CharField(required=False)
+
+    validate_field_id = UploadInitializationRequestSerializer.validate_field_id
+
+
+class PartProxyResponseSerializer(serializers.Serializer):
+    # Also sent as the "ETag" header, as the object store would
+    etag = serializers.CharField()
+
+
+# Signatures from before the file size was signed don't allow the parts to be planned again
+_LEGACY_UPLOAD_ERROR = "This upload was initialized by an earlier version, and must be restarted."
+
 
-    file_name = upload_request["file_name"]
+def _generate_object_key(field: S3FileField, file_name: str) -> str:
     # TODO: The first argument to generate_filename() is an instance of the model.
     # We do not and will never have an instance of the model during field upload.
     # Maybe we need a different generate method/upload_to with a different signature?
-    object_key = field.generate_filename(None, file_name)
-
-    try:
-        initialization = _multipart.MultipartManager.from_storage(field.storage).initialize_upload(
-            object_key,
-            upload_request["file_size"],
-            upload_request["content_type"],
+    return field.generate_filename(None, file_name)
+
+
+def _proxy_part_transfers(
+    request: HttpRequest,
+    upload_signature: dict,
+    upload_id: str,
+    part_sizes: list[tuple[int, int]],
+) -> list[PresignedPartTransfer]:
+    # The token authorizes uploads to any part of this upload, like a presigned URL does for one
+    part_proxy_token = _signing.dumps_part_proxy_token(
+        field_id=upload_signature["field_id"],
+        object_key=upload_signature["object_key"],
+        upload_id=upload_id,
+        file_size=upload_signature["file_size"],
+        # Signatures from before part sizes were chosen per upload have no "part_size"
+        part_size=upload_signature.get("part_size"),
+    )
+    return [
+        PresignedPartTransfer(
+            part_number=part_number,
+            size=part_size,
+            upload_url=request.build_absolute_uri(
+                reverse("s3_file_field:upload-part-proxy", args=[part_proxy_token, part_number])
+            ),
         )
-    except UploadTooLargeError:
-        return Response("Upload size is too large.", status=400)
+        for part_number, part_size in part_sizes
+    ]
 
+
+def _choose_part_size(
+    field: S3FileField, multipart_manager: _multipart.MultipartManager, upload_request: dict
+) -> tuple[PartSizePolicy, int]:
+    policy = (
+        field.part_size_policy
+        or multipart_manager.part_size_policy
+        or FixedPartSizePolicy(multipart_manager.part_size)
+    )
+    hints = PartSizeHints(**upload_request.get("part_size_hints", {}))
+    return policy, policy.choose_part_size(upload_request["file_size"], hints)
+
+
+def _upload_initialization_response(
+    upload_request: dict,
+    object_key: str,
+    upload_id: str | None,
+    parts: list[PresignedPartTransfer],
+    part_size_policy: PartSizePolicy,
+    part_size: int,
+    part_template: PresignedPartTemplate | None = None,
+) -> Response:
     # signals.s3_file_field_upload_prepare.send(
     #     sender=upload_prepare, name=name, object_key=object_key
     # )
 
-    # We sign the field_id and object_key to create a "session token" for this upload
-    upload_signature = signing.dumps(
+    # We sign the field_id and object_key to create a "session token" for this upload.
+    # The file_size and part_size are also signed, so the remaining parts can be planned again
+    # later, and the content_type is signed, so it can be included in the field_value.
+    upload_signature = _signing.dumps_upload_signature(
+        field_id=upload_request["field_id"],
+        object_key=object_key,
+        file_size=upload_request["file_size"],
+        part_size=part_size,
+        content_type=upload_request["content_type"],
+    )
+
+    response_serializer = UploadInitializationResponseSerializer(
         {
-            "field_id": upload_request["field_id"],
             "object_key": object_key,
+            "upload_id": upload_id,
+            **({"parts": parts} if part_template is None else {"part_template": part_template}),
+            "part_size": part_size,
+            "part_size_policy": part_size_policy.name,
+            "upload_signature": upload_signature,
         }
     )
+    return Response(response_serializer.data)
 
-    response_serializer = UploadInitializationResponseSerializer(
+
+def _finalization_response(
+    object_key: str, file_size: int, etag: str | None, content_type: str | None
+) -> Response:
+    # The ETag and content type are included, so they can be stored without querying the object
+    # store again
+    field_value = _signing.dumps_field_value(
+        object_key=object_key, file_size=file_size, etag=etag, content_type=content_type
+    )
+
+    response_serializer = FinalizationResponseSerializer(
         {
-            "object_key": initialization.object_key,
-            "upload_id": initialization.upload_id,
-            "parts": initialization.parts,
-            "upload_signature": upload_signature,
+            "field_value": field_value,
         }
     )
     return Response(response_serializer.data)
 
 
+def _upload_parts_response(
+    request: HttpRequest, field: S3FileField, upload_signature: dict, parts_request: dict
+) -> Response:
+    multipart_manager = _multipart.MultipartManager.from_storage(field.storage)
+    presign_args = (
+        upload_signature["object_key"],
+        parts_request["upload_id"],
+        upload_signature["file_size"],
+        parts_request["first_part_number"],
+        parts_request.get("part_count"),
+    )
+    # Signatures from before part sizes were chosen per upload have no "part_size"
+    part_size = upload_signature.get("part_size")
+
+    if parts_request["part_url_format"] == "proxy":
+        parts = _proxy_part_transfers(
+            request,
+            upload_signature,
+            parts_request["upload_id"],
+            multipart_manager._window_part_sizes(
+                upload_signature["file_size"],
+                parts_request["first_part_number"],
+                parts_request.get("part_count"),
+                part_size,
+            ),
+        )
+        if not parts:
+            return Response("Part number is out of range.", status=400)
+        return Response(PartsResponseSerializer({"parts": parts}).data)
+
+    if parts_request["part_url_format"] == "template":
+        part_template = multipart_manager.presign_part_template(*presign_args, part_size=part_size)
+        if part_template is not None:
+            return Response(PartsResponseSerializer({"part_template": part_template}).data)
+
+    parts = multipart_manager.presign_parts(*presign_args, part_size=part_size)
+    if not parts:
+        return Response("Part number is out of range.", status=400)
+
+    response_serializer = PartsResponseSerializer(
+        {
+            "parts": parts,
+        }
+    )
+    return Response(response_serializer.data)
+
+
+def _upload_resumption_response(
+    request: HttpRequest,
+    upload_signature: dict,
+    resumption_request: dict,
+    resumed_transfer: ResumedTransfer,
+) -> Response:
+    parts = resumed_transfer.parts
+    if resumption_request["part_url_format"] == "proxy":
+        parts = _proxy_part_transfers(
+            request,
+            upload_signature,
+            resumption_request["upload_id"],
+            [(part.part_number, part.size) for part in parts],
+        )
+
+    response_serializer = UploadResumptionResponseSerializer(
+        {
+            "transferred_parts": resumed_transfer.transferred_parts,
+            "parts": parts,
+        }
+    )
+    return Response(response_serializer.data)
+
+
+def _initialize_upload(request: HttpRequest, data: Any) -> Response:
+    request_serializer = UploadInitializationRequestSerializer(data=data)
+    request_serializer.is_valid(raise_exception=True)
+    upload_request: dict = request_serializer.validated_data
+    field = _registry.get_field(upload_request["field_id"])
+
+    object_key = _generate_object_key(field, upload_request["file_name"])
+
+    multipart_manager = _multipart.MultipartManager.from_storage(field.storage)
+    part_size_policy, part_size = _choose_part_size(field, multipart_manager, upload_request)
+
+    single_part = (
+        multipart_manager.initialize_single_part_upload(
+            object_key,
+            upload_request["file_size"],
+            upload_request["content_type"],
+            part_size=part_size,
+        )
+        # A single part is always uploaded directly to the storage
+        if upload_request["single_part_upload"] and upload_request["part_url_format"] != "proxy"
+        else None
+    )
+    part_template = None
+    if single_part is not None:
+        upload_id = None
+        parts = [single_part]
+    else:
+        try:
+            initialization = multipart_manager.initialize_upload(
+                object_key,
+                upload_request["file_size"],
+                upload_request["content_type"],
+                part_size=part_size,
+                # A template is cheap to presign, if it's discarded for proxied parts
+                part_url_template=upload_request["part_url_format"] != "full",
+            )
+        except UploadTooLargeError:
+            return Response("Upload size is too large.", status=400)
+        upload_id = initialization.upload_id
+        parts = initialization.parts
+        part_template = initialization.part_template
+        if upload_request["part_url_format"] == "proxy":
+            parts = _proxy_part_transfers(
+                request,
+                {**upload_request, "object_key": object_key, "part_size": part_size},
+                upload_id,
+                multipart_manager._window_part_sizes(
+                    upload_request["file_size"], 1, None, part_size
+                ),
+            )
+            part_template = None
+
+    return _upload_initialization_response(
+        upload_request, object_key, upload_id, parts, part_size_policy, part_size, part_template
+    )
+
+
+def _batch_item_response(handler: Callable[[Any], Response], data: Any) -> dict:
+    # Report errors for each item, as the corresponding single-item view would respond
+    try:
+        response = handler(data)
+    except serializers.ValidationError as e:
+        return {"status": e.status_code, "data": e.detail}
+    # A single-item view would fail entirely for the following, but other items shouldn't
+    except signing.BadSignature:
+        return {"status": 400, "data": "Invalid upload signature."}
+    except UnsupportedStorageError:
+        return {"status": 500, "data": "Storage is not supported."}
+    except _multipart.MultipartManager._request_errors():
+        return {"status": 502, "data": "Object store request failed."}
+    return {"status": response.status_code, "data": response.data}
+
+
+def _abort_batch_uploads(items: list[dict | BaseException]) -> list[dict]:
+    """
+    Return the item responses of a batch initialization, or raise the first error of any item.
+
+    The response of a batch which fails can't include the uploads created for its other items, so
+    those are aborted, as they could never be completed.
+    """
+    errors = [item for item in items if isinstance(item, BaseException)]
+    if not errors:
+        return cast(list[dict], items)
+    created_uploads = _multipart.CreatedUploads()
+    for item in items:
+        if isinstance(item, BaseException) or item["status"] != 200:
+            continue
+        if item["data"]["upload_id"] is None:
+            continue
+        created_uploads.on_abort(functools.partial(_abort_batch_upload, item["data"]))
+    created_uploads.abort()
+    raise errors[0]
+
+
+def _abort_batch_upload(data: dict) -> None:
+    upload_signature = _signing.loads_upload_signature(data["upload_signature"])
+    field = _registry.get_field(upload_signature["field_id"])
+    _multipart.MultipartManager.from_storage(field.storage)._abort_upload_id(
+        upload_signature["object_key"], data["upload_id"]
+    )
+
+
 @api_view(["POST"])
 @parser_classes([JSONParser])
-def upload_complete(request: Request) -> HttpResponseBase:
-    request_serializer = UploadCompletionRequestSerializer(data=request.data)
+def upload_initialize(request: Request) -> HttpResponseBase:
+    return _initialize_upload(request, request.data)
+
+
+@api_view(["POST"])
+@parser_classes([JSONParser])
+def upload_initialize_batch(request: Request) -> HttpResponseBase:
+    request_serializer = BatchRequestSerializer(data=request.data)
+    request_serializer.is_valid(raise_exception=True)
+
+    # Each upload is created in the object store concurrently
+    storage_executor = get_storage_executor()
+    futures = [
+        storage_executor.submit(
+            _batch_item_response, functools.partial(_initialize_upload, request), data
+        )
+        for data in request_serializer.validated_data["items"]
+    ]
+    concurrent.futures.wait(futures)
+    items = _abort_batch_uploads([future.exception() or future.result() for future in futures])
+
+    response_serializer = BatchResponseSerializer(
+        {
+            "items": items,
+        }
+    )
+    return Response(response_serializer.data)
+
+
+def _upload_parts(request: HttpRequest, data: Any) -> Response:
+    request_serializer = PartsRequestSerializer(data=data)
+    request_serializer.is_valid(raise_exception=True)
+    parts_request: dict = request_serializer.validated_data
+
+    upload_signature = _signing.loads_upload_signature(parts_request["upload_signature"])
+    if "file_size" not in upload_signature:
+        return Response(_LEGACY_UPLOAD_ERROR, status=400)
+    field = _registry.get_field(upload_signature["field_id"])
+
+    return _upload_parts_response(request, field, upload_signature, parts_request)
+
+
+@api_view(["POST"])
+@parser_classes([JSONParser])
+def upload_parts(request: Request) -> HttpResponseBase:
+    return _upload_parts(request, request.data)
+
+
+def _resume_upload(request: HttpRequest, data: Any) -> Response:
+    request_serializer = UploadResumptionRequestSerializer(data=data)
+    request_serializer.is_valid(raise_exception=True)
+    resumption_request: dict = request_serializer.validated_data
+
+    upload_signature = _signing.loads_upload_signature(resumption_request["upload_signature"])
+    if "file_size" not in upload_signature:
+        return Response(_LEGACY_UPLOAD_ERROR, status=400)
+    field = _registry.get_field(upload_signature["field_id"])
+
+    try:
+        resumed_transfer = _multipart.MultipartManager.from_storage(field.storage).resume_upload(
+            upload_signature["object_key"],
+            resumption_request["upload_id"],
+            upload_signature["file_size"],
+            part_size=upload_signature.get("part_size"),
+        )
+    except UploadNotFoundError:
+        return Response("Upload not found.", status=400)
+
+    return _upload_resumption_response(
+        request, upload_signature, resumption_request, resumed_transfer
+    )
+
+
+@api_view(["POST"])
+@parser_classes([JSONParser])
+def upload_resume(request: Request) -> HttpResponseBase:
+    return _resume_upload(request, request.data)
+
+
+def _complete_upload(data: Any) -> Response:
+    request_serializer = UploadCompletionRequestSerializer(data=data)
     request_serializer.is_valid(raise_exception=True)
     transferred_parts: TransferredParts = request_serializer.save()
 
-    upload_signature = signing.loads(request_serializer.validated_data["upload_signature"])
+    upload_signature = _signing.loads_upload_signature(
+        request_serializer.validated_data["upload_signature"]
+    )
     field = _registry.get_field(upload_signature["field_id"])
 
     # check if upload_prepare signed this less than max age ago
@@ -142,9 +717,23 @@ def upload_complete(request: Request) -> HttpResponseBase:
     # ):
     #     raise BadSignature()
 
-    completed_upload = _multipart.MultipartManager.from_storage(field.storage).complete_upload(
-        transferred_parts
-    )
+    multipart_manager = _multipart.MultipartManager.from_storage(field.storage)
+
+    if request_serializer.validated_data["finalize"]:
+        try:
+            finalized_upload = multipart_manager.finalize_upload(transferred_parts)
+        except UploadCompletionError:
+            return Response("Upload could not be completed.", status=400)
+
+        return _finalization_response(
+            finalized_upload.object_key,
+            finalized_upload.size,
+            finalized_upload.etag,
+            # Signatures from before content types were signed have no "content_type"
+            upload_signature.get("content_type"),
+        )
+
+    completed_upload = multipart_manager.complete_upload(transferred_parts)
 
     # signals.s3_file_field_upload_finalize.send(
     #     sender=multipart_upload_finalize, name=name, object_key=object_key
@@ -161,33 +750,173 @@ def upload_complete(request: Request) -> HttpResponseBase:
 
 @api_view(["POST"])
 @parser_classes([JSONParser])
-def finalize(request: Request) -> HttpResponseBase:
-    request_serializer = FinalizationRequestSerializer(data=request.data)
+def upload_complete(request: Request) -> HttpResponseBase:
+    return _complete_upload(request.data)
+
+
+def _finalize(data: Any) -> Response:
+    request_serializer = FinalizationRequestSerializer(data=data)
     request_serializer.is_valid(raise_exception=True)
 
-    upload_signature = signing.loads(request_serializer.validated_data["upload_signature"])
+    upload_signature = _signing.loads_upload_signature(
+        request_serializer.validated_data["upload_signature"]
+    )
     field_id = upload_signature["field_id"]
     object_key = upload_signature["object_key"]
 
-    field = _registry.get_field(field_id)
+    try:
+        field = _registry.get_field(field_id)
+    except KeyError:
+        # A signature for a field which no longer exists
+        return Response("Invalid field ID.", status=400)
 
-    # get_object_size implicitly verifies that the object exists.
+    # get_object_metadata implicitly verifies that the object exists.
     # We don't want to distribute the field value if the upload did not complete.
     try:
-        size = _multipart.MultipartManager.from_storage(field.storage).get_object_size(object_key)
+        metadata = _multipart.MultipartManager.from_storage(field.storage).get_object_metadata(
+            object_key
+        )
     except ObjectNotFoundError:
         return Response("Object not found", status=400)
 
-    field_value = signing.dumps(
+    return _finalization_response(object_key, metadata.size, metadata.etag, metadata.content_type)
+
+
+@api_view(["POST"])
+@parser_classes([JSONParser])
+def finalize(request: Request) -> HttpResponseBase:
+    return _finalize(request.data)
+
+
+@api_view(["POST"])
+@parser_classes([JSONParser])
+def finalize_batch(request: Request) -> HttpResponseBase:
+    request_serializer = BatchRequestSerializer(data=request.data)
+    request_serializer.is_valid(raise_exception=True)
+
+    # Each object's size is fetched from the object store concurrently
+    items = get_storage_executor().map(
+        functools.partial(_batch_item_response, _finalize),
+        request_serializer.validated_data["items"],
+    )
+
+    response_serializer = BatchResponseSerializer(
         {
-            "object_key": object_key,
-            "file_size": size,
+            "items": items,
         }
     )
+    return Response(response_serializer.data)
 
-    response_serializer = FinalizationResponseSerializer(
+
+@api_view(["PUT"])
+# Like a presigned URL, the token itself authorizes the upload, so clients needn't authenticate
+@authentication_classes([])
+@permission_classes([AllowAny])
+def upload_part_proxy(
+    request: Request, part_proxy_token: str, part_number: int
+) -> HttpResponseBase:
+    if not _proxy.upload_proxy_enabled():
+        return Response("Upload proxying is not enabled.", status=404)
+    try:
+        proxied_upload = _signing.loads_part_proxy_token(part_proxy_token)
+    except signing.BadSignature:
+        return Response("Invalid upload signature.", status=400)
+    field = _registry.get_field(proxied_upload["field_id"])
+    multipart_manager = _multipart.MultipartManager.from_storage(field.storage)
+
+    part_sizes = multipart_manager._window_part_sizes(
+        proxied_upload["file_size"], part_number, 1, proxied_upload["part_size"]
+    )
+    if not part_sizes:
+        return Response("Part number is out of range.", status=400)
+    ((_, part_size),) = part_sizes
+    # The body is streamed, so its length must be known before it's read
+    if request.META.get("CONTENT_LENGTH") != str(part_size):
+        return Response(f"Content-Length must be the part size, {part_size}.", status=400)
+
+    # Each proxied part holds this thread for its whole transfer, so limit them per process
+    semaphore = _proxy.get_proxy_semaphore()
+    if not semaphore.acquire(blocking=False):
+        return Response("Too many proxied uploads.", status=503, headers={"Retry-After": "1"})
+    try:
+        transferred_part = multipart_manager.proxy_part(
+            proxied_upload["object_key"],
+            proxied_upload["upload_id"],
+            part_number,
+            part_size,
+            request.stream,
+        )
+    except UploadNotFoundError:
+        return Response("Upload not found.", status=400)
+    except PartUploadError:
+        return Response("Part could not be uploaded.", status=502)
+    finally:
+        semaphore.release()
+
+    response_serializer = PartProxyResponseSerializer(
         {
-            "field_value": field_value,
+            "etag": transferred_part.etag,
         }
     )
-    return Response(response_serializer.data)
+    return Response(response_serializer.data, headers={"ETag": transferred_part.etag})
+
+
+def _ingest_source(data: Any) -> Response:
+    if not _ingest.ingest_allowed_hosts():
+        return Response("Ingesting is not enabled.", status=404)
+    request_serializer = IngestRequestSerializer(data=data)
+    request_serializer.is_valid(raise_exception=True)
+    ingest_request: dict = request_serializer.validated_data
+    field = _registry.get_field(ingest_request["field_id"])
+    multipart_manager = _multipart.MultipartManager.from_storage(field.storage)
+
+    try:
+        source = _ingest.resolve_source(ingest_request["source_url"])
+    except _ingest.IngestError as e:
+        return Response(str(e), status=400)
+    except _ingest.SourceRequestError:
+        return Response("Source request failed.", status=502)
+    if source.size > multipart_manager.max_object_size:
+        return Response("Upload size is too large.", status=400)
+    object_key = _generate_object_key(field, ingest_request.get("file_name", source.file_name))
+    content_type = (
+        ingest_request.get("content_type") or source.content_type or "application/octet-stream"
+    )
+    _, part_size = _choose_part_size(field, multipart_manager, {"file_size": source.size})
+
+    try:
+        with _multipart.CreatedUploads() as created_uploads:
+            upload_id = created_uploads.create_upload_id(
+                multipart_manager, object_key, content_type
+            )
+            # Each range of the source is streamed to its part concurrently
+            parts = get_transfer_executor().map(
+                functools.partial(
+                    _ingest.ingest_part, multipart_manager, source, object_key, upload_id
+                ),
+                _ingest.plan_part_ranges(multipart_manager, source.size, part_size),
+            )
+            finalized_upload = multipart_manager.finalize_upload(
+                TransferredParts(object_key=object_key, upload_id=upload_id, parts=parts)
+            )
+    except _ingest.IngestError as e:
+        return Response(str(e), status=400)
+    except _ingest.SourceRequestError:
+        return Response("Source request failed.", status=502)
+    except PartUploadError:
+        return Response("Part could not be uploaded.", status=502)
+    # The server transferred every part itself, so the object store is at fault for these
+    except (UploadCompletionError, UploadNotFoundError):
+        return Response("Upload could not be completed.", status=502)
+    except _multipart.MultipartManager._request_errors():
+        return Response("Object store request failed.", status=502)
+
+    return _finalization_response(
+        object_key, finalized_upload.size, finalized_upload.etag, content_type
+    )
+
+
+@api_view(["POST"])
+@parser_classes([JSONParser])
+def ingest(request: Request) -> HttpResponseBase:
+    return _ingest_source(request.data)
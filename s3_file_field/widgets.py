@@ -11,6 +11,8 @@ from django.forms import ClearableFileInput
 from django.forms.widgets import FILE_INPUT_CONTRADICTION, CheckboxInput
 from django.urls import reverse
 
+from . import _signing
+
 if TYPE_CHECKING:
     from django.core.files.uploadedfile import UploadedFile
     from django.utils.datastructures import MultiValueDict
@@ -24,13 +26,43 @@ def get_base_url() -> str:
     return posixpath.commonpath([prepare_url, complete_url])
 
 
+class S3ObjectKey(str):
+    """
+    The key of an uploaded object, carrying the object's metadata from its field_value.
+
+    When this is assigned to an S3FileField, its metadata is stored in the field's
+    companion fields.
+    """
+
+    size: int
+    etag: str | None
+    content_type: str | None
+
+    def __new__(
+        cls, object_key: str, size: int, etag: str | None = None, content_type: str | None = None
+    ) -> S3ObjectKey:
+        self = super().__new__(cls, object_key)
+        self.size = size
+        self.etag = etag
+        self.content_type = content_type
+        return self
+
+    def __getnewargs__(self) -> tuple[str, int, str | None, str | None]:  # type: ignore[override]
+        # Pickling and copying must pass the metadata to "__new__" too
+        return str(self), self.size, self.etag, self.content_type
+
+
 class S3PlaceholderFile(File):
     name: str
     size: int
 
-    def __init__(self, name: str, size: int) -> None:
+    def __init__(
+        self, name: str, size: int, etag: str | None = None, content_type: str | None = None
+    ) -> None:
         self.name = name
         self.size = size
+        self.etag = etag
+        self.content_type = content_type
 
     def open(
         self,
@@ -44,8 +76,9 @@ class S3PlaceholderFile(File):
     ) -> NoReturn:
         raise NotImplementedError
 
-    def close(self) -> NoReturn:
-        raise NotImplementedError
+    def close(self) -> None:
+        # There's nothing to close, but Django closes every uploaded file after a request
+        pass
 
     def chunks(self, chunk_size: int | None = None) -> NoReturn:
         raise NotImplementedError
@@ -57,11 +90,19 @@ class S3PlaceholderFile(File):
     @classmethod
     def from_field(cls, field_value: str) -> S3PlaceholderFile | None:
         try:
-            parsed_field = signing.loads(field_value)
+            parsed_field = _signing.loads_field_value(field_value)
         except signing.BadSignature:
             return None
         # Since the field is signed, we know the content is structurally valid
-        return cls(parsed_field["object_key"], parsed_field["file_size"])
+        return cls(
+            parsed_field["object_key"],
+            parsed_field["file_size"],
+            parsed_field.get("etag"),
+            parsed_field.get("content_type"),
+        )
+
+    def to_object_key(self) -> S3ObjectKey:
+        return S3ObjectKey(self.name, self.size, self.etag, self.content_type)
 
 
 class S3FileInput(ClearableFileInput):
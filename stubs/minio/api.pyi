@@ -1,13 +1,14 @@
 from datetime import datetime, timedelta
-from typing import Any, Mapping
+from typing import Any, BinaryIO, Mapping
 
 from urllib3 import PoolManager
 
-from .datatypes import Object
+from .datatypes import CompleteMultipartUploadResult, ListPartsResult, Object, Part
 from .provider import Provider
 from .sse import SseCustomerKey
 
 class Minio:
+    _provider: Provider | None
     def __init__(
         self,
         endpoint: str,
@@ -28,6 +29,15 @@ class Minio:
         version_id: str | None = ...,
         extra_query_params: Mapping[str, Any] | None = ...,
     ) -> Object: ...
+    def put_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        data: BinaryIO,
+        length: int,
+        content_type: str = ...,
+        metadata: Mapping[str, Any] | None = ...,
+    ) -> Any: ...
     def get_presigned_url(
         self,
         method: str,
@@ -45,3 +55,16 @@ class Minio:
     def _abort_multipart_upload(
         self, bucket_name: str, object_name: str, upload_id: str
     ) -> None: ...
+    def _complete_multipart_upload(
+        self, bucket_name: str, object_name: str, upload_id: str, parts: list[Part]
+    ) -> CompleteMultipartUploadResult: ...
+    def _list_parts(
+        self,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        max_parts: int | None = ...,
+        part_number_marker: str | None = ...,
+        extra_headers: Mapping[str, Any] | None = ...,
+        extra_query_params: Mapping[str, Any] | None = ...,
+    ) -> ListPartsResult: ...
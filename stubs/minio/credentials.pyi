@@ -0,0 +1,11 @@
+from datetime import datetime
+
+class Credentials:
+    @property
+    def access_key(self) -> str: ...
+    @property
+    def secret_key(self) -> str: ...
+    @property
+    def session_token(self) -> str | None: ...
+    @property
+    def expiration(self) -> datetime | None: ...
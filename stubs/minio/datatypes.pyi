@@ -30,3 +30,38 @@ class Object:
     def is_delete_marker(self) -> bool: ...
     @property
     def content_type(self) -> str | None: ...
+
+class Part:
+    def __init__(
+        self,
+        part_number: int,
+        etag: str,
+        last_modified: datetime | None = ...,
+        size: int | None = ...,
+    ) -> None: ...
+    @property
+    def part_number(self) -> int: ...
+    @property
+    def etag(self) -> str: ...
+    @property
+    def last_modified(self) -> datetime | None: ...
+    @property
+    def size(self) -> int | None: ...
+
+class CompleteMultipartUploadResult:
+    @property
+    def bucket_name(self) -> str | None: ...
+    @property
+    def object_name(self) -> str | None: ...
+    @property
+    def etag(self) -> str | None: ...
+    @property
+    def version_id(self) -> str | None: ...
+
+class ListPartsResult:
+    @property
+    def next_part_number_marker(self) -> str | None: ...
+    @property
+    def is_truncated(self) -> bool: ...
+    @property
+    def parts(self) -> list[Part]: ...
@@ -1 +1,4 @@
-class Provider: ...
+from .credentials import Credentials
+
+class Provider:
+    def retrieve(self) -> Credentials: ...
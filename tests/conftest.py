@@ -1,15 +1,20 @@
+import importlib
 from typing import Generator
 
 from django.core.files.base import ContentFile
+from django.test import override_settings
+from django.urls import clear_url_caches
 import factory
 import pytest
 from pytest_mock import MockerFixture
 from rest_framework.test import APIClient
 
+from s3_file_field import _concurrency, urls
 from s3_file_field._multipart import MultipartManager
 from s3_file_field._sizes import mb
 
 from test_app.models import Resource
+import test_app.urls
 
 # Explicitly load s3_file_field fixtures, late in Pytest plugin load order.
 # If this is auto-loaded via entry point, the import happens before coverage tracing is started by
@@ -27,6 +32,32 @@ def _reduce_part_size(mocker: MockerFixture) -> None:
     mocker.patch.object(MultipartManager, "part_size", new=mb(5))
 
 
+@pytest.fixture()
+def _storage_executor() -> Generator[None, None, None]:
+    """Use new, small StorageExecutors, so their stats are isolated."""
+    with override_settings(S3FF_STORAGE_MAX_WORKERS=10, S3FF_TRANSFER_MAX_WORKERS=4):
+        _concurrency.get_storage_executor.cache_clear()
+        _concurrency.get_transfer_executor.cache_clear()
+        yield
+    _concurrency.get_storage_executor.cache_clear()
+    _concurrency.get_transfer_executor.cache_clear()
+
+
+def _reload_urls() -> None:
+    importlib.reload(urls)
+    # The root URLconf holds a resolver for the old URLconf module, so must also be reloaded
+    importlib.reload(test_app.urls)
+    clear_url_caches()
+
+
+@pytest.fixture()
+def _async_views() -> Generator[None, None, None]:
+    with override_settings(S3FF_ASYNC_VIEWS=True):
+        _reload_urls()
+        yield
+    _reload_urls()
+
+
 @pytest.fixture()
 def api_client() -> APIClient:
     return APIClient()
@@ -1,9 +1,15 @@
 from django.forms import ModelForm
 
-from .models import Resource
+from .models import MetadataResource, Resource
 
 
 class ResourceForm(ModelForm):
     class Meta:
         model = Resource
         fields = "__all__"
+
+
+class MetadataResourceForm(ModelForm):
+    class Meta:
+        model = MetadataResource
+        fields = "__all__"
@@ -10,3 +10,13 @@ class Resource(models.Model):
 class MultiResource(models.Model):
     blob = S3FileField()
     optional_blob = S3FileField(blank=True)
+
+
+class MetadataResource(models.Model):
+    blob = S3FileField(
+        size_field="blob_size", etag_field="blob_etag", content_type_field="blob_content_type"
+    )
+    # Declared after "blob", so Model.__init__ sets these after it
+    blob_size = models.PositiveBigIntegerField(null=True, editable=False)
+    blob_etag = models.CharField(max_length=100, null=True, editable=False)
+    blob_content_type = models.CharField(max_length=255, null=True, editable=False)
@@ -1,9 +1,22 @@
 from rest_framework import serializers
 
-from .models import Resource
+from s3_file_field.rest_framework import S3FileListSerializer
+
+from .models import MetadataResource, Resource
 
 
 class ResourceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Resource
         fields = "__all__"
+
+
+class ResourceBulkSerializer(ResourceSerializer):
+    class Meta(ResourceSerializer.Meta):
+        list_serializer_class = S3FileListSerializer
+
+
+class MetadataResourceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = MetadataResource
+        fields = "__all__"
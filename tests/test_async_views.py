@@ -0,0 +1,357 @@
+import asyncio
+import time
+from typing import cast
+
+from django.core import signing
+from django.core.files.storage import default_storage
+from django.test import AsyncClient
+from django.urls import resolve, reverse
+import pytest
+from pytest_mock import MockerFixture
+import requests
+from rest_framework.test import APIClient
+
+from s3_file_field import _signing, storage_executor_stats
+from s3_file_field._multipart import MultipartManager
+from s3_file_field._sizes import mb
+
+from fuzzy import FUZZY_UPLOAD_ID, FUZZY_URL, Fuzzy
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_views_selected() -> None:
+    view = resolve(reverse("s3_file_field:upload-initialize")).func
+    assert asyncio.iscoroutinefunction(view)
+
+
+def test_sync_views_selected() -> None:
+    view = resolve(reverse("s3_file_field:upload-initialize")).func
+    assert not asyncio.iscoroutinefunction(view)
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_prepare(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "object_key": Fuzzy(
+            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}/test.txt"
+        ),
+        "upload_id": FUZZY_UPLOAD_ID,
+        "parts": [{"part_number": 1, "size": 10, "upload_url": FUZZY_URL}],
+        "part_size": mb(5),
+        "part_size_policy": "fixed",
+        "upload_signature": Fuzzy(r".*:.*"),
+    }
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_prepare_proxy(api_client: APIClient, settings) -> None:
+    settings.S3FF_UPLOAD_PROXY = True
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+            "part_url_format": "proxy",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data["parts"] == [
+        {
+            "part_number": 1,
+            "size": 10,
+            "upload_url": Fuzzy(r"^http://testserver/api/s3ff_test/upload-part-proxy/.+/1/$"),
+        }
+    ]
+
+    # Proxied parts are always uploaded by the sync view
+    part_resp = api_client.put(
+        resp.data["parts"][0]["upload_url"], b"a" * 10, content_type="application/octet-stream"
+    )
+    assert part_resp.status_code == 200
+    MultipartManager.from_storage(default_storage)._abort_upload_id(
+        resp.data["object_key"], resp.data["upload_id"]
+    )
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_prepare_invalid(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "bad.field.id",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert resp.data == {"field_id": ['Invalid field ID: "bad.field.id".']}
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_method_not_allowed(api_client: APIClient) -> None:
+    resp = api_client.get(reverse("s3_file_field:upload-initialize"))
+    assert resp.status_code == 405
+
+
+@pytest.mark.usefixtures("_async_views")
+@pytest.mark.parametrize("file_size", [10, mb(12)], ids=["10B", "12MB"])
+def test_async_full_upload_flow(api_client: APIClient, file_size: int) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": file_size,
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    initialization = cast(dict, resp.data)
+
+    parts = []
+    for part in initialization["parts"]:
+        part_resp = requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5)
+        part_resp.raise_for_status()
+        parts.append(
+            {
+                "part_number": part["part_number"],
+                "size": part["size"],
+                "etag": part_resp.headers["ETag"],
+            }
+        )
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_id": initialization["upload_id"],
+            "parts": parts,
+            "upload_signature": initialization["upload_signature"],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert _signing.loads_field_value(cast(dict, resp.data)["field_value"]) == {
+        "object_key": initialization["object_key"],
+        "file_size": file_size,
+        "etag": Fuzzy(r"[0-9a-f]{32}-\d+"),
+        "content_type": "text/plain",
+    }
+
+    # Finalization is idempotent, so may still be requested separately
+    resp = api_client.post(
+        reverse("s3_file_field:finalize"),
+        {
+            "upload_signature": initialization["upload_signature"],
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert _signing.loads_field_value(cast(dict, resp.data)["field_value"]) == {
+        "object_key": initialization["object_key"],
+        "file_size": file_size,
+        "etag": Fuzzy(r"[0-9a-f]{32}-\d+"),
+        "content_type": "text/plain",
+    }
+
+    default_storage.delete(initialization["object_key"])
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_upload_resume(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    initialization = cast(dict, resp.data)
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-resume"),
+        {
+            "upload_signature": initialization["upload_signature"],
+            "upload_id": initialization["upload_id"],
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "transferred_parts": [],
+        "parts": [
+            {"part_number": 1, "size": mb(5), "upload_url": FUZZY_URL},
+            {"part_number": 2, "size": mb(5), "upload_url": FUZZY_URL},
+            {"part_number": 3, "size": mb(2), "upload_url": FUZZY_URL},
+        ],
+    }
+
+
+@pytest.mark.usefixtures("_async_views", "_storage_executor")
+def test_async_upload_parts(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    initialization = cast(dict, resp.data)
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-parts"),
+        {
+            "upload_signature": initialization["upload_signature"],
+            "upload_id": initialization["upload_id"],
+            "first_part_number": 3,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {"parts": [{"part_number": 3, "size": mb(2), "upload_url": FUZZY_URL}]}
+    # Looking up credentials may block, so presigning isn't done on the event loop
+    assert storage_executor_stats().completed == 2
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_finalize_not_found(api_client: APIClient) -> None:
+    upload_signature = signing.dumps(
+        {
+            "field_id": "test_app.Resource.blob",
+            "object_key": "does-not-exist.txt",
+            "file_size": 10,
+        }
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:finalize"),
+        {
+            "upload_signature": upload_signature,
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.usefixtures("_async_views", "_storage_executor")
+def test_async_prepare_concurrent(mocker: MockerFixture) -> None:
+    def slow_create_upload_id(object_key: str, content_type: str) -> str:
+        time.sleep(0.05)
+        return "fake-upload-id"
+
+    mocker.patch.object(
+        MultipartManager.from_storage(default_storage),
+        "_create_upload_id",
+        side_effect=slow_create_upload_id,
+    )
+
+    async def prepare_many(count: int) -> list[int]:
+        client = AsyncClient()
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    reverse("s3_file_field:upload-initialize"),
+                    {
+                        "field_id": "test_app.Resource.blob",
+                        "file_name": "test.txt",
+                        "file_size": 10,
+                        "content_type": "text/plain",
+                    },
+                    content_type="application/json",
+                )
+                for _ in range(count)
+            )
+        )
+        return [resp.status_code for resp in responses]
+
+    assert asyncio.run(prepare_many(200)) == [200] * 200
+
+    stats = storage_executor_stats()
+    # Many more initializations were in flight at once than threads were used
+    assert stats.peak_in_flight > stats.max_workers
+    assert stats.peak_active == 10
+    assert stats.in_flight == 0
+    assert stats.completed == 200
+
+
+@pytest.mark.usefixtures("_async_views", "_storage_executor")
+def test_async_prepare_batch(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize-batch"),
+        {
+            "items": [
+                {
+                    "field_id": "test_app.Resource.blob",
+                    "file_name": f"test-{i}.txt",
+                    "file_size": mb(10),
+                    "content_type": "text/plain",
+                }
+                for i in range(20)
+            ]
+            + [
+                {
+                    "field_id": "bad.field.id",
+                    "file_name": "test.txt",
+                    "file_size": 10,
+                    "content_type": "text/plain",
+                }
+            ]
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    items = cast(dict, resp.data)["items"]
+    assert [item["status"] for item in items] == [200] * 20 + [400]
+    assert [item["data"]["object_key"] for item in items[:20]] == [
+        Fuzzy(rf".*/test-{i}.txt") for i in range(20)
+    ]
+    assert items[20]["data"] == {"field_id": ['Invalid field ID: "bad.field.id".']}
+
+    # Every item is handled in the storage executor, including the invalid one, then the batch is
+    # checked for errors
+    assert storage_executor_stats().completed == 22
+
+
+@pytest.mark.usefixtures("_async_views")
+def test_async_finalize_batch(api_client: APIClient) -> None:
+    upload_signature = signing.dumps(
+        {
+            "field_id": "test_app.Resource.blob",
+            "object_key": "does-not-exist.txt",
+            "file_size": 10,
+        }
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:finalize-batch"),
+        {"items": [{"upload_signature": upload_signature}, {"upload_signature": "bad-signature"}]},
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "items": [
+            {"status": 400, "data": "Object not found"},
+            {"status": 400, "data": "Invalid upload signature."},
+        ]
+    }
@@ -0,0 +1,203 @@
+from io import BytesIO, StringIO
+import pathlib
+from typing import Any
+
+from django.core.files.storage import default_storage
+from django.core.management import CommandError, call_command
+import pytest
+from pytest_mock import MockerFixture
+from storages.backends.s3 import S3Storage
+
+from s3_file_field import upload_files
+from s3_file_field._multipart import MultipartManager
+from s3_file_field._sizes import mb
+
+from fuzzy import Fuzzy
+from test_app.models import MetadataResource, Resource
+
+
+@pytest.fixture()
+def import_dir(tmp_path: pathlib.Path) -> pathlib.Path:
+    (tmp_path / "large.bin").write_bytes(b"a" * (mb(10) + 10))
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "small.txt").write_bytes(b"test content")
+    (tmp_path / "sub" / "empty").write_bytes(b"")
+    return tmp_path
+
+
+IMPORT_FILES = ["large.bin", "sub/empty", "sub/small.txt"]
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_upload_files(import_dir: pathlib.Path) -> None:
+    paths = [import_dir / file_name for file_name in IMPORT_FILES]
+
+    object_keys = upload_files(Resource._meta.get_field("blob"), paths)
+
+    assert [
+        (object_key, object_key.size, object_key.etag, object_key.content_type)
+        for object_key in object_keys
+    ] == [
+        (
+            Fuzzy(r"^[0-9a-f-]{36}/large\.bin$"),
+            mb(10) + 10,
+            Fuzzy(r"^[0-9a-f]{32}-3$"),
+            "application/octet-stream",
+        ),
+        (Fuzzy(r"^[0-9a-f-]{36}/empty$"), 0, Fuzzy(r"^[0-9a-f]{32}$"), "application/octet-stream"),
+        (Fuzzy(r"^[0-9a-f-]{36}/small\.txt$"), 12, Fuzzy(r"^[0-9a-f]{32}$"), "text/plain"),
+    ]
+    for path, object_key in zip(paths, object_keys):
+        with default_storage.open(object_key) as stored_file:
+            assert stored_file.read() == path.read_bytes()
+        default_storage.delete(object_key)
+
+
+def test_upload_files_aborted(import_dir: pathlib.Path, mocker: MockerFixture) -> None:
+    manager = MultipartManager.from_storage(default_storage)
+    mocker.patch.object(manager, "proxy_part", side_effect=RuntimeError)
+    abort_upload_id = mocker.spy(manager, "_abort_upload_id")
+    storage_delete = mocker.spy(default_storage, "delete")
+
+    with pytest.raises(RuntimeError):
+        upload_files(
+            Resource._meta.get_field("blob"),
+            [import_dir / file_name for file_name in IMPORT_FILES],
+        )
+
+    abort_upload_id.assert_called_once()
+    # The single part uploads may have succeeded, so are deleted
+    assert storage_delete.call_count == 2
+    for call in storage_delete.call_args_list:
+        assert not default_storage.exists(call.args[0])
+
+
+def test_upload_files_aborted_create(import_dir: pathlib.Path, mocker: MockerFixture) -> None:
+    (import_dir / "large-2.bin").write_bytes(b"a" * (mb(10) + 10))
+    manager = MultipartManager.from_storage(default_storage)
+    create_upload_id = manager._create_upload_id
+
+    def fail_create_upload_id(object_key: str, *args: Any) -> str:
+        if object_key.endswith("large-2.bin"):
+            raise RuntimeError
+        return create_upload_id(object_key, *args)
+
+    mocker.patch.object(manager, "_create_upload_id", side_effect=fail_create_upload_id)
+    abort_upload_id = mocker.spy(manager, "_abort_upload_id")
+
+    with pytest.raises(RuntimeError):
+        upload_files(
+            Resource._meta.get_field("blob"),
+            [import_dir / "large.bin", import_dir / "large-2.bin"],
+        )
+
+    # The upload which was created is aborted, even though no part was transferred
+    abort_upload_id.assert_called_once()
+    object_key = abort_upload_id.call_args.args[0]
+    assert object_key.endswith("large.bin")
+    assert not list(manager._iter_uploads(object_key))
+
+
+def test_put_object_s3() -> None:
+    s3_storage = S3Storage(
+        access_key="minioAccessKey",
+        secret_key="minioSecretKey",
+        endpoint_url="http://localhost:9000",
+        region_name="us-east-1",
+        bucket_name="s3ff-test-put-object",
+    )
+    s3_storage.bucket.create()
+    manager = MultipartManager.from_storage(s3_storage)
+
+    # "Content-Type" and "Content-Length" are both presigned
+    finalized_upload = manager.put_object(
+        "test-key", len(b"test content"), "text/plain", BytesIO(b"test content")
+    )
+
+    assert finalized_upload.etag == Fuzzy(r"^[0-9a-f]{32}$")
+    assert manager.get_object_metadata("test-key").content_type == "text/plain"
+    s3_storage.bucket.objects.all().delete()
+    s3_storage.bucket.delete()
+
+
+@pytest.mark.django_db()
+def test_import_files_command(import_dir: pathlib.Path) -> None:
+    stdout = StringIO()
+
+    call_command(
+        "s3ff_import_files",
+        "test_app.MetadataResource.blob",
+        str(import_dir),
+        batch_size=2,
+        stdout=stdout,
+    )
+
+    assert stdout.getvalue() == (
+        "Imported 3 files to test_app.MetadataResource.blob: 3 created, 0 updated.\n"
+    )
+    resources = MetadataResource.objects.order_by("pk")
+    # Directories are walked in order
+    assert [
+        (resource.blob.name, resource.blob_size, resource.blob_content_type)
+        for resource in resources
+    ] == [
+        (Fuzzy(r"/large\.bin$"), mb(10) + 10, "application/octet-stream"),
+        (Fuzzy(r"/empty$"), 0, "application/octet-stream"),
+        (Fuzzy(r"/small\.txt$"), 12, "text/plain"),
+    ]
+    for resource in resources:
+        resource.blob.delete(save=False)
+
+
+@pytest.mark.django_db()
+def test_import_files_command_manifest(import_dir: pathlib.Path) -> None:
+    resource = MetadataResource.objects.create(blob="old-key", blob_size=1)
+    (import_dir / "manifest.csv").write_text(f"path,pk\nsub/small.txt,{resource.pk}\nsub/empty,\n")
+    stdout = StringIO()
+
+    call_command(
+        "s3ff_import_files",
+        "test_app.MetadataResource.blob",
+        manifest=str(import_dir / "manifest.csv"),
+        stdout=stdout,
+    )
+
+    assert stdout.getvalue() == (
+        "Imported 2 files to test_app.MetadataResource.blob: 1 created, 1 updated.\n"
+    )
+    resource.refresh_from_db()
+    assert resource.blob.name == Fuzzy(r"/small\.txt$")
+    assert resource.blob_size == 12
+    assert resource.blob_etag == Fuzzy(r"^[0-9a-f]{32}$")
+    for imported_resource in MetadataResource.objects.all():
+        imported_resource.blob.delete(save=False)
+
+
+@pytest.mark.django_db()
+def test_import_files_command_missing_row(import_dir: pathlib.Path, mocker: MockerFixture) -> None:
+    (import_dir / "manifest.csv").write_text("path,pk\nsub/small.txt,1000\n")
+    upload_files = mocker.patch("s3_file_field.management.commands.s3ff_import_files.upload_files")
+
+    with pytest.raises(CommandError, match=r"^Rows not found: 1000$"):
+        call_command(
+            "s3ff_import_files",
+            "test_app.MetadataResource.blob",
+            manifest=str(import_dir / "manifest.csv"),
+        )
+
+    upload_files.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["bad.field.id", "."], "Invalid field ID: bad.field.id"),
+        (["test_app.Resource.blob"], "Either paths or a manifest must be given."),
+    ],
+    ids=["field-id", "no-paths"],
+)
+def test_import_files_command_invalid(args: list[str], message: str) -> None:
+    with pytest.raises(CommandError) as exc_info:
+        call_command("s3ff_import_files", *args)
+
+    assert str(exc_info.value) == message
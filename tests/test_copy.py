@@ -0,0 +1,229 @@
+from io import BytesIO, StringIO
+from typing import Generator, cast
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage, storages
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from minio_storage.storage import MinioMediaStorage
+import pytest
+from pytest_mock import MockerFixture
+from storages.backends.s3 import S3Storage
+
+from s3_file_field import copy_objects
+from s3_file_field._multipart import CopyNotSupportedError, MultipartManager
+from s3_file_field._sizes import mb
+
+from fuzzy import Fuzzy
+from test_app.models import Resource
+
+
+@pytest.fixture()
+def destination_storage() -> MinioMediaStorage:
+    return MinioMediaStorage(bucket_name="s3ff-test-copy", auto_create_bucket=True)
+
+
+@pytest.fixture()
+def object_keys() -> Generator[list[str], None, None]:
+    object_keys = [
+        default_storage.save("test-key", ContentFile(b"a" * (mb(10) + 10))),
+        default_storage.save("dir/tëst key+1.txt", ContentFile(b"test content")),
+        default_storage.save("empty-key", ContentFile(b"")),
+    ]
+    yield object_keys
+    for object_key in object_keys:
+        default_storage.delete(object_key)
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_copy_objects(object_keys: list[str], destination_storage: MinioMediaStorage) -> None:
+    finalized_uploads = copy_objects(
+        default_storage, destination_storage, [*object_keys, "nonexistent-key"]
+    )
+
+    assert [
+        (finalized_upload.size, finalized_upload.etag) if finalized_upload else None
+        for finalized_upload in finalized_uploads
+    ] == [
+        (mb(10) + 10, Fuzzy(r"^[0-9a-f]{32}-3$")),
+        (len(b"test content"), Fuzzy(r"^[0-9a-f]{32}-1$")),
+        (0, Fuzzy(r"^[0-9a-f]{32}-1$")),
+        None,
+    ]
+    for object_key in object_keys:
+        with default_storage.open(object_key) as source_file, destination_storage.open(
+            object_key
+        ) as destination_file:
+            assert destination_file.read() == source_file.read()
+        destination_storage.delete(object_key)
+
+
+def test_copy_objects_s3() -> None:
+    storage_kwargs = {
+        "access_key": "minioAccessKey",
+        "secret_key": "minioSecretKey",
+        "endpoint_url": "http://localhost:9000",
+        "region_name": "us-east-1",
+    }
+    source_storage = S3Storage(
+        bucket_name="s3ff-test-copy-source",
+        object_parameters={
+            "CacheControl": "max-age=60",
+            "ContentDisposition": "attachment",
+            "Metadata": {"owner": "test"},
+        },
+        **storage_kwargs,
+    )
+    destination_storage = S3Storage(bucket_name="s3ff-test-copy-destination", **storage_kwargs)
+    for storage in [source_storage, destination_storage]:
+        storage.bucket.create()
+    object_key = source_storage.save("test-key", ContentFile(b"a" * (mb(5) + 10)))
+
+    (finalized_upload,) = copy_objects(source_storage, destination_storage, [object_key])
+
+    assert finalized_upload is not None
+    assert finalized_upload.size == mb(5) + 10
+    with destination_storage.open(object_key) as destination_file:
+        assert destination_file.read() == b"a" * (mb(5) + 10)
+    # Like a single copy, the metadata is also copied
+    assert MultipartManager.from_storage(destination_storage).get_object_metadata(
+        object_key
+    ).headers == {
+        "cache-control": "max-age=60",
+        "content-disposition": "attachment",
+        "x-amz-meta-owner": "test",
+    }
+    for storage in [source_storage, destination_storage]:
+        storage.bucket.objects.all().delete()
+        storage.bucket.delete()
+
+
+def test_copy_objects_metadata(destination_storage: MinioMediaStorage) -> None:
+    source_storage = cast(MinioMediaStorage, default_storage)
+    source_storage.client.put_object(
+        source_storage.bucket_name,
+        "metadata-key",
+        BytesIO(b"test content"),
+        len(b"test content"),
+        content_type="text/csv",
+        metadata={"Content-Encoding": "identity", "x-amz-meta-owner": "test"},
+    )
+
+    copy_objects(default_storage, destination_storage, ["metadata-key"])
+
+    metadata = MultipartManager.from_storage(destination_storage).get_object_metadata(
+        "metadata-key"
+    )
+    assert metadata.content_type == "text/csv"
+    assert metadata.headers == {"content-encoding": "identity", "x-amz-meta-owner": "test"}
+    default_storage.delete("metadata-key")
+    destination_storage.delete("metadata-key")
+
+
+def test_copy_objects_unsupported(destination_storage: MinioMediaStorage) -> None:
+    s3_storage = S3Storage(
+        access_key="fakeAccessKey",
+        secret_key="fakeSecretKey",
+        region_name="us-east-1",
+        bucket_name="fake-bucket",
+    )
+
+    with pytest.raises(CopyNotSupportedError):
+        copy_objects(s3_storage, destination_storage, ["test-key"])
+
+
+def test_copy_objects_aborted(
+    object_keys: list[str], destination_storage: MinioMediaStorage, mocker: MockerFixture
+) -> None:
+    destination = MultipartManager.from_storage(destination_storage)
+    mocker.patch.object(destination, "_copy_part", side_effect=RuntimeError)
+    abort_upload_id = mocker.spy(destination, "_abort_upload_id")
+
+    with pytest.raises(RuntimeError):
+        copy_objects(default_storage, destination_storage, object_keys)
+
+    assert abort_upload_id.call_count == len(object_keys)
+    assert not destination_storage.exists(object_keys[0])
+
+
+def test_copy_objects_aborted_create(
+    object_keys: list[str], destination_storage: MinioMediaStorage, mocker: MockerFixture
+) -> None:
+    destination = MultipartManager.from_storage(destination_storage)
+    create_upload_id = destination._create_upload_id
+
+    def fail_create_upload_id(object_key: str, *args: object) -> str:
+        if object_key == object_keys[1]:
+            raise RuntimeError
+        return create_upload_id(object_key, *args)  # type: ignore[arg-type]
+
+    mocker.patch.object(destination, "_create_upload_id", side_effect=fail_create_upload_id)
+    abort_upload_id = mocker.spy(destination, "_abort_upload_id")
+
+    with pytest.raises(RuntimeError):
+        copy_objects(default_storage, destination_storage, object_keys)
+
+    # Every upload which was created is aborted, even though copying never began
+    assert abort_upload_id.call_count == len(object_keys) - 1
+    assert not list(destination._iter_uploads(""))
+
+
+@pytest.fixture()
+def _copy_storage(destination_storage: MinioMediaStorage) -> Generator[None, None, None]:
+    with override_settings(
+        STORAGES={
+            **storages.backends,
+            "copy": {
+                "BACKEND": "minio_storage.storage.MinioMediaStorage",
+                "OPTIONS": {"bucket_name": destination_storage.bucket_name},
+            },
+        }
+    ):
+        yield
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("_copy_storage")
+def test_copy_objects_command(object_keys: list[str]) -> None:
+    Resource.objects.bulk_create(
+        [
+            Resource(blob=object_keys[0]),
+            Resource(blob=object_keys[0]),
+            Resource(blob=object_keys[1]),
+            Resource(blob="nonexistent-key"),
+            Resource(blob=""),
+        ]
+    )
+    stdout, stderr = StringIO(), StringIO()
+
+    call_command(
+        "s3ff_copy_objects",
+        "test_app.Resource.blob",
+        source="default",
+        destination="copy",
+        batch_size=2,
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+    assert stdout.getvalue() == "Copied 2 objects of test_app.Resource.blob, 1 not found.\n"
+    assert stderr.getvalue() == "Object not found in source storage: nonexistent-key\n"
+    copy_storage = storages["copy"]
+    for object_key in object_keys[:2]:
+        assert copy_storage.exists(object_key)
+        copy_storage.delete(object_key)
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["bad.field.id", "--source=default"], "Invalid field ID: bad.field.id"),
+        (["test_app.Resource.blob", "--source=nonexistent"], Fuzzy(r"nonexistent")),
+    ],
+    ids=["field-id", "storage"],
+)
+def test_copy_objects_command_invalid(args: list[str], message: str) -> None:
+    with pytest.raises(CommandError) as exc_info:
+        call_command("s3ff_copy_objects", *args)
+
+    assert str(exc_info.value) == message
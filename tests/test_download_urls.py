@@ -0,0 +1,127 @@
+import datetime
+
+import botocore.auth
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+import pytest
+from pytest_mock import MockerFixture
+import requests
+from storages.backends.s3 import S3Storage
+
+from s3_file_field import field_file_urls, queryset_file_urls
+from s3_file_field._download_urls import presign_download_urls
+
+from test_app.models import MultiResource, Resource
+
+
+@pytest.fixture()
+def s3_storage(mocker: MockerFixture) -> S3Storage:
+    # Sign every URL at the same time, so they're reproducible
+    mocker.patch.object(
+        botocore.auth,
+        "get_current_datetime",
+        return_value=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    return S3Storage(
+        access_key="fakeAccessKey",
+        secret_key="fakeSecretKey",
+        region_name="us-east-1",
+        bucket_name="fake-bucket",
+        location="media",
+        signature_version="s3v4",
+    )
+
+
+NAMES = ["test-key", "dir/test key+1.txt", "dir/tëst~(2)!.txt", "dir/../test-key", "dir\\test-key"]
+
+
+def test_presign_download_urls_s3(s3_storage: S3Storage, mocker: MockerFixture) -> None:
+    storage_url = mocker.spy(s3_storage, "url")
+    expected_urls = [s3_storage.url(name) for name in NAMES]
+    storage_url.reset_mock()
+
+    assert presign_download_urls(s3_storage, NAMES) == expected_urls
+    # Only the first name and the unclean names are presigned by the storage
+    assert storage_url.call_count == 3
+
+
+def test_presign_download_urls_minio(mocker: MockerFixture) -> None:
+    storage_url = mocker.spy(default_storage, "url")
+    names = [default_storage.save(name, ContentFile(name.encode())) for name in NAMES[:3]]
+
+    urls = presign_download_urls(default_storage, names)
+
+    assert storage_url.call_count == 1
+    for name, url in zip(names, urls):
+        resp = requests.get(url)
+        assert resp.status_code == 200
+        assert resp.content == name.encode()
+        default_storage.delete(name)
+
+
+def test_presign_download_urls_unsigned(s3_storage: S3Storage, mocker: MockerFixture) -> None:
+    s3_storage.querystring_auth = False
+    storage_url = mocker.spy(s3_storage, "url")
+
+    urls = presign_download_urls(s3_storage, NAMES[:2])
+
+    assert urls == [
+        "https://fake-bucket.s3.amazonaws.com/media/test-key",
+        "https://fake-bucket.s3.amazonaws.com/media/dir/test%20key%2B1.txt",
+    ]
+    assert storage_url.call_count == 2
+
+
+def test_presign_download_urls_sigv2(mocker: MockerFixture) -> None:
+    # SigV4QueryPresigner can't reproduce these, so they're all presigned by the storage
+    s3_storage = S3Storage(
+        access_key="fakeAccessKey",
+        secret_key="fakeSecretKey",
+        region_name="us-east-1",
+        bucket_name="fake-bucket",
+        signature_version="s3",
+    )
+    storage_url = mocker.spy(s3_storage, "url")
+
+    urls = presign_download_urls(s3_storage, NAMES[:2])
+
+    assert all("Signature=" in url for url in urls)
+    assert storage_url.call_count == 2
+
+
+def test_presign_download_urls_empty(s3_storage: S3Storage) -> None:
+    assert presign_download_urls(s3_storage, []) == []
+
+
+def test_field_file_urls() -> None:
+    resources = [
+        MultiResource(blob="test-key-1", optional_blob=""),
+        MultiResource(blob="test-key-2", optional_blob="test-key-3"),
+    ]
+
+    urls = field_file_urls(
+        field_file
+        for resource in resources
+        for field_file in [resource.blob, resource.optional_blob]
+    )
+
+    assert urls == [
+        resources[0].blob.url,
+        None,
+        resources[1].blob.url,
+        resources[1].optional_blob.url,
+    ]
+
+
+@pytest.mark.django_db()
+def test_queryset_file_urls() -> None:
+    resources = Resource.objects.bulk_create(
+        [Resource(blob="test-key-1"), Resource(blob=""), Resource(blob="test-key-2")]
+    )
+
+    urls = queryset_file_urls(Resource.objects.all(), "blob")
+
+    assert urls == {
+        resources[0].pk: resources[0].blob.url,
+        resources[2].pk: resources[2].blob.url,
+    }
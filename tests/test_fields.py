@@ -1,10 +1,17 @@
+import copy
+import pickle
 import re
+from typing import Callable
 
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 import pytest
+from pytest_mock import MockerFixture
 
-from test_app.models import Resource
+from s3_file_field.widgets import S3ObjectKey
+
+from test_app.models import MetadataResource, Resource
 
 
 @pytest.mark.django_db()
@@ -62,3 +69,90 @@ def test_fields_clean_empty() -> None:
 
 def test_fields_check_success(resource: Resource) -> None:
     assert resource._meta.get_field("blob").check() == []
+
+
+def test_fields_metadata_init() -> None:
+    # The metadata fields are declared after "blob", so must be updated after Model.__init__
+    resource = MetadataResource(blob=S3ObjectKey("test_key", 10, "test-etag", "text/plain"))
+
+    assert resource.blob.name == "test_key"
+    assert resource.blob_size == 10
+    assert resource.blob_etag == "test-etag"
+    assert resource.blob_content_type == "text/plain"
+
+
+@pytest.mark.parametrize(
+    "round_trip",
+    [lambda key: pickle.loads(pickle.dumps(key)), copy.deepcopy],
+    ids=["pickle", "copy"],
+)
+def test_fields_object_key_round_trip(round_trip: Callable[[S3ObjectKey], S3ObjectKey]) -> None:
+    object_key = round_trip(S3ObjectKey("test_key", 10, "test-etag", "text/plain"))
+
+    assert isinstance(object_key, S3ObjectKey)
+    assert object_key == "test_key"
+    assert object_key.size == 10
+    assert object_key.etag == "test-etag"
+    assert object_key.content_type == "text/plain"
+
+
+def test_fields_metadata_assign() -> None:
+    resource = MetadataResource()
+
+    resource.blob = S3ObjectKey("test_key", 10, "test-etag", "text/plain")
+    assert resource.blob_size == 10
+
+    # The metadata of a plain name is unknown
+    resource.blob = "other_key"
+    assert resource.blob_size is None
+    assert resource.blob_etag is None
+    assert resource.blob_content_type is None
+
+
+@pytest.mark.django_db()
+def test_fields_metadata_assign_field_file() -> None:
+    source = MetadataResource.objects.create(blob=S3ObjectKey("source_key", 10, "source-etag"))
+    resource = MetadataResource(blob=S3ObjectKey("test_key", 111, "test-etag", "text/plain"))
+
+    # Assigning its own file keeps the metadata
+    resource.blob = resource.blob
+    assert resource.blob_size == 111
+
+    # The metadata is of the assigned object
+    resource.blob = MetadataResource.objects.get(pk=source.pk).blob
+    assert resource.blob.name == "source_key"
+    assert resource.blob_size == 10
+    assert resource.blob_etag == "source-etag"
+    assert resource.blob_content_type is None
+    assert resource.blob.size == 10
+
+    # The metadata of a file without metadata fields is unknown
+    resource.blob = Resource(blob="other_key").blob
+    assert resource.blob_size is None
+    assert resource.blob_etag is None
+
+
+@pytest.mark.django_db()
+def test_fields_metadata_size(mocker: MockerFixture) -> None:
+    resource = MetadataResource.objects.create(blob=S3ObjectKey("test_key", 10))
+    storage_size = mocker.patch.object(default_storage, "size", return_value=20)
+
+    resource.refresh_from_db()
+    assert resource.blob.size == 10
+    assert MetadataResource.objects.get().blob.size == 10
+    # Without a stored size, the storage is queried
+    assert MetadataResource.objects.update(blob_size=None) == 1
+    assert MetadataResource.objects.get().blob.size == 20
+    storage_size.assert_called_once_with("test_key")
+
+
+def test_fields_metadata_deconstruct() -> None:
+    field = MetadataResource._meta.get_field("blob")
+
+    _, _, _, kwargs = field.deconstruct()
+
+    assert kwargs == {
+        "size_field": "blob_size",
+        "etag_field": "blob_etag",
+        "content_type_field": "blob_content_type",
+    }
@@ -1,8 +1,9 @@
 import pytest
 
+from s3_file_field import _signing
 from s3_file_field.forms import S3FormFileField
 
-from test_app.forms import ResourceForm
+from test_app.forms import MetadataResourceForm, ResourceForm
 
 
 def test_form_field_type() -> None:
@@ -50,3 +51,18 @@ def test_form_instance_saved(s3ff_field_value: str) -> None:
 
     with resource.blob.open() as blob_stream:
         assert blob_stream.read() == b"test content"
+
+
+def test_form_instance_metadata() -> None:
+    field_value = _signing.dumps_field_value(
+        object_key="test_key", file_size=10, etag="test-etag", content_type="text/plain"
+    )
+    form = MetadataResourceForm(data={"blob": field_value})
+
+    form.full_clean()
+    resource = form.instance
+
+    assert resource.blob.name == "test_key"
+    assert resource.blob_size == 10
+    assert resource.blob_etag == "test-etag"
+    assert resource.blob_content_type == "text/plain"
@@ -0,0 +1,213 @@
+import contextlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import re
+import threading
+from typing import Generator
+from uuid import uuid4
+
+from django.core.files.storage import default_storage
+from django.urls import reverse
+import pytest
+from pytest_mock import MockerFixture
+from rest_framework.test import APIClient
+
+from s3_file_field import _signing, storage_executor_stats, transfer_executor_stats
+from s3_file_field._multipart import MultipartManager, UploadCompletionError
+from s3_file_field._sizes import mb
+
+from fuzzy import Fuzzy
+
+SOURCE_CONTENT = bytes(range(256)) * (mb(12) // 256) + b"end"
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+class SourceHandler(BaseHTTPRequestHandler):
+    """Serve SOURCE_CONTENT at any path, with support for ranges, like most file servers."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.startswith("/redirect/"):
+            self.send_response(302)
+            self.send_header("Location", self.path.removeprefix("/redirect"))
+            self.end_headers()
+            return
+        if self.path.startswith("/changing/"):
+            # Every response has a new version of the source
+            etag = f'"{uuid4()}"'
+        elif self.path.startswith("/weak/"):
+            etag = 'W/"source-etag"'
+        else:
+            etag = '"source-etag"'
+        range_match = re.match(r"^bytes=(\d+)-(\d+)$", self.headers.get("Range", ""))
+        if_range = self.headers.get("If-Range")
+        # A weak ETag never matches, so the whole source is sent if it's used
+        range_valid = (
+            if_range in {None, LAST_MODIFIED} or if_range == etag and not etag.startswith("W/")
+        )
+        if self.path.startswith("/no-range/") or range_match is None or not range_valid:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(SOURCE_CONTENT)))
+            self.end_headers()
+            # Clients close the connection once they see the status
+            with contextlib.suppress(ConnectionError):
+                self.wfile.write(SOURCE_CONTENT)
+            return
+        first_byte, last_byte = int(range_match[1]), int(range_match[2])
+        self.send_response(206)
+        self.send_header("Content-Type", "image/tiff")
+        self.send_header("Content-Length", str(last_byte - first_byte + 1))
+        self.send_header("Content-Range", f"bytes {first_byte}-{last_byte}/{len(SOURCE_CONTENT)}")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(SOURCE_CONTENT[first_byte : last_byte + 1])
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def source_url() -> Generator[str, None, None]:
+    server = ThreadingHTTPServer(("localhost", 0), SourceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://localhost:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def _ingest_allowed(settings) -> None:
+    settings.S3FF_INGEST_ALLOWED_HOSTS = ["localhost"]
+
+
+@pytest.mark.usefixtures("_ingest_allowed", "_storage_executor")
+@pytest.mark.parametrize(
+    "path",
+    ["/data/image%201.tif", "/redirect/data/image%201.tif", "/weak/data/image%201.tif"],
+    ids=["direct", "redirect", "weak-etag"],
+)
+def test_ingest(api_client: APIClient, source_url: str, path: str) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:ingest"),
+        {"field_id": "test_app.Resource.blob", "source_url": f"{source_url}{path}"},
+        format="json",
+    )
+
+    assert resp.status_code == 200
+    field_value = _signing.loads_field_value(resp.data["field_value"])
+    assert field_value == {
+        "object_key": Fuzzy(r"^[0-9a-f-]{36}/image_1\.tif$"),
+        "file_size": len(SOURCE_CONTENT),
+        "etag": Fuzzy(r"^[0-9a-f]{32}-3$"),
+        "content_type": "image/tiff",
+    }
+    with default_storage.open(field_value["object_key"]) as stored_file:
+        assert stored_file.read() == SOURCE_CONTENT
+    default_storage.delete(field_value["object_key"])
+    # Every part is transferred without using the pool of the views
+    assert transfer_executor_stats().completed == 3
+    assert storage_executor_stats().completed == 0
+
+
+@pytest.mark.usefixtures("_async_views", "_ingest_allowed")
+def test_ingest_async(api_client: APIClient, source_url: str) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:ingest"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "source_url": f"{source_url}/data.bin",
+            "file_name": "renamed.bin",
+            "content_type": "application/x-test",
+        },
+        format="json",
+    )
+
+    assert resp.status_code == 200
+    field_value = _signing.loads_field_value(resp.data["field_value"])
+    assert field_value["object_key"] == Fuzzy(r"/renamed\.bin$")
+    assert field_value["content_type"] == "application/x-test"
+    with default_storage.open(field_value["object_key"]) as stored_file:
+        assert stored_file.read() == SOURCE_CONTENT
+    default_storage.delete(field_value["object_key"])
+
+
+@pytest.mark.usefixtures("_ingest_allowed")
+@pytest.mark.parametrize(
+    ("path", "message"),
+    [
+        ("/no-range/data.bin", "Source doesn't support range requests."),
+        ("/changing/data.bin", "Source changed during ingest."),
+        ("/redirect//127.0.0.1/data.bin", "Source host is not allowed."),
+    ],
+    ids=["no-range", "changing", "redirect-not-allowed"],
+)
+def test_ingest_source_invalid(
+    api_client: APIClient, source_url: str, mocker: MockerFixture, path: str, message: str
+) -> None:
+    abort_upload_id = mocker.spy(
+        type(MultipartManager.from_storage(default_storage)), "_abort_upload_id"
+    )
+
+    resp = api_client.post(
+        reverse("s3_file_field:ingest"),
+        {"field_id": "test_app.Resource.blob", "source_url": f"{source_url}{path}"},
+        format="json",
+    )
+
+    assert resp.status_code == 400
+    assert resp.data == message
+    # Only sources which fail after the upload is created need it to be aborted
+    assert abort_upload_id.call_count == (1 if path.startswith("/changing/") else 0)
+
+
+@pytest.mark.usefixtures("_ingest_allowed")
+def test_ingest_source_unavailable(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:ingest"),
+        # Nothing listens on this port
+        {"field_id": "test_app.Resource.blob", "source_url": "http://localhost:1/data.bin"},
+        format="json",
+    )
+
+    assert resp.status_code == 502
+    assert resp.data == "Source request failed."
+
+
+@pytest.mark.usefixtures("_ingest_allowed")
+def test_ingest_completion_failed(
+    api_client: APIClient, source_url: str, mocker: MockerFixture
+) -> None:
+    multipart_manager = MultipartManager.from_storage(default_storage)
+    mocker.patch.object(multipart_manager, "finalize_upload", side_effect=UploadCompletionError)
+    abort_upload_id = mocker.spy(multipart_manager, "_abort_upload_id")
+
+    resp = api_client.post(
+        reverse("s3_file_field:ingest"),
+        {"field_id": "test_app.Resource.blob", "source_url": f"{source_url}/data.bin"},
+        format="json",
+    )
+
+    assert resp.status_code == 502
+    assert resp.data == "Upload could not be completed."
+    abort_upload_id.assert_called_once()
+
+
+@pytest.mark.usefixtures("_ingest_allowed")
+def test_ingest_host_not_allowed(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:ingest"),
+        {"field_id": "test_app.Resource.blob", "source_url": "http://example.com/data.bin"},
+        format="json",
+    )
+
+    assert resp.status_code == 400
+    assert resp.data == "Source host is not allowed."
+
+
+def test_ingest_disabled(api_client: APIClient, source_url: str) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:ingest"),
+        {"field_id": "test_app.Resource.blob", "source_url": f"{source_url}/data.bin"},
+        format="json",
+    )
+
+    assert resp.status_code == 404
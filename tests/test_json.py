@@ -0,0 +1,38 @@
+from io import BytesIO
+
+import pytest
+from pytest_mock import MockerFixture
+from rest_framework.exceptions import ParseError
+
+from s3_file_field import _json
+from s3_file_field._json import JSONParser
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def _orjson(request: pytest.FixtureRequest, mocker: MockerFixture) -> None:
+    if request.param:
+        pytest.importorskip("orjson")
+    else:
+        mocker.patch.object(_json, "orjson", new=None)
+
+
+@pytest.mark.usefixtures("_orjson")
+def test_json_parser() -> None:
+    data = JSONParser().parse(BytesIO('{"file_name": "ü.txt", "file_size": 10}'.encode()))
+
+    assert data == {"file_name": "ü.txt", "file_size": 10}
+
+
+@pytest.mark.usefixtures("_orjson")
+@pytest.mark.parametrize("body", [b"{", b'{"file_size": NaN}'], ids=["truncated", "nan"])
+def test_json_parser_invalid(body: bytes) -> None:
+    with pytest.raises(ParseError, match=r"JSON parse error"):
+        JSONParser().parse(BytesIO(body))
+
+
+def test_json_parser_encoding() -> None:
+    data = JSONParser().parse(
+        BytesIO('{"file_name": "ü.txt"}'.encode("latin-1")), parser_context={"encoding": "latin-1"}
+    )
+
+    assert data == {"file_name": "ü.txt"}
@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+import pytest
+
+from s3_file_field._part_size_policy import (
+    AdaptivePartSizePolicy,
+    FixedPartSizePolicy,
+    PartSizeHints,
+)
+from s3_file_field._sizes import gb, kb, mb, tb
+
+
+@pytest.mark.parametrize(
+    ("file_size", "part_size", "expected_part_size"),
+    [
+        (gb(1), mb(64), mb(64)),
+        # Too small part_size
+        (gb(1), mb(1), mb(5)),
+        # Too large part_size
+        (gb(10), gb(6), gb(5)),
+        # Too many parts
+        (tb(1), mb(64), 109951163),
+    ],
+)
+def test_fixed_part_size_policy(file_size: int, part_size: int, expected_part_size: int) -> None:
+    policy = FixedPartSizePolicy(part_size)
+    # Hints are ignored
+    hints = PartSizeHints(bandwidth=mb(1), parallelism=16, memory_budget=mb(16))
+    assert policy.choose_part_size(file_size, hints) == expected_part_size
+
+
+@pytest.mark.parametrize(
+    ("file_size", "hints", "expected_part_size"),
+    [
+        # Without hints, the default is used
+        (gb(10), PartSizeHints(), mb(64)),
+        # Fast clients use parts which transfer within a minute
+        (gb(100), PartSizeHints(bandwidth=mb(10)), mb(600)),
+        # ... but no larger than the maximum
+        (gb(100), PartSizeHints(bandwidth=mb(100)), gb(1)),
+        # Slow clients use parts which are still cheap to retry
+        (gb(1), PartSizeHints(bandwidth=kb(512)), mb(30)),
+        # Concurrent parts share bandwidth
+        (gb(100), PartSizeHints(bandwidth=mb(10), parallelism=4), mb(150)),
+        # Concurrent parts must fit within the memory budget
+        (gb(100), PartSizeHints(bandwidth=mb(10), parallelism=4, memory_budget=mb(256)), mb(64)),
+        # Every concurrent connection is kept busy
+        (mb(100), PartSizeHints(bandwidth=mb(10), parallelism=4), mb(25)),
+        # S3 limits take precedence over hints
+        (gb(1), PartSizeHints(memory_budget=mb(1)), mb(5)),
+        (tb(1), PartSizeHints(bandwidth=mb(1)), 109951163),
+    ],
+)
+def test_adaptive_part_size_policy(
+    file_size: int, hints: PartSizeHints, expected_part_size: int
+) -> None:
+    policy = AdaptivePartSizePolicy()
+    assert policy.choose_part_size(file_size, hints) == expected_part_size
+
+
+def test_adaptive_part_size_policy_max_part_duration() -> None:
+    policy = AdaptivePartSizePolicy(max_part_duration=timedelta(seconds=10))
+    assert policy.choose_part_size(gb(100), PartSizeHints(bandwidth=mb(10))) == mb(100)
@@ -0,0 +1,83 @@
+from typing import Generator, cast
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+import pytest
+from pytest_mock import MockerFixture
+
+from s3_file_field import prefetch_s3_metadata, storage_executor_stats
+from s3_file_field._multipart import MultipartManager
+from s3_file_field.fields import S3FieldFile
+
+from test_app.models import MultiResource, Resource
+
+
+@pytest.fixture()
+def object_key() -> Generator[str, None, None]:
+    object_key = default_storage.save("test-key", ContentFile(b"test content"))
+    yield object_key
+    default_storage.delete(object_key)
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_prefetch_s3_metadata(object_key: str, mocker: MockerFixture) -> None:
+    resources = [
+        Resource(blob=object_key),
+        Resource(blob=object_key),
+        Resource(blob="nonexistent-key"),
+    ]
+
+    prefetch_s3_metadata(resources)
+
+    # The shared object is only requested once
+    assert storage_executor_stats().completed == 2
+    get_object_metadata = mocker.spy(MultipartManager, "get_object_metadata")
+    storage_exists = mocker.spy(default_storage, "exists")
+    assert [r.blob.size for r in resources[:2]] == [len(b"test content")] * 2
+    assert [cast(S3FieldFile, r.blob).exists() for r in resources] == [True, True, False]
+    get_object_metadata.assert_not_called()
+    storage_exists.assert_not_called()
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_prefetch_s3_metadata_field_names(object_key: str) -> None:
+    multi_resource = MultiResource(blob=object_key, optional_blob=object_key)
+
+    prefetch_s3_metadata([multi_resource], "optional_blob")
+
+    assert "_prefetched_metadata" not in multi_resource.blob.__dict__
+    assert cast(S3FieldFile, multi_resource.optional_blob).exists()
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_prefetch_s3_metadata_skipped() -> None:
+    multi_resource = MultiResource(
+        blob=ContentFile(b"test content", name="test-key"), optional_blob=""
+    )
+
+    prefetch_s3_metadata([multi_resource])
+
+    # Neither uncommitted nor empty files are requested
+    assert storage_executor_stats().completed == 0
+    assert not cast(S3FieldFile, multi_resource.optional_blob).exists()
+
+
+@pytest.mark.django_db()
+@pytest.mark.usefixtures("_storage_executor")
+def test_prefetch_s3_metadata_queryset(object_key: str) -> None:
+    Resource.objects.bulk_create([Resource(blob=object_key), Resource(blob="nonexistent-key")])
+    queryset = Resource.objects.order_by("pk")
+
+    prefetch_s3_metadata(queryset)
+
+    assert [cast(S3FieldFile, r.blob).exists() for r in queryset] == [True, False]
+    assert storage_executor_stats().completed == 2
+
+
+def test_prefetch_s3_metadata_save(resource: Resource) -> None:
+    cast(S3FieldFile, resource.blob)._prefetched_metadata = None
+
+    resource.blob.save("test-key", ContentFile(b"new content"), save=False)
+
+    assert cast(S3FieldFile, resource.blob).exists()
+    assert resource.blob.size == len(b"new content")
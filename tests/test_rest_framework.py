@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import pytest
 
-from test_app.rest import ResourceSerializer
+from s3_file_field import _signing
+from s3_file_field.widgets import S3PlaceholderFile
+
+from test_app.rest import MetadataResourceSerializer, ResourceBulkSerializer, ResourceSerializer
 
 if TYPE_CHECKING:
     from django.core.files import File
@@ -73,3 +76,74 @@ def test_serializer_save_update(
     serializer.save()
 
     assert resource.blob.name == stored_file_object.name
+
+
+@pytest.mark.django_db()
+def test_serializer_bulk_save_create(
+    stored_file_object: File[bytes], s3ff_field_value: str
+) -> None:
+    serializer = ResourceBulkSerializer(data=[{"blob": s3ff_field_value}] * 3, many=True)
+
+    serializer.is_valid(raise_exception=True)
+    resources = serializer.save()
+
+    assert [resource.blob.name for resource in resources] == [stored_file_object.name] * 3
+
+
+def test_serializer_bulk_verifies_once(
+    monkeypatch: pytest.MonkeyPatch,
+    stored_file_object: File[bytes],
+    s3ff_field_value: str,
+) -> None:
+    monkeypatch.setattr(S3PlaceholderFile, "from_field", None)
+    loads_field_values: Callable = _signing.loads_field_values
+    calls = []
+
+    def spy_loads_field_values(field_values):
+        field_values = list(field_values)
+        calls.append(field_values)
+        return loads_field_values(field_values)
+
+    monkeypatch.setattr(_signing, "loads_field_values", spy_loads_field_values)
+    serializer = ResourceBulkSerializer(data=[{"blob": s3ff_field_value}] * 3, many=True)
+
+    serializer.is_valid(raise_exception=True)
+
+    assert calls == [[s3ff_field_value] * 3]
+    assert serializer.validated_data == [{"blob": stored_file_object.name}] * 3
+
+
+def test_serializer_bulk_errors(s3ff_field_value: str) -> None:
+    serializer = ResourceBulkSerializer(
+        data=[
+            {"blob": s3ff_field_value},
+            {"blob": "test_key"},
+            {"blob": _signing.dumps_field_value(object_key="test_key", file_size=0)},
+            {},
+        ],
+        many=True,
+    )
+
+    assert not serializer.is_valid()
+    # Errors are reported by the index of each invalid item
+    assert 0 not in serializer.errors
+    assert serializer.errors[1]["blob"][0].code == "invalid"
+    assert serializer.errors[2]["blob"][0].code == "empty"
+    assert serializer.errors[3]["blob"][0].code == "required"
+
+
+@pytest.mark.django_db()
+def test_serializer_save_metadata() -> None:
+    field_value = _signing.dumps_field_value(
+        object_key="test_key", file_size=10, etag="test-etag", content_type="text/plain"
+    )
+    serializer = MetadataResourceSerializer(data={"blob": field_value})
+
+    serializer.is_valid(raise_exception=True)
+    resource = serializer.save()
+    resource.refresh_from_db()
+
+    assert resource.blob.name == "test_key"
+    assert resource.blob_size == 10
+    assert resource.blob_etag == "test-etag"
+    assert resource.blob_content_type == "text/plain"
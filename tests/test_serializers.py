@@ -8,10 +8,14 @@ from s3_file_field._multipart import (
     TransferredPart,
     TransferredParts,
 )
+from s3_file_field._sizes import mb
 from s3_file_field.views import (
+    PartInitializationResponseSerializer,
+    TransferredPartRequestSerializer,
     UploadCompletionRequestSerializer,
     UploadInitializationRequestSerializer,
     UploadInitializationResponseSerializer,
+    UploadResumptionResponseSerializer,
 )
 
 
@@ -49,6 +53,23 @@ def test_upload_initialization_request_deserialization() -> None:
     assert isinstance(request, dict)
 
 
+def test_upload_initialization_request_deserialization_part_size_hints() -> None:
+    serializer = UploadInitializationRequestSerializer(
+        data={
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test-name.jpg",
+            "file_size": 15,
+            "content_type": "image/jpeg",
+            "part_size_hints": {"bandwidth": 1_000_000, "parallelism": 4},
+        }
+    )
+    assert serializer.is_valid(raise_exception=True)
+    assert serializer.validated_data["part_size_hints"] == {
+        "bandwidth": 1_000_000,
+        "parallelism": 4,
+    }
+
+
 def test_upload_initialization_request_deserialization_file_id_invalid() -> None:
     serializer = UploadInitializationRequestSerializer(
         data={
@@ -71,10 +92,17 @@ def test_upload_initialization_response_serialization(
             "object_key": initialization.object_key,
             "upload_id": initialization.upload_id,
             "parts": initialization.parts,
+            "part_size": 10_000,
+            "part_size_policy": "fixed",
             "upload_signature": "test-upload-signature",
         }
     )
     assert isinstance(serializer.data, dict)
+    # Parts should be the same as from a nested serializer
+    assert (
+        serializer.data["parts"]
+        == PartInitializationResponseSerializer(initialization.parts, many=True).data
+    )
 
 
 def test_upload_completion_request_deserialization() -> None:
@@ -94,3 +122,136 @@ def test_upload_completion_request_deserialization() -> None:
     completion = serializer.save()
     assert isinstance(completion, TransferredParts)
     assert all(isinstance(part, TransferredPart) for part in completion.parts)
+
+
+def test_upload_completion_request_deserialization_sorted() -> None:
+    upload_signature = signing.dumps({"object_key": "test-object-key", "field_id": "test-field-id"})
+    serializer = UploadCompletionRequestSerializer(
+        data={
+            "upload_signature": upload_signature,
+            "upload_id": "test-upload-id",
+            "parts": [
+                {"part_number": 2, "size": 3_500, "etag": "test-etag-2"},
+                # Values which are coerced are still accepted
+                {"part_number": "1", "size": 10_000, "etag": " test-etag-1 "},
+            ],
+        }
+    )
+
+    assert serializer.is_valid(raise_exception=True)
+    assert serializer.save().parts == [
+        TransferredPart(part_number=1, size=10_000, etag="test-etag-1"),
+        TransferredPart(part_number=2, size=3_500, etag="test-etag-2"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        [],
+        "not-a-list",
+        [{"part_number": 0, "size": 10_000, "etag": "test-etag-1"}],
+        [{"part_number": 1, "size": 10_000, "etag": "test-etag-1"}, {"part_number": 2}],
+        [{"part_number": 1, "size": True, "etag": ""}],
+    ],
+    ids=["empty", "not-list", "invalid-value", "missing-value", "wrong-type"],
+)
+def test_upload_completion_request_deserialization_parts_invalid(parts: object) -> None:
+    upload_signature = signing.dumps({"object_key": "test-object-key", "field_id": "test-field-id"})
+    serializer = UploadCompletionRequestSerializer(
+        data={
+            "upload_signature": upload_signature,
+            "upload_id": "test-upload-id",
+            "parts": parts,
+        }
+    )
+    nested_serializer = TransferredPartRequestSerializer(data=parts, many=True, allow_empty=False)
+
+    assert not serializer.is_valid()
+    assert not nested_serializer.is_valid()
+    # Errors should be the same as from a nested serializer
+    assert serializer.errors == {"parts": nested_serializer.errors}
+
+
+def test_upload_resumption_response_serialization(initialization: PresignedTransfer) -> None:
+    serializer = UploadResumptionResponseSerializer(
+        {
+            "transferred_parts": [TransferredPart(part_number=1, size=10_000, etag="test-etag")],
+            "parts": initialization.parts[1:],
+        }
+    )
+    assert serializer.data == {
+        "transferred_parts": [{"part_number": 1, "size": 10_000, "etag": "test-etag"}],
+        "parts": [
+            {"part_number": 2, "size": 3_500, "upload_url": "http://minio.test/test-bucket/2"}
+        ],
+    }
+
+
+def test_upload_completion_request_deserialization_part_etags() -> None:
+    upload_signature = signing.dumps(
+        {
+            "object_key": "test-object-key",
+            "field_id": "test_app.Resource.blob",
+            "file_size": mb(12),
+            "part_size": mb(5),
+        }
+    )
+    serializer = UploadCompletionRequestSerializer(
+        data={
+            "upload_signature": upload_signature,
+            "upload_id": "test-upload-id",
+            "part_etags": ["test-etag-1", "test-etag-2", "test-etag-3"],
+        }
+    )
+
+    assert serializer.is_valid(raise_exception=True)
+    assert serializer.save().parts == [
+        TransferredPart(part_number=1, size=mb(5), etag="test-etag-1"),
+        TransferredPart(part_number=2, size=mb(5), etag="test-etag-2"),
+        TransferredPart(part_number=3, size=mb(2), etag="test-etag-3"),
+    ]
+
+
+def test_upload_completion_request_deserialization_part_etags_count_invalid() -> None:
+    upload_signature = signing.dumps(
+        {
+            "object_key": "test-object-key",
+            "field_id": "test_app.Resource.blob",
+            "file_size": mb(12),
+            "part_size": mb(5),
+        }
+    )
+    serializer = UploadCompletionRequestSerializer(
+        data={
+            "upload_signature": upload_signature,
+            "upload_id": "test-upload-id",
+            "part_etags": ["test-etag-1", "test-etag-2"],
+        }
+    )
+
+    assert not serializer.is_valid()
+    assert serializer.errors == {"part_etags": ["Expected 3 ETags, one for each part."]}
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        {},
+        {
+            "parts": [{"part_number": 1, "size": 10_000, "etag": "test-etag-1"}],
+            "part_etags": ["test-etag-1"],
+        },
+    ],
+    ids=["neither", "both"],
+)
+def test_upload_completion_request_deserialization_parts_exclusive(parts: dict) -> None:
+    upload_signature = signing.dumps({"object_key": "test-object-key", "field_id": "test-field-id"})
+    serializer = UploadCompletionRequestSerializer(
+        data={"upload_signature": upload_signature, "upload_id": "test-upload-id", **parts}
+    )
+
+    assert not serializer.is_valid()
+    assert serializer.errors == {
+        "non_field_errors": ['Exactly one of "parts" or "part_etags" is required.']
+    }
@@ -0,0 +1,112 @@
+from django.core import signing
+from django.test import override_settings
+import pytest
+
+from s3_file_field import _signing
+
+
+def test_upload_signature_round_trip() -> None:
+    upload_signature = _signing.dumps_upload_signature(
+        field_id="test_app.Resource.blob",
+        object_key="new dir/new+object~ü:1.txt",
+        file_size=10,
+        part_size=100,
+        content_type="text/plain",
+    )
+
+    assert _signing.loads_upload_signature(upload_signature) == {
+        "field_id": "test_app.Resource.blob",
+        "object_key": "new dir/new+object~ü:1.txt",
+        "file_size": 10,
+        "part_size": 100,
+        "content_type": "text/plain",
+    }
+
+
+def test_field_value_round_trip() -> None:
+    field_value = _signing.dumps_field_value(
+        object_key="test-key", file_size=10, etag="test-etag", content_type="text/plain"
+    )
+
+    assert _signing.loads_field_value(field_value) == {
+        "object_key": "test-key",
+        "file_size": 10,
+        "etag": "test-etag",
+        "content_type": "text/plain",
+    }
+
+
+def test_field_value_round_trip_no_metadata() -> None:
+    field_value = _signing.dumps_field_value(object_key="test-key", file_size=10)
+
+    assert _signing.loads_field_value(field_value) == {
+        "object_key": "test-key",
+        "file_size": 10,
+        "etag": None,
+        "content_type": None,
+    }
+
+
+def test_field_value_legacy() -> None:
+    field_value = signing.dumps({"object_key": "test-key", "file_size": 10})
+
+    assert _signing.loads_field_value(field_value) == {"object_key": "test-key", "file_size": 10}
+
+
+@pytest.mark.parametrize(
+    "field_value",
+    ["", "no-separator", "test:signature", "test:signature:legacy"],
+)
+def test_field_value_invalid(field_value: str) -> None:
+    with pytest.raises(signing.BadSignature):
+        _signing.loads_field_value(field_value)
+
+
+def test_field_value_tampered() -> None:
+    field_value = _signing.dumps_field_value(object_key="test-key", file_size=10)
+    tampered_payload = _signing.dumps_field_value(object_key="other-key", file_size=10).partition(
+        ":"
+    )[0]
+
+    with pytest.raises(signing.BadSignature):
+        _signing.loads_field_value(f"{tampered_payload}:{field_value.partition(':')[2]}")
+
+
+def test_field_value_not_upload_signature() -> None:
+    # The kinds of token are not interchangeable
+    upload_signature = _signing.dumps_upload_signature(
+        field_id="test_app.Resource.blob",
+        object_key="test-key",
+        file_size=10,
+        part_size=100,
+        content_type="text/plain",
+    )
+
+    with pytest.raises(signing.BadSignature):
+        _signing.loads_field_value(upload_signature)
+
+
+def test_field_value_secret_key_fallbacks() -> None:
+    with override_settings(SECRET_KEY="old-secret-key"):
+        field_value = _signing.dumps_field_value(object_key="test-key", file_size=10)
+
+    with override_settings(SECRET_KEY="new-secret-key"), pytest.raises(signing.BadSignature):
+        _signing.loads_field_value(field_value)
+    with override_settings(SECRET_KEY="new-secret-key", SECRET_KEY_FALLBACKS=["old-secret-key"]):
+        assert _signing.loads_field_value(field_value)["object_key"] == "test-key"
+
+
+def test_field_values() -> None:
+    field_value = _signing.dumps_field_value(object_key="test-key", file_size=10)
+    legacy_field_value = signing.dumps({"object_key": "legacy-key", "file_size": 20})
+
+    assert _signing.loads_field_values([field_value, "test:signature", legacy_field_value]) == {
+        field_value: {
+            "object_key": "test-key",
+            "file_size": 10,
+            "etag": None,
+            "content_type": None,
+        },
+        "test:signature": None,
+        legacy_field_value: {"object_key": "legacy-key", "file_size": 20},
+    }
@@ -0,0 +1,80 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.files.storage import default_storage
+from django.core.management import CommandError, call_command
+import pytest
+
+from s3_file_field import abort_stale_uploads
+from s3_file_field._multipart import MultipartManager, UploadNotFoundError
+
+from fuzzy import Fuzzy
+
+
+@pytest.fixture()
+def upload_id() -> str:
+    return MultipartManager.from_storage(default_storage)._create_upload_id(
+        "stale-object", "text/plain"
+    )
+
+
+def _upload_exists(upload_id: str) -> bool:
+    try:
+        MultipartManager.from_storage(default_storage)._list_parts("stale-object", upload_id)
+    except UploadNotFoundError:
+        return False
+    return True
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_abort_stale_uploads(upload_id: str) -> None:
+    # Other tests may also leave uploads behind, which are all stale here
+    stats = abort_stale_uploads(default_storage, timedelta(0), prefix="", batch_size=1)
+
+    assert not _upload_exists(upload_id)
+    assert stats.listed >= 1
+    assert stats.aborted == stats.stale == stats.listed
+
+
+def test_abort_stale_uploads_recent(upload_id: str) -> None:
+    # The test object store reports a fixed initiation time, long in the past
+    stats = abort_stale_uploads(default_storage, timedelta(days=365 * 100), prefix="")
+
+    assert _upload_exists(upload_id)
+    assert stats.stale == stats.aborted == 0
+    MultipartManager.from_storage(default_storage)._abort_upload_id("stale-object", upload_id)
+
+
+def test_abort_stale_uploads_dry_run(upload_id: str) -> None:
+    stats = abort_stale_uploads(default_storage, timedelta(0), prefix="", dry_run=True)
+
+    assert _upload_exists(upload_id)
+    assert stats.stale >= 1
+    assert stats.aborted == 0
+    MultipartManager.from_storage(default_storage)._abort_upload_id("stale-object", upload_id)
+
+
+def test_abort_stale_uploads_prefix(upload_id: str) -> None:
+    stats = abort_stale_uploads(default_storage, timedelta(0), prefix="other-")
+
+    # Uploads without the prefix may belong to other applications
+    assert _upload_exists(upload_id)
+    assert stats.listed == 0
+    MultipartManager.from_storage(default_storage)._abort_upload_id("stale-object", upload_id)
+
+
+def test_abort_stale_uploads_command(upload_id: str) -> None:
+    stdout = StringIO()
+
+    call_command("s3ff_abort_stale_uploads", prefix="stale-", max_age_days=0, stdout=stdout)
+
+    assert not _upload_exists(upload_id)
+    assert stdout.getvalue() == Fuzzy(
+        r"^Aborted (\d+) of \1 stale uploads, from \1 listed in \d+\.\ds \(\d+ uploads/s\), "
+        r"for the storage of test_app\.MetadataResource\.blob, .*test_app\.Resource\.blob\.\n$"
+    )
+
+
+def test_abort_stale_uploads_command_prefix_required() -> None:
+    with pytest.raises(CommandError, match="--prefix"):
+        call_command("s3ff_abort_stale_uploads", max_age_days=0)
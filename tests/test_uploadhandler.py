@@ -0,0 +1,112 @@
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
+from django.core.files.uploadhandler import MemoryFileUploadHandler
+from django.http import HttpRequest
+from django.test import RequestFactory
+import pytest
+from pytest_mock import MockerFixture
+
+from s3_file_field._multipart import MultipartManager
+from s3_file_field._sizes import mb
+from s3_file_field.uploadhandler import S3FileUploadHandler
+from s3_file_field.widgets import S3PlaceholderFile
+
+from fuzzy import Fuzzy
+from test_app.forms import MetadataResourceForm
+from test_app.models import MetadataResource, Resource
+
+
+def _upload_request(**files: SimpleUploadedFile) -> HttpRequest:
+    request = RequestFactory().post("/", files)
+    request.upload_handlers = [
+        S3FileUploadHandler(request, {"blob": Resource._meta.get_field("blob")}),
+        MemoryFileUploadHandler(request),
+    ]
+    return request
+
+
+@pytest.mark.parametrize(
+    ("file_size", "etag"),
+    [
+        (10, Fuzzy(r"^[0-9a-f]{32}-1$")),
+        (mb(5), Fuzzy(r"^[0-9a-f]{32}-1$")),
+        (mb(10) + 10, Fuzzy(r"^[0-9a-f]{32}-3$")),
+    ],
+    ids=["small", "one-part", "multi-part"],
+)
+def test_upload_handler(file_size: int, etag: Fuzzy) -> None:
+    content = b"x" * file_size
+    request = _upload_request(
+        blob=SimpleUploadedFile("test.txt", content, content_type="text/plain")
+    )
+
+    uploaded_file = request.FILES["blob"]
+
+    assert isinstance(uploaded_file, S3PlaceholderFile)
+    assert uploaded_file.name == Fuzzy(r"^[0-9a-f-]{36}/test\.txt$")
+    assert uploaded_file.size == file_size
+    assert uploaded_file.etag == etag
+    assert uploaded_file.content_type == "text/plain"
+    with default_storage.open(uploaded_file.name) as stored_file:
+        assert stored_file.read() == content
+    # Django closes every uploaded file
+    request.close()
+    default_storage.delete(uploaded_file.name)
+
+
+def test_upload_handler_part_size_doubling(mocker: MockerFixture) -> None:
+    mocker.patch.object(S3FileUploadHandler, "part_size_doubling_interval", new=1)
+    upload_part = mocker.spy(type(MultipartManager.from_storage(default_storage)), "_upload_part")
+    request = _upload_request(blob=SimpleUploadedFile("test.txt", b"x" * (mb(15) + 10)))
+
+    uploaded_file = request.FILES["blob"]
+
+    assert isinstance(uploaded_file, S3PlaceholderFile)
+    assert [len(call.args[4]) for call in upload_part.call_args_list] == [mb(5), mb(10), 10]
+    default_storage.delete(uploaded_file.name)
+
+
+def test_upload_handler_other_fields() -> None:
+    request = _upload_request(other_blob=SimpleUploadedFile("test.txt", b"test content"))
+
+    assert isinstance(request.FILES["other_blob"], InMemoryUploadedFile)
+
+
+def test_upload_handler_interrupted(mocker: MockerFixture) -> None:
+    upload_part = mocker.patch.object(
+        type(MultipartManager.from_storage(default_storage)),
+        "_upload_part",
+        side_effect=RuntimeError,
+    )
+    abort_upload_id = mocker.spy(
+        type(MultipartManager.from_storage(default_storage)), "_abort_upload_id"
+    )
+    request = _upload_request(blob=SimpleUploadedFile("test.txt", b"x" * (mb(5) + 10)))
+
+    with pytest.raises(RuntimeError):
+        request.FILES
+
+    upload_part.assert_called_once()
+    abort_upload_id.assert_called_once()
+
+
+@pytest.mark.django_db()
+def test_upload_handler_form() -> None:
+    request = RequestFactory().post(
+        "/", {"blob": SimpleUploadedFile("test.txt", b"test content", content_type="text/plain")}
+    )
+    request.upload_handlers = [
+        S3FileUploadHandler(request, {"blob": MetadataResource._meta.get_field("blob")})
+    ]
+    form = MetadataResourceForm(data=request.POST, files=request.FILES)
+
+    assert form.is_valid()
+    resource = form.save()
+
+    uploaded_file = request.FILES["blob"]
+    assert isinstance(uploaded_file, S3PlaceholderFile)
+    assert resource.blob.name == uploaded_file.name
+    assert resource.blob_size == len(b"test content")
+    assert resource.blob_etag == Fuzzy(r"^[0-9a-f]{32}-1$")
+    assert resource.blob_content_type == "text/plain"
+    resource.blob.delete(save=False)
@@ -0,0 +1,182 @@
+import time
+from typing import Generator
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+import pytest
+from pytest_mock import MockerFixture
+from storages.backends.s3 import S3Storage
+
+from s3_file_field import DjangoPresignedUrlCache, LocalPresignedUrlCache, PresignedUrlCache
+from s3_file_field._multipart_s3 import S3MultipartManager
+from s3_file_field._url_cache import UrlCacheStats, presigned_url_expiry
+
+from test_app.models import Resource
+
+
+@pytest.fixture()
+def s3_storage() -> S3Storage:
+    return S3Storage(
+        access_key="fakeAccessKey",
+        secret_key="fakeSecretKey",
+        region_name="us-east-1",
+        bucket_name="fake-bucket",
+        signature_version="s3v4",
+    )
+
+
+@pytest.fixture()
+def _clear_cache() -> Generator[None, None, None]:
+    yield
+    cache.clear()
+
+
+def test_presigned_url_expiry_sigv4() -> None:
+    url = (
+        "https://fake-bucket.s3.amazonaws.com/key?X-Amz-Algorithm=AWS4-HMAC-SHA256"
+        "&X-Amz-Date=20240101T000000Z&X-Amz-Expires=3600&X-Amz-Signature=fake"
+    )
+
+    assert presigned_url_expiry(url) == 1704070800
+
+
+def test_presigned_url_expiry_sigv2() -> None:
+    url = "https://fake-bucket.s3.amazonaws.com/key?Signature=fake&Expires=1704070800"
+
+    assert presigned_url_expiry(url) == 1704070800
+
+
+def test_presigned_url_expiry_unsigned() -> None:
+    assert presigned_url_expiry("https://fake-bucket.s3.amazonaws.com/key") is None
+
+
+@pytest.mark.usefixtures("_clear_cache")
+@pytest.mark.parametrize(
+    "url_cache", [LocalPresignedUrlCache(), DjangoPresignedUrlCache()], ids=["local", "django"]
+)
+def test_url_cache_hit(
+    url_cache: PresignedUrlCache, s3_storage: S3Storage, mocker: MockerFixture
+) -> None:
+    storage_url = mocker.spy(s3_storage, "url")
+
+    url = url_cache.url(s3_storage, "test-key")
+
+    assert url_cache.url(s3_storage, "test-key") == url
+    assert storage_url.call_count == 1
+    assert url_cache.stats() == UrlCacheStats(hits=1, misses=1)
+
+
+def test_url_cache_parameters(s3_storage: S3Storage) -> None:
+    url_cache = LocalPresignedUrlCache()
+
+    url = url_cache.url(s3_storage, "test-key")
+    download_url = url_cache.url(
+        s3_storage, "test-key", {"ResponseContentDisposition": "attachment"}
+    )
+
+    assert download_url != url
+    assert "response-content-disposition=attachment" in download_url
+    assert url_cache.stats() == UrlCacheStats(hits=0, misses=2)
+
+
+def test_url_cache_storages(s3_storage: S3Storage) -> None:
+    other_storage = S3Storage(
+        access_key="fakeAccessKey",
+        secret_key="fakeSecretKey",
+        region_name="us-east-1",
+        bucket_name="other-fake-bucket",
+        signature_version="s3v4",
+    )
+    url_cache = LocalPresignedUrlCache()
+
+    url = url_cache.url(s3_storage, "test-key")
+
+    assert url_cache.url(other_storage, "test-key") != url
+    assert url_cache.stats() == UrlCacheStats(hits=0, misses=2)
+
+
+def test_url_cache_expiry(s3_storage: S3Storage, mocker: MockerFixture) -> None:
+    # The URLs expire in an hour
+    s3_storage.querystring_expire = 3600
+    url_cache = LocalPresignedUrlCache()
+    url_cache.url(s3_storage, "test-key")
+
+    # Entries expire before their URLs do
+    mocker.patch.object(time, "time", return_value=time.time() + 3600 - 60)
+    url_cache.url(s3_storage, "test-key")
+
+    assert url_cache.stats() == UrlCacheStats(hits=0, misses=2)
+
+
+def test_url_cache_expiry_margin(s3_storage: S3Storage) -> None:
+    # URLs which expire within the margin are never cached
+    s3_storage.querystring_expire = 60
+    url_cache = LocalPresignedUrlCache()
+
+    url_cache.url(s3_storage, "test-key")
+    url_cache.url(s3_storage, "test-key")
+
+    assert url_cache.stats() == UrlCacheStats(hits=0, misses=2)
+
+
+def test_url_cache_unsigned(s3_storage: S3Storage) -> None:
+    s3_storage.querystring_auth = False
+    url_cache = LocalPresignedUrlCache()
+
+    url_cache.url(s3_storage, "test-key")
+    url_cache.url(s3_storage, "test-key")
+
+    assert url_cache.stats() == UrlCacheStats(hits=0, misses=2)
+
+
+def test_url_cache_session_token(s3_storage: S3Storage) -> None:
+    # The URLs would stop working whenever the temporary credentials expire
+    s3_storage.security_token = "fakeSessionToken"
+    url_cache = LocalPresignedUrlCache()
+
+    url_cache.url(s3_storage, "test-key")
+    url_cache.url(s3_storage, "test-key")
+
+    assert url_cache.stats() == UrlCacheStats(hits=0, misses=2)
+
+
+def test_url_cache_session_token_expiry(s3_storage: S3Storage, mocker: MockerFixture) -> None:
+    s3_storage.security_token = "fakeSessionToken"
+    s3_storage.querystring_expire = 3600
+    # The credentials expire before the URLs do
+    mocker.patch.object(
+        S3MultipartManager, "_get_credentials_expiry", return_value=time.time() + 1800
+    )
+    url_cache = LocalPresignedUrlCache()
+    url_cache.url(s3_storage, "test-key")
+    url_cache.url(s3_storage, "test-key")
+
+    mocker.patch.object(time, "time", return_value=time.time() + 1800 - 60)
+    url_cache.url(s3_storage, "test-key")
+
+    assert url_cache.stats() == UrlCacheStats(hits=1, misses=2)
+
+
+def test_url_cache_max_size(s3_storage: S3Storage) -> None:
+    url_cache = LocalPresignedUrlCache(max_size=2)
+
+    for key in ["test-key-1", "test-key-2", "test-key-1", "test-key-3", "test-key-1"]:
+        url_cache.url(s3_storage, key)
+    # The least recently used entry was evicted
+    url_cache.url(s3_storage, "test-key-2")
+
+    assert url_cache.stats() == UrlCacheStats(hits=2, misses=4)
+
+
+def test_url_cache_field(mocker: MockerFixture) -> None:
+    field = Resource._meta.get_field("blob")
+    url_cache = LocalPresignedUrlCache()
+    mocker.patch.object(field, "url_cache", url_cache)
+    storage_url = mocker.spy(default_storage, "url")
+    resources = [Resource(blob="test-key") for _ in range(3)]
+
+    urls = {resource.blob.url for resource in resources}
+
+    assert len(urls) == 1
+    assert storage_url.call_count == 1
+    assert url_cache.stats() == UrlCacheStats(hits=2, misses=1)
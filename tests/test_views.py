@@ -1,15 +1,23 @@
+import time
 from typing import cast
 
 from django.core import signing
+from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.urls import reverse
 import pytest
+from pytest_mock import MockerFixture
 import requests
 from rest_framework.test import APIClient
+import urllib3
 
+from s3_file_field import _proxy, _signing, storage_executor_stats
+from s3_file_field._multipart import MultipartManager, ObjectMetadata
+from s3_file_field._part_size_policy import AdaptivePartSizePolicy, FixedPartSizePolicy
 from s3_file_field._sizes import mb
 
 from fuzzy import FUZZY_UPLOAD_ID, FUZZY_URL, Fuzzy
+from test_app.models import Resource
 
 
 def test_prepare(api_client: APIClient) -> None:
@@ -30,13 +38,18 @@ def test_prepare(api_client: APIClient) -> None:
         ),
         "upload_id": FUZZY_UPLOAD_ID,
         "parts": [{"part_number": 1, "size": 10, "upload_url": FUZZY_URL}],
+        "part_size": mb(5),
+        "part_size_policy": "fixed",
         "upload_signature": Fuzzy(r".*:.*"),
     }
-    assert signing.loads(resp.data["upload_signature"]) == {
+    assert _signing.loads_upload_signature(resp.data["upload_signature"]) == {
         "object_key": Fuzzy(
             r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}/test.txt"
         ),
         "field_id": "test_app.Resource.blob",
+        "file_size": 10,
+        "part_size": mb(5),
+        "content_type": "text/plain",
     }
 
 
@@ -62,6 +75,8 @@ def test_prepare_two_parts(api_client: APIClient) -> None:
             {"part_number": 1, "size": mb(5), "upload_url": FUZZY_URL},
             {"part_number": 2, "size": mb(5), "upload_url": FUZZY_URL},
         ],
+        "part_size": mb(5),
+        "part_size_policy": "fixed",
         "upload_signature": Fuzzy(r".*:.*"),
     }
 
@@ -88,15 +103,321 @@ def test_prepare_three_parts(api_client: APIClient) -> None:
             {"part_number": 2, "size": mb(5), "upload_url": FUZZY_URL},
             {"part_number": 3, "size": mb(2), "upload_url": FUZZY_URL},
         ],
+        "part_size": mb(5),
+        "part_size_policy": "fixed",
         "upload_signature": Fuzzy(r".*:.*"),
     }
 
 
+@pytest.fixture()
+def _signs_content_length(mocker: MockerFixture) -> None:
+    # The MinIO client can't presign "Content-Length", so the test storage would otherwise always
+    # use multipart uploads
+    mocker.patch.object(
+        type(MultipartManager.from_storage(default_storage)), "signs_content_length", new=True
+    )
+
+
+@pytest.mark.usefixtures("_signs_content_length")
+def test_prepare_single_part(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+            "single_part_upload": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "object_key": Fuzzy(
+            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}/test.txt"
+        ),
+        "upload_id": None,
+        "parts": [{"part_number": 1, "size": 10, "upload_url": FUZZY_URL}],
+        "part_size": mb(5),
+        "part_size_policy": "fixed",
+        "upload_signature": Fuzzy(r".*:.*"),
+    }
+
+
+def test_prepare_single_part_unsigned_size(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+            "single_part_upload": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    # A multipart upload should be used instead
+    assert resp.data["upload_id"] == FUZZY_UPLOAD_ID
+    assert len(resp.data["parts"]) == 1
+
+
+@pytest.mark.usefixtures("_signs_content_length")
+def test_prepare_single_part_too_large(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(10),
+            "content_type": "text/plain",
+            "single_part_upload": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    # A multipart upload should be used instead
+    assert resp.data["upload_id"] == FUZZY_UPLOAD_ID
+    assert len(resp.data["parts"]) == 2
+
+
+def test_prepare_windowed_parts(api_client: APIClient, mocker: MockerFixture) -> None:
+    mocker.patch.object(MultipartManager, "part_url_window", new=2)
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data["parts"] == [
+        {"part_number": 1, "size": mb(5), "upload_url": FUZZY_URL},
+        {"part_number": 2, "size": mb(5), "upload_url": FUZZY_URL},
+    ]
+
+
+def test_upload_parts(api_client: APIClient, mocker: MockerFixture) -> None:
+    mocker.patch.object(MultipartManager, "part_url_window", new=2)
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt", "file_size": mb(12)}
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-parts"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+            "first_part_number": 2,
+            # This should be limited by the window size
+            "part_count": 5,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "parts": [
+            {"part_number": 2, "size": mb(5), "upload_url": FUZZY_URL},
+            {"part_number": 3, "size": mb(2), "upload_url": FUZZY_URL},
+        ]
+    }
+
+
+def test_upload_parts_out_of_range(api_client: APIClient) -> None:
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt", "file_size": mb(12)}
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-parts"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+            "first_part_number": 4,
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+
+
+def test_prepare_part_size_policy_field(api_client: APIClient, mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        Resource._meta.get_field("blob"),
+        "part_size_policy",
+        new=AdaptivePartSizePolicy(default_part_size=mb(6)),
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(13),
+            "content_type": "text/plain",
+            "part_size_hints": {"parallelism": 2},
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data["part_size"] == mb(6)
+    assert resp.data["part_size_policy"] == "adaptive"
+    assert resp.data["parts"] == [
+        {"part_number": 1, "size": mb(6), "upload_url": FUZZY_URL},
+        {"part_number": 2, "size": mb(6), "upload_url": FUZZY_URL},
+        {"part_number": 3, "size": mb(1), "upload_url": FUZZY_URL},
+    ]
+
+    # Later parts are planned with the same part size
+    resp = api_client.post(
+        reverse("s3_file_field:upload-parts"),
+        {
+            "upload_signature": resp.data["upload_signature"],
+            "upload_id": resp.data["upload_id"],
+            "first_part_number": 3,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "parts": [
+            {"part_number": 3, "size": mb(1), "upload_url": FUZZY_URL},
+        ]
+    }
+
+
+def test_prepare_part_size_policy_storage(api_client: APIClient, mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        MultipartManager.from_storage(default_storage),
+        "part_size_policy",
+        new=FixedPartSizePolicy(mb(8)),
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data["part_size"] == mb(8)
+    assert resp.data["part_size_policy"] == "fixed"
+    assert [part["size"] for part in resp.data["parts"]] == [mb(8), mb(4)]
+
+
+def test_upload_complete_missing_parts(api_client: APIClient) -> None:
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt", "file_size": mb(12)}
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+            "parts": [
+                {"part_number": 1, "size": mb(5), "etag": "fake-etag-1"},
+                {"part_number": 2, "size": mb(5), "etag": "fake-etag-2"},
+            ],
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+
+
+def test_upload_complete_part_sizes_not_planned(api_client: APIClient) -> None:
+    upload_signature = _signing.dumps_upload_signature(
+        field_id="test_app.Resource.blob",
+        object_key="test.txt",
+        file_size=mb(12),
+        part_size=mb(5),
+        content_type="text/plain",
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+            # A single, smaller part can't be completed as if it were the whole file
+            "parts": [{"part_number": 1, "size": mb(12), "etag": "fake-etag-1"}],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert resp.data == {"parts": ["Expected the 3 parts planned for the upload."]}
+
+
+def test_upload_complete_legacy_signature(api_client: APIClient) -> None:
+    # Signatures from earlier versions have no "file_size"
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt"}
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+            "parts": [{"part_number": 1, "size": 10, "etag": "fake-etag"}],
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data["complete_url"] == FUZZY_URL
+
+
+def test_upload_complete_legacy_signature_part_etags(api_client: APIClient) -> None:
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt"}
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+            "part_etags": ["fake-etag"],
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert resp.data == {
+        "non_field_errors": [
+            "This upload was initialized by an earlier version, and must be restarted."
+        ]
+    }
+
+
+@pytest.mark.parametrize("url_name", ["upload-parts", "upload-resume"])
+def test_legacy_signature_restart(api_client: APIClient, url_name: str) -> None:
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt"}
+    )
+    resp = api_client.post(
+        reverse(f"s3_file_field:{url_name}"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+            "first_part_number": 1,
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert resp.data == (
+        "This upload was initialized by an earlier version, and must be restarted."
+    )
+
+
+@pytest.mark.parametrize("part_url_window", [100, 1], ids=["unwindowed", "windowed"])
 @pytest.mark.parametrize("file_size", [10, mb(10), mb(12)], ids=["10B", "10MB", "12MB"])
 def test_full_upload_flow(
     api_client: APIClient,
+    mocker: MockerFixture,
     file_size: int,
+    part_url_window: int,
 ) -> None:
+    mocker.patch.object(MultipartManager, "part_url_window", new=part_url_window)
+
     # Initialize the multipart upload
     resp = api_client.post(
         reverse("s3_file_field:upload-initialize"),
@@ -113,6 +434,20 @@ def test_full_upload_flow(
     assert isinstance(initialization, dict)
     upload_signature = initialization["upload_signature"]
 
+    # Request the parts which were not presigned at initialization
+    while sum(part["size"] for part in initialization["parts"]) < file_size:
+        resp = api_client.post(
+            reverse("s3_file_field:upload-parts"),
+            {
+                "upload_signature": upload_signature,
+                "upload_id": initialization["upload_id"],
+                "first_part_number": initialization["parts"][-1]["part_number"] + 1,
+            },
+            format="json",
+        )
+        assert resp.status_code == 200
+        initialization["parts"].extend(cast(dict, resp.data)["parts"])
+
     # Perform the upload
     for part in initialization["parts"]:
         part_resp = requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5)
@@ -171,3 +506,778 @@ def test_full_upload_flow(
     assert object_resp.headers["Content-Type"] == "text/plain"
 
     default_storage.delete(initialization["object_key"])
+
+
+@pytest.mark.parametrize("file_size", [10, mb(12)], ids=["10B", "12MB"])
+def test_full_upload_flow_server_completion(api_client: APIClient, file_size: int) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": file_size,
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    initialization = cast(dict, resp.data)
+
+    parts = []
+    for part in initialization["parts"]:
+        part_resp = requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5)
+        part_resp.raise_for_status()
+        parts.append(
+            {
+                "part_number": part["part_number"],
+                "size": part["size"],
+                "etag": part_resp.headers["ETag"],
+            }
+        )
+
+    # Complete and finalize the upload in one request
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_id": initialization["upload_id"],
+            "parts": parts,
+            "upload_signature": initialization["upload_signature"],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "field_value": Fuzzy(r".*:.*"),
+    }
+    assert _signing.loads_field_value(cast(dict, resp.data)["field_value"]) == {
+        "object_key": initialization["object_key"],
+        "file_size": file_size,
+        # The ETag of a multipart object has a suffix of its part count
+        "etag": Fuzzy(r"[0-9a-f]{32}-\d+"),
+        "content_type": "text/plain",
+    }
+    assert default_storage.size(initialization["object_key"]) == file_size
+
+    default_storage.delete(initialization["object_key"])
+
+
+def test_full_upload_flow_part_etags(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    initialization = cast(dict, resp.data)
+
+    part_etags = []
+    for part in initialization["parts"]:
+        part_resp = requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5)
+        part_resp.raise_for_status()
+        part_etags.append(part_resp.headers["ETag"])
+
+    # Part numbers and sizes are implied by the upload signature
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_id": initialization["upload_id"],
+            "part_etags": part_etags,
+            "upload_signature": initialization["upload_signature"],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert default_storage.size(initialization["object_key"]) == mb(12)
+
+    default_storage.delete(initialization["object_key"])
+
+
+def test_upload_complete_server_completion_invalid(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    initialization = cast(dict, resp.data)
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_id": initialization["upload_id"],
+            # This part was never uploaded
+            "parts": [{"part_number": 1, "size": 10, "etag": "fake-etag"}],
+            "upload_signature": initialization["upload_signature"],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.usefixtures("_signs_content_length")
+def test_full_upload_flow_single_part(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+            "single_part_upload": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    initialization = cast(dict, resp.data)
+    assert initialization["upload_id"] is None
+
+    (part,) = initialization["parts"]
+    part_resp = requests.put(
+        part["upload_url"],
+        data=b"a" * part["size"],
+        headers={"Content-Type": "text/plain"},
+        timeout=5,
+    )
+    part_resp.raise_for_status()
+
+    # No completion is necessary
+    resp = api_client.post(
+        reverse("s3_file_field:finalize"),
+        {
+            "upload_signature": initialization["upload_signature"],
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert _signing.loads_field_value(cast(dict, resp.data)["field_value"]) == {
+        "object_key": initialization["object_key"],
+        "file_size": 10,
+        "etag": part_resp.headers["ETag"].strip('"'),
+        "content_type": "text/plain",
+    }
+
+    object_resp = requests.get(default_storage.url(initialization["object_key"]), timeout=5)
+    assert object_resp.headers["Content-Type"] == "text/plain"
+
+    default_storage.delete(initialization["object_key"])
+
+
+def _expand_part_template(part_template: dict, part_size: int, file_size: int) -> list[dict]:
+    return [
+        {
+            "part_number": part_number,
+            "size": min(part_size, file_size - (part_number - 1) * part_size),
+            "upload_url": part_template["upload_url"]
+            .replace("{part_number}", str(part_number))
+            .replace("{signature}", signature),
+        }
+        for part_number, signature in enumerate(
+            part_template["signatures"], start=part_template["first_part_number"]
+        )
+    ]
+
+
+def test_full_upload_flow_part_template(api_client: APIClient, mocker: MockerFixture) -> None:
+    mocker.patch.object(MultipartManager, "part_url_window", new=2)
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+            "part_url_format": "template",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    initialization = cast(dict, resp.data)
+    assert "parts" not in initialization
+    assert initialization["part_template"] == {
+        "upload_url": Fuzzy(r".*partNumber=\{part_number\}.*&X-Amz-Signature=\{signature\}"),
+        "first_part_number": 1,
+        "signatures": [Fuzzy(r"[0-9a-f]{64}")] * 2,
+    }
+    parts = _expand_part_template(initialization["part_template"], mb(5), mb(12))
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-parts"),
+        {
+            "upload_signature": initialization["upload_signature"],
+            "upload_id": initialization["upload_id"],
+            "first_part_number": 3,
+            "part_url_format": "template",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    parts += _expand_part_template(cast(dict, resp.data)["part_template"], mb(5), mb(12))
+    assert [(part["part_number"], part["size"]) for part in parts] == [
+        (1, mb(5)),
+        (2, mb(5)),
+        (3, mb(2)),
+    ]
+
+    transferred_parts = []
+    for part in parts:
+        part_resp = requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5)
+        part_resp.raise_for_status()
+        transferred_parts.append(
+            {
+                "part_number": part["part_number"],
+                "size": part["size"],
+                "etag": part_resp.headers["ETag"],
+            }
+        )
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_id": initialization["upload_id"],
+            "parts": transferred_parts,
+            "upload_signature": initialization["upload_signature"],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert default_storage.size(initialization["object_key"]) == mb(12)
+
+    default_storage.delete(initialization["object_key"])
+
+
+def test_prepare_part_template_size(api_client: APIClient) -> None:
+    def initialize(part_url_format: str) -> bytes:
+        resp = api_client.post(
+            reverse("s3_file_field:upload-initialize"),
+            {
+                "field_id": "test_app.Resource.blob",
+                "file_name": "test.txt",
+                "file_size": mb(500),
+                "content_type": "text/plain",
+                "part_url_format": part_url_format,
+            },
+            format="json",
+        )
+        assert resp.status_code == 200
+        return resp.content
+
+    # 100 parts are presigned
+    assert len(initialize("template")) < len(initialize("full")) * 0.2
+
+
+def test_full_upload_flow_resumed(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    initialization = cast(dict, resp.data)
+
+    # Only the first part is transferred before the upload is interrupted
+    part = initialization["parts"][0]
+    requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5).raise_for_status()
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-resume"),
+        {
+            "upload_signature": initialization["upload_signature"],
+            "upload_id": initialization["upload_id"],
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "transferred_parts": [{"part_number": 1, "size": mb(5), "etag": Fuzzy(r'".+"')}],
+        "parts": [
+            {"part_number": 2, "size": mb(5), "upload_url": FUZZY_URL},
+            {"part_number": 3, "size": mb(2), "upload_url": FUZZY_URL},
+        ],
+    }
+    resumption = cast(dict, resp.data)
+
+    parts = resumption["transferred_parts"]
+    for part in resumption["parts"]:
+        part_resp = requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5)
+        part_resp.raise_for_status()
+        parts.append(
+            {
+                "part_number": part["part_number"],
+                "size": part["size"],
+                "etag": part_resp.headers["ETag"],
+            }
+        )
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_id": initialization["upload_id"],
+            "parts": parts,
+            "upload_signature": initialization["upload_signature"],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert default_storage.size(initialization["object_key"]) == mb(12)
+
+    default_storage.delete(initialization["object_key"])
+
+
+def test_upload_resume_not_found(api_client: APIClient) -> None:
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt", "file_size": mb(12)}
+    )
+    resp = api_client.post(
+        reverse("s3_file_field:upload-resume"),
+        {
+            "upload_signature": upload_signature,
+            "upload_id": "fake-upload-id",
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert resp.data == "Upload not found."
+
+
+@pytest.mark.usefixtures("_signs_content_length")
+def test_prepare_batch(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize-batch"),
+        {
+            "items": [
+                {
+                    "field_id": "test_app.Resource.blob",
+                    "file_name": "test.txt",
+                    "file_size": mb(10),
+                    "content_type": "text/plain",
+                },
+                {
+                    "field_id": "bad.field.id",
+                    "file_name": "test.txt",
+                    "file_size": 10,
+                    "content_type": "text/plain",
+                },
+                {
+                    "field_id": "test_app.Resource.blob",
+                    "file_name": "test.txt",
+                    "file_size": 10,
+                    "content_type": "text/plain",
+                    "single_part_upload": True,
+                },
+            ]
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "items": [
+            {
+                "status": 200,
+                "data": {
+                    "object_key": Fuzzy(r".*/test.txt"),
+                    "upload_id": FUZZY_UPLOAD_ID,
+                    "parts": [
+                        {"part_number": 1, "size": mb(5), "upload_url": FUZZY_URL},
+                        {"part_number": 2, "size": mb(5), "upload_url": FUZZY_URL},
+                    ],
+                    "part_size": mb(5),
+                    "part_size_policy": "fixed",
+                    "upload_signature": Fuzzy(r".*:.*"),
+                },
+            },
+            {
+                "status": 400,
+                "data": {"field_id": ['Invalid field ID: "bad.field.id".']},
+            },
+            {
+                "status": 200,
+                "data": {
+                    "object_key": Fuzzy(r".*/test.txt"),
+                    "upload_id": None,
+                    "parts": [{"part_number": 1, "size": 10, "upload_url": FUZZY_URL}],
+                    "part_size": mb(5),
+                    "part_size_policy": "fixed",
+                    "upload_signature": Fuzzy(r".*:.*"),
+                },
+            },
+        ]
+    }
+
+
+@pytest.fixture()
+def _create_upload_id_fails(mocker: MockerFixture, request: pytest.FixtureRequest) -> None:
+    manager_class = type(MultipartManager.from_storage(default_storage))
+    create_upload_id = manager_class._create_upload_id
+
+    def fail_second(self: MultipartManager, object_key: str, content_type: str) -> str:
+        if object_key.endswith("/test-1.txt"):
+            raise request.param
+        return create_upload_id(self, object_key, content_type)
+
+    mocker.patch.object(manager_class, "_create_upload_id", new=fail_second)
+
+
+def _batch_items(count: int) -> list[dict]:
+    return [
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": f"test-{i}.txt",
+            "file_size": mb(10),
+            "content_type": "text/plain",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "_create_upload_id_fails",
+    [urllib3.exceptions.ProtocolError("Connection aborted.")],
+    indirect=True,
+)
+@pytest.mark.usefixtures("_create_upload_id_fails")
+def test_prepare_batch_object_store_error(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize-batch"),
+        {"items": _batch_items(3)},
+        format="json",
+    )
+    assert resp.status_code == 200
+    items = cast(dict, resp.data)["items"]
+    assert [item["status"] for item in items] == [200, 502, 200]
+    assert items[1]["data"] == "Object store request failed."
+
+
+@pytest.mark.parametrize("_create_upload_id_fails", [RuntimeError], indirect=True)
+@pytest.mark.usefixtures("_create_upload_id_fails")
+def test_prepare_batch_aborted(api_client: APIClient, mocker: MockerFixture) -> None:
+    abort_upload_id = mocker.spy(
+        type(MultipartManager.from_storage(default_storage)), "_abort_upload_id"
+    )
+
+    with pytest.raises(RuntimeError):
+        api_client.post(
+            reverse("s3_file_field:upload-initialize-batch"),
+            {"items": _batch_items(3)},
+            format="json",
+        )
+
+    # The uploads of the other items could never be completed
+    assert abort_upload_id.call_count == 2
+
+
+def test_prepare_batch_empty(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize-batch"),
+        {"items": []},
+        format="json",
+    )
+    assert resp.status_code == 400
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_finalize_batch(api_client: APIClient, mocker: MockerFixture) -> None:
+    default_storage.save("test-finalize-batch.txt", ContentFile(b"test content"))
+    upload_signatures = [
+        signing.dumps(
+            {
+                "field_id": "test_app.Resource.blob",
+                "object_key": object_key,
+                "file_size": 12,
+            }
+        )
+        for object_key in ["test-finalize-batch.txt", "does-not-exist.txt"]
+    ] + [
+        "bad-signature",
+        signing.dumps(
+            {"field_id": "test_app.Removed.blob", "object_key": "test.txt", "file_size": 12}
+        ),
+    ]
+    get_object_metadata = mocker.spy(
+        MultipartManager.from_storage(default_storage), "get_object_metadata"
+    )
+
+    resp = api_client.post(
+        reverse("s3_file_field:finalize-batch"),
+        {
+            "items": [
+                {"upload_signature": upload_signature} for upload_signature in upload_signatures
+            ]
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    items = cast(dict, resp.data)["items"]
+    assert items == [
+        {"status": 200, "data": {"field_value": Fuzzy(r".*:.*")}},
+        {"status": 400, "data": "Object not found"},
+        {"status": 400, "data": "Invalid upload signature."},
+        {"status": 400, "data": "Invalid field ID."},
+    ]
+    assert _signing.loads_field_value(items[0]["data"]["field_value"]) == {
+        "object_key": "test-finalize-batch.txt",
+        "file_size": 12,
+        "etag": Fuzzy(r"[0-9a-f]{32}"),
+        "content_type": "text/plain",
+    }
+    assert get_object_metadata.call_count == 2
+
+    default_storage.delete("test-finalize-batch.txt")
+
+
+def test_finalize_batch_internal_error(api_client: APIClient, mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        MultipartManager.from_storage(default_storage), "get_object_metadata", side_effect=KeyError
+    )
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt", "file_size": 10}
+    )
+
+    # Only a missing field is reported as an invalid field ID, not any other KeyError
+    with pytest.raises(KeyError):
+        api_client.post(
+            reverse("s3_file_field:finalize-batch"),
+            {"items": [{"upload_signature": upload_signature}]},
+            format="json",
+        )
+
+
+@pytest.mark.usefixtures("_storage_executor")
+def test_finalize_batch_concurrent(api_client: APIClient, mocker: MockerFixture) -> None:
+    def slow_get_object_metadata(object_key: str) -> ObjectMetadata:
+        time.sleep(0.05)
+        return ObjectMetadata(size=10, etag="fake-etag", content_type="text/plain")
+
+    mocker.patch.object(
+        MultipartManager.from_storage(default_storage),
+        "get_object_metadata",
+        side_effect=slow_get_object_metadata,
+    )
+    upload_signature = signing.dumps(
+        {"field_id": "test_app.Resource.blob", "object_key": "test.txt", "file_size": 10}
+    )
+
+    resp = api_client.post(
+        reverse("s3_file_field:finalize-batch"),
+        {"items": [{"upload_signature": upload_signature}] * 50},
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert [item["status"] for item in cast(dict, resp.data)["items"]] == [200] * 50
+
+    stats = storage_executor_stats()
+    assert stats.peak_active == 10
+    assert stats.completed == 50
+
+
+FUZZY_PROXY_URL = Fuzzy(r"^http://testserver/api/s3ff_test/upload-part-proxy/[^/]+:[^/]+/\d+/$")
+
+
+@pytest.fixture()
+def _upload_proxy(settings) -> None:
+    settings.S3FF_UPLOAD_PROXY = True
+
+
+@pytest.mark.usefixtures("_upload_proxy")
+def test_full_upload_flow_proxy(api_client: APIClient, mocker: MockerFixture) -> None:
+    # Proxied parts are also windowed
+    mocker.patch.object(MultipartManager, "part_url_window", new=2)
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+            # A single part upload is never proxied
+            "single_part_upload": True,
+            "part_url_format": "proxy",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    initialization = cast(dict, resp.data)
+    assert initialization["upload_id"] == FUZZY_UPLOAD_ID
+    assert initialization["parts"] == [
+        {"part_number": 1, "size": mb(5), "upload_url": FUZZY_PROXY_URL},
+        {"part_number": 2, "size": mb(5), "upload_url": FUZZY_PROXY_URL},
+    ]
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-parts"),
+        {
+            "upload_signature": initialization["upload_signature"],
+            "upload_id": initialization["upload_id"],
+            "first_part_number": 3,
+            "part_url_format": "proxy",
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    assert resp.data == {
+        "parts": [{"part_number": 3, "size": mb(2), "upload_url": FUZZY_PROXY_URL}],
+    }
+    parts = [*initialization["parts"], *cast(dict, resp.data)["parts"]]
+
+    part_etags = []
+    for part in parts:
+        part_resp = api_client.put(
+            part["upload_url"], b"a" * part["size"], content_type="application/octet-stream"
+        )
+        assert part_resp.status_code == 200
+        assert part_resp.data == {"etag": Fuzzy(r'^"[0-9a-f]{32}"$')}
+        part_etags.append(part_resp.headers["ETag"])
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-complete"),
+        {
+            "upload_id": initialization["upload_id"],
+            "part_etags": part_etags,
+            "upload_signature": initialization["upload_signature"],
+            "finalize": True,
+        },
+        format="json",
+    )
+    assert resp.status_code == 200
+    with default_storage.open(initialization["object_key"]) as stored_file:
+        assert stored_file.read() == b"a" * mb(12)
+
+    default_storage.delete(initialization["object_key"])
+
+
+@pytest.mark.usefixtures("_upload_proxy")
+def test_upload_resume_proxy(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": mb(12),
+            "content_type": "text/plain",
+        },
+        format="json",
+    )
+    initialization = cast(dict, resp.data)
+    part = initialization["parts"][0]
+    requests.put(part["upload_url"], data=b"a" * part["size"], timeout=5).raise_for_status()
+
+    resp = api_client.post(
+        reverse("s3_file_field:upload-resume"),
+        {
+            "upload_signature": initialization["upload_signature"],
+            "upload_id": initialization["upload_id"],
+            "part_url_format": "proxy",
+        },
+        format="json",
+    )
+
+    assert resp.status_code == 200
+    assert resp.data == {
+        "transferred_parts": [{"part_number": 1, "size": mb(5), "etag": Fuzzy(r'".+"')}],
+        "parts": [
+            {"part_number": 2, "size": mb(5), "upload_url": FUZZY_PROXY_URL},
+            {"part_number": 3, "size": mb(2), "upload_url": FUZZY_PROXY_URL},
+        ],
+    }
+    MultipartManager.from_storage(default_storage)._abort_upload_id(
+        initialization["object_key"], initialization["upload_id"]
+    )
+
+
+def test_prepare_proxy_disabled(api_client: APIClient) -> None:
+    resp = api_client.post(
+        reverse("s3_file_field:upload-initialize"),
+        {
+            "field_id": "test_app.Resource.blob",
+            "file_name": "test.txt",
+            "file_size": 10,
+            "content_type": "text/plain",
+            "part_url_format": "proxy",
+        },
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert resp.data == {"part_url_format": ["Upload proxying is not enabled."]}
+
+
+def _proxy_part_url(file_size: int, part_number: int = 1) -> str:
+    part_proxy_token = _signing.dumps_part_proxy_token(
+        "test_app.Resource.blob", "test.txt", "fake-upload-id", file_size, mb(5)
+    )
+    return reverse("s3_file_field:upload-part-proxy", args=[part_proxy_token, part_number])
+
+
+@pytest.mark.usefixtures("_upload_proxy")
+@pytest.mark.parametrize(
+    ("url", "body", "status", "data"),
+    [
+        (
+            reverse("s3_file_field:upload-part-proxy", args=["invalid:token", 1]),
+            b"a",
+            400,
+            "Invalid upload signature.",
+        ),
+        (_proxy_part_url(10, part_number=2), b"a", 400, "Part number is out of range."),
+        (_proxy_part_url(10), b"a", 400, "Content-Length must be the part size, 10."),
+    ],
+    ids=["invalid-token", "out-of-range", "content-length"],
+)
+def test_upload_part_proxy_invalid(
+    api_client: APIClient, url: str, body: bytes, status: int, data: str
+) -> None:
+    resp = api_client.put(url, body, content_type="application/octet-stream")
+
+    assert resp.status_code == status
+    assert resp.data == data
+
+
+def test_upload_part_proxy_disabled(api_client: APIClient) -> None:
+    resp = api_client.put(_proxy_part_url(10), b"a" * 10, content_type="application/octet-stream")
+
+    assert resp.status_code == 404
+
+
+@pytest.mark.usefixtures("_upload_proxy")
+def test_upload_part_proxy_busy(api_client: APIClient, mocker: MockerFixture) -> None:
+    semaphore = mocker.patch.object(_proxy, "get_proxy_semaphore").return_value
+    semaphore.acquire.return_value = False
+
+    resp = api_client.put(_proxy_part_url(10), b"a" * 10, content_type="application/octet-stream")
+
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+    semaphore.release.assert_not_called()
+
+
+@pytest.mark.usefixtures("_upload_proxy")
+@pytest.mark.parametrize(
+    ("storage_status", "status"), [(404, 400), (500, 502)], ids=["not-found", "storage-error"]
+)
+def test_upload_part_proxy_storage_error(
+    api_client: APIClient, mocker: MockerFixture, storage_status: int, status: int
+) -> None:
+    put_part = mocker.patch.object(_proxy, "put_part")
+    put_part.return_value.status = storage_status
+
+    resp = api_client.put(_proxy_part_url(10), b"a" * 10, content_type="application/octet-stream")
+
+    assert resp.status_code == status
+    put_part.assert_called_once()